@@ -0,0 +1,74 @@
+from typing import Any, Dict, List, Optional
+
+from kedro.io import AbstractDataSet
+
+from .expectations import (
+    MetricKey,
+    build_validation_result,
+    is_suite_supported,
+    required_metrics,
+)
+
+
+class ValidationBackend:
+    """
+    Validates suites outside of Great Expectations, by computing the metrics
+    of all supported suites of a dataset in a single pass over its data.
+    """
+
+    name = None
+
+    def can_validate(self, dataset: AbstractDataSet, df: Any) -> bool:
+        raise NotImplementedError
+
+    def compute_metrics(
+        self, dataset: AbstractDataSet, df: Any, metrics: List[MetricKey]
+    ) -> Dict[MetricKey, Any]:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """
+        Releases what the backend holds across validations, e.g. a cluster.
+        """
+
+    def validate_suites(
+        self,
+        dataset: AbstractDataSet,
+        df: Any,
+        expectation_suites: List[Any],
+        run_id: str,
+        batch_kwargs: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """
+        Validates the suites this backend fully supports, returning their
+        results by suite name. Other suites are left out.
+        """
+        supported_suites = [s for s in expectation_suites if is_suite_supported(s)]
+        if not supported_suites:
+            return {}
+
+        metrics = [("columns",), ("row_count",)]
+        for expectation_suite in supported_suites:
+            metrics += [m for m in required_metrics(expectation_suite) if m not in metrics]
+        computed = self.compute_metrics(dataset, df, metrics)
+
+        return {
+            s.expectation_suite_name: build_validation_result(
+                s, computed, run_id, batch_kwargs, self.name
+            )
+            for s in supported_suites
+        }
+
+
+def get_backend(name: Optional[str]) -> Optional[ValidationBackend]:
+    if name is None or name == "great_expectations":
+        return None
+    if name == "arrow":
+        from .arrow import ArrowBackend
+
+        return ArrowBackend()
+    if name == "dask":
+        from .dask import DaskBackend
+
+        return DaskBackend()
+    raise ValueError(f"Unknown validation backend: {name}")
@@ -0,0 +1,399 @@
+import json
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from kedro.io import AbstractDataSet
+
+from . import ValidationBackend
+from .expectations import MetricError, MetricKey, required_columns
+
+BATCH_ROWS = 1_000_000
+
+# The oldest pyarrow with the dataset readers and compute kernels used here
+MIN_PYARROW_VERSION = (5, 0)
+
+# The pandas read_csv arguments which the Arrow CSV reader can reproduce
+_ARROW_CSV_ARGS = {
+    "sep",
+    "delimiter",
+    "header",
+    "names",
+    "skiprows",
+    "dtype",
+    "encoding",
+    "quotechar",
+}
+
+# Value count tables are merged once this many have been collected
+VALUE_COUNT_MERGE_THRESHOLD = 16
+
+
+def get_arrow_format(dataset: AbstractDataSet) -> Optional[str]:
+    from kedro.extras.datasets.pandas import CSVDataSet, ParquetDataSet
+
+    if isinstance(dataset, ParquetDataSet):
+        return "parquet"
+    if isinstance(dataset, CSVDataSet):
+        return "csv"
+    if type(dataset).__name__ == "FeatherDataSet":
+        return "feather"
+    return None
+
+
+def arrow_compute_available() -> bool:
+    try:
+        import pyarrow
+    except ImportError:
+        return False
+    version = tuple(int(part) for part in pyarrow.__version__.split(".")[:2])
+    return version >= MIN_PYARROW_VERSION
+
+
+def _arrow_csv_format(dataset: AbstractDataSet, load_path: str) -> Optional[Any]:
+    """
+    Maps the pandas read_csv arguments of the dataset onto the Arrow CSV reader.
+    None when one of them has no Arrow equivalent, so pandas has to parse the file.
+    """
+    import numpy as np
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    from pyarrow import csv
+
+    from ..schema import _open
+
+    load_args = getattr(dataset, "_load_args", None) or {}
+
+    if set(load_args) - _ARROW_CSV_ARGS:
+        return None
+    delimiter = load_args.get("sep", load_args.get("delimiter", ","))
+    quote_char = load_args.get("quotechar", '"')
+    if not isinstance(delimiter, str) or len(delimiter) != 1 or len(quote_char) != 1:
+        # Regular expression separators and sniffing are pandas only
+        return None
+
+    skip_rows = load_args.get("skiprows") or 0
+    if not isinstance(skip_rows, int):
+        return None
+    header = load_args.get("header", "infer")
+    names = load_args.get("names")
+    parse_options = csv.ParseOptions(delimiter=delimiter, quote_char=quote_char)
+    encoding = load_args.get("encoding") or "utf8"
+    if names is None:
+        if header not in ("infer", 0):
+            return None
+        if skip_rows:
+            # Datasets ignore skipped rows when reading the header, so it is read here
+            with _open(dataset, load_path) as f:
+                names = csv.open_csv(
+                    f,
+                    read_options=csv.ReadOptions(skip_rows=skip_rows, encoding=encoding),
+                    parse_options=parse_options,
+                ).schema.names
+            skip_rows += 1
+    else:
+        if not all(isinstance(name, str) for name in names):
+            return None
+        names = list(names)
+        if header == 0:
+            # The names replace the header row
+            skip_rows += 1
+        elif header not in ("infer", None):
+            return None
+
+    column_types = {}
+    dtype = load_args.get("dtype")
+    if dtype is not None:
+        if not isinstance(dtype, dict):
+            return None
+        for column, column_type in dtype.items():
+            try:
+                column_types[column] = pa.from_numpy_dtype(np.dtype(column_type))
+            except (TypeError, ValueError, NotImplementedError):
+                # e.g. object or category columns
+                return None
+
+    return ds.CsvFileFormat(
+        parse_options=parse_options,
+        read_options=csv.ReadOptions(
+            skip_rows=skip_rows, column_names=names, encoding=encoding
+        ),
+        convert_options=csv.ConvertOptions(column_types=column_types),
+    )
+
+
+def _open_arrow_dataset(dataset: AbstractDataSet):
+    """
+    Opens the dataset file for streaming, or returns None if Arrow cannot
+    read it the way the dataset would.
+    """
+    import pyarrow.dataset as ds
+
+    from ..schema import _get_load_path
+
+    file_format = get_arrow_format(dataset)
+    load_path = _get_load_path(dataset)
+    if file_format == "csv":
+        file_format = _arrow_csv_format(dataset, load_path)
+        if file_format is None:
+            return None
+    elif file_format == "feather":
+        file_format = "ipc"
+
+    filesystem = None
+    fs = getattr(dataset, "_fs", None)
+    if fs is not None and getattr(dataset, "_protocol", "file") != "file":
+        from pyarrow.fs import FSSpecHandler, PyFileSystem
+
+        filesystem = PyFileSystem(FSSpecHandler(fs))
+
+    return ds.dataset(load_path, format=file_format, filesystem=filesystem)
+
+
+class _ColumnAccumulator:
+    """Merges the partial metrics of one column over record batches."""
+
+    MOMENT_METRICS = ("mean", "stdev")
+    VALUE_COUNT_METRICS = ("distinct_count", "duplicate_count")
+
+    def __init__(self, metrics: List[MetricKey]):
+        self.metrics = metrics
+        self.values: Dict[MetricKey, Any] = {}
+        self._moments = None
+        self._value_counts = []
+
+    def update(self, array: Any) -> None:
+        kinds = {metric[0] for metric in self.metrics}
+        shared_updates = []
+        if kinds.intersection(self.MOMENT_METRICS):
+            shared_updates.append((self.MOMENT_METRICS, self._update_moments))
+        if kinds.intersection(self.VALUE_COUNT_METRICS):
+            shared_updates.append((self.VALUE_COUNT_METRICS, self._update_value_counts))
+
+        for shared_kinds, update in shared_updates:
+            try:
+                update(array)
+            except Exception as e:  # pylint: disable=broad-except
+                for metric in self.metrics:
+                    if metric[0] in shared_kinds:
+                        self.values[metric] = MetricError(f"{type(e).__name__}: {e}")
+
+        for metric in self.metrics:
+            if metric[0] in self.MOMENT_METRICS + self.VALUE_COUNT_METRICS:
+                continue
+            if isinstance(self.values.get(metric), MetricError):
+                continue
+            try:
+                self._update_metric(metric, array)
+            except Exception as e:  # pylint: disable=broad-except
+                self.values[metric] = MetricError(f"{type(e).__name__}: {e}")
+
+    def _update_metric(self, metric: MetricKey, array: Any) -> None:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        kind = metric[0]
+        previous = self.values.get(metric)
+        if kind == "null_count":
+            self.values[metric] = (previous or 0) + array.null_count
+        elif kind in ("min", "max"):
+            value = pc.min_max(array)[kind].as_py()
+            if value is not None and previous is not None:
+                value = min(value, previous) if kind == "min" else max(value, previous)
+            self.values[metric] = previous if value is None else value
+        elif kind == "sum":
+            self.values[metric] = (previous or 0) + (pc.sum(array).as_py() or 0)
+        elif kind == "out_of_range_count":
+            _, _, min_value, max_value, strict_min, strict_max = metric
+            masks = []
+            if min_value is not None:
+                below = pc.less_equal if strict_min else pc.less
+                masks.append(below(array, min_value))
+            if max_value is not None:
+                above = pc.greater_equal if strict_max else pc.greater
+                masks.append(above(array, max_value))
+            count = 0
+            if masks:
+                mask = masks[0] if len(masks) == 1 else pc.or_(masks[0], masks[1])
+                count = self._count_true(mask)
+            self.values[metric] = (previous or 0) + count
+        elif kind in ("not_in_set_count", "in_set_count"):
+            value_set = json.loads(metric[2])
+            try:
+                value_set = pa.array(value_set, type=array.type)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                value_set = pa.array(value_set)
+            is_in = pc.is_in(array, value_set=value_set)
+            if kind == "not_in_set_count":
+                is_in = pc.invert(is_in)
+            mask = pc.and_(is_in, pc.is_valid(array))
+            self.values[metric] = (previous or 0) + self._count_true(mask)
+        else:
+            raise ValueError(f"Unknown metric: {kind}")
+
+    @staticmethod
+    def _count_true(mask: Any) -> int:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        return pc.sum(pc.cast(mask, pa.int64())).as_py() or 0
+
+    def _update_moments(self, array: Any) -> None:
+        import pyarrow.compute as pc
+
+        count = pc.count(array).as_py()
+        if not count:
+            return
+        mean = pc.mean(array).as_py()
+        m2 = pc.variance(array, ddof=0).as_py() * count
+        if self._moments is not None:
+            prior_count, prior_mean, prior_m2 = self._moments
+            total = prior_count + count
+            delta = mean - prior_mean
+            mean = prior_mean + delta * count / total
+            m2 = prior_m2 + m2 + delta ** 2 * prior_count * count / total
+            count = total
+        self._moments = (count, mean, m2)
+
+    def _update_value_counts(self, array: Any) -> None:
+        import pyarrow as pa
+
+        counts = array.drop_null().value_counts()
+        self._value_counts.append(
+            pa.table({"values": counts.field(0), "counts": counts.field(1)})
+        )
+        if len(self._value_counts) >= VALUE_COUNT_MERGE_THRESHOLD:
+            self._value_counts = [self._merged_value_counts()]
+
+    def _merged_value_counts(self) -> Any:
+        import pyarrow as pa
+
+        merged = pa.concat_tables(self._value_counts)
+        merged = merged.group_by("values").aggregate([("counts", "sum")])
+        return pa.table(
+            {"values": merged.column("values"), "counts": merged.column("counts_sum")}
+        )
+
+    def finish(self) -> Dict[MetricKey, Any]:
+        import pyarrow.compute as pc
+
+        for metric in self.metrics:
+            kind = metric[0]
+            if isinstance(self.values.get(metric), MetricError):
+                continue
+            if kind in self.MOMENT_METRICS:
+                if self._moments is None:
+                    self.values[metric] = None
+                    continue
+                count, mean, m2 = self._moments
+                if kind == "mean":
+                    self.values[metric] = mean
+                else:
+                    self.values[metric] = (m2 / (count - 1)) ** 0.5 if count > 1 else None
+            elif kind in self.VALUE_COUNT_METRICS:
+                if not self._value_counts:
+                    self.values[metric] = 0
+                    continue
+                merged = self._merged_value_counts()
+                if kind == "distinct_count":
+                    self.values[metric] = merged.num_rows
+                else:
+                    counts = merged.column("counts")
+                    self.values[metric] = (
+                        pc.sum(pc.filter(counts, pc.greater(counts, 1))).as_py() or 0
+                    )
+        return self.values
+
+
+class ArrowBackend(ValidationBackend):
+    """
+    Computes metrics with pyarrow compute kernels, streaming record batches
+    from parquet, feather or CSV files, with columns processed in parallel
+    threads. In-memory pandas frames are converted to Arrow first.
+    """
+
+    name = "arrow"
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers or os.cpu_count()
+        self.available = arrow_compute_available()
+        if not self.available:
+            logging.getLogger("KedroGreat").warning(
+                "The arrow backend requires pyarrow>="
+                + ".".join(str(part) for part in MIN_PYARROW_VERSION)
+                + ", validating with Great Expectations instead"
+            )
+
+    def can_validate(self, dataset: AbstractDataSet, df: Any) -> bool:
+        if not self.available:
+            return False
+        if df is None:
+            return get_arrow_format(dataset) is not None
+        import pandas as pd
+
+        return isinstance(df, pd.DataFrame)
+
+    def _record_batches(self, dataset: AbstractDataSet, df: Any, columns: List[str]):
+        arrow_dataset = _open_arrow_dataset(dataset) if df is None else None
+        if df is None and arrow_dataset is None:
+            # Load arguments only pandas understands
+            df = dataset.load()
+        if df is not None:
+            import pyarrow as pa
+
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            available = [c for c in columns if c in table.column_names]
+            return table.column_names, table.select(available).to_batches(BATCH_ROWS)
+
+        column_names = arrow_dataset.schema.names
+        available = [c for c in columns if c in column_names]
+        return column_names, arrow_dataset.to_batches(
+            columns=available, batch_size=BATCH_ROWS, use_threads=True
+        )
+
+    def compute_metrics(
+        self, dataset: AbstractDataSet, df: Any, metrics: List[MetricKey]
+    ) -> Dict[MetricKey, Any]:
+        column_metrics: Dict[str, List[MetricKey]] = {}
+        for metric in metrics:
+            if len(metric) > 1:
+                column_metrics.setdefault(metric[1], []).append(metric)
+
+        column_names, batches = self._record_batches(
+            dataset, df, required_columns(metrics)
+        )
+        accumulators = {
+            column: _ColumnAccumulator(column_metric_keys)
+            for column, column_metric_keys in column_metrics.items()
+            if column in column_names
+        }
+
+        row_count = 0
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for batch in batches:
+                row_count += batch.num_rows
+                list(
+                    executor.map(
+                        lambda item: item[1].update(
+                            batch.column(batch.schema.get_field_index(item[0]))
+                        ),
+                        accumulators.items(),
+                    )
+                )
+
+        computed: Dict[MetricKey, Any] = {
+            ("columns",): list(column_names),
+            ("row_count",): row_count,
+        }
+        for column, column_metric_keys in column_metrics.items():
+            if column in accumulators:
+                computed.update(accumulators[column].finish())
+            else:
+                computed.update(
+                    {
+                        m: MetricError(f"Column {column} does not exist")
+                        for m in column_metric_keys
+                    }
+                )
+        return computed
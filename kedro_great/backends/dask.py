@@ -0,0 +1,139 @@
+import json
+import threading
+from typing import Any, Dict, List, Optional
+
+from kedro.io import AbstractDataSet
+
+from . import ValidationBackend
+from .expectations import MetricError, MetricKey
+
+
+def is_dask_dataset(dataset: AbstractDataSet) -> bool:
+    return type(dataset).__module__.startswith("kedro.extras.datasets.dask")
+
+
+def is_dask_frame(df: Any) -> bool:
+    return type(df).__module__.startswith("dask.")
+
+
+def _to_python(value: Any) -> Any:
+    return value.item() if hasattr(value, "item") else value
+
+
+class DaskBackend(ValidationBackend):
+    """
+    Builds every metric of a dataset as a lazy dask expression, and computes
+    them together as one task graph, so a single scan of the partitions
+    answers all suites in parallel across local cores.
+
+    Runs on a local distributed cluster when `distributed` is installed,
+    and on the threaded scheduler otherwise. The cluster is private to the
+    backend, the pipeline's own dask computations never run on it.
+    """
+
+    name = "dask"
+
+    def __init__(self, n_workers: Optional[int] = None):
+        self.n_workers = n_workers
+        self._client = None
+        self._cluster = None
+        self._lock = threading.Lock()
+
+    def _get_client(self) -> Any:
+        with self._lock:
+            if self._client is None:
+                try:
+                    from distributed import Client, LocalCluster
+                except ImportError:
+                    return None
+                self._cluster = LocalCluster(n_workers=self.n_workers, processes=False)
+                self._client = Client(self._cluster, set_as_default=False)
+            return self._client
+
+    def close(self) -> None:
+        with self._lock:
+            if self._client is not None:
+                self._client.close()
+                self._cluster.close()
+                self._client = None
+                self._cluster = None
+
+    def can_validate(self, dataset: AbstractDataSet, df: Any) -> bool:
+        if df is None:
+            return is_dask_dataset(dataset)
+        return is_dask_frame(df)
+
+    @staticmethod
+    def _lazy_metric(ddf: Any, metric: MetricKey) -> Any:
+        kind = metric[0]
+        if kind == "row_count":
+            return ddf.index.size
+
+        column = ddf[metric[1]]
+        if kind == "null_count":
+            return column.isnull().sum()
+        if kind == "min":
+            return column.min()
+        if kind == "max":
+            return column.max()
+        if kind == "sum":
+            return column.sum()
+        if kind == "mean":
+            return column.mean()
+        if kind == "stdev":
+            return column.std(ddof=1)
+        if kind == "distinct_count":
+            return column.nunique()
+        if kind == "duplicate_count":
+            value_counts = column.value_counts()
+            return value_counts[value_counts > 1].sum()
+        if kind == "out_of_range_count":
+            _, _, min_value, max_value, strict_min, strict_max = metric
+            masks = []
+            if min_value is not None:
+                masks.append((column <= min_value) if strict_min else (column < min_value))
+            if max_value is not None:
+                masks.append((column >= max_value) if strict_max else (column > max_value))
+            if not masks:
+                import dask
+
+                return dask.delayed(0)
+            mask = masks[0] if len(masks) == 1 else masks[0] | masks[1]
+            # Comparisons with nulls are False, so nulls are never counted
+            return mask.sum()
+        if kind in ("not_in_set_count", "in_set_count"):
+            is_in = column.isin(json.loads(metric[2]))
+            if kind == "not_in_set_count":
+                is_in = ~is_in
+            return (is_in & column.notnull()).sum()
+        raise ValueError(f"Unknown metric: {kind}")
+
+    def compute_metrics(
+        self, dataset: AbstractDataSet, df: Any, metrics: List[MetricKey]
+    ) -> Dict[MetricKey, Any]:
+        import dask
+
+        ddf = df if df is not None else dataset.load()
+        computed: Dict[MetricKey, Any] = {("columns",): list(ddf.columns)}
+
+        lazy_metrics = {}
+        for metric in metrics:
+            if metric == ("columns",):
+                continue
+            if len(metric) > 1 and metric[1] not in ddf.columns:
+                computed[metric] = MetricError(f"Column {metric[1]} does not exist")
+                continue
+            try:
+                lazy_metrics[metric] = self._lazy_metric(ddf, metric)
+            except Exception as e:  # pylint: disable=broad-except
+                computed[metric] = MetricError(f"{type(e).__name__}: {e}")
+
+        client = self._get_client()
+        if client is not None:
+            values = client.compute(list(lazy_metrics.values()), sync=True)
+        else:
+            values = dask.compute(*lazy_metrics.values(), scheduler="threads")
+
+        for metric, value in zip(lazy_metrics, values):
+            computed[metric] = _to_python(value)
+        return computed
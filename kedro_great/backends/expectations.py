@@ -0,0 +1,315 @@
+"""
+Backend independent evaluation of expectations from aggregate metrics.
+
+Each supported expectation declares the metrics it needs, as hashable keys.
+A backend computes all metrics of a suite in one pass over the data, and the
+expectations are then evaluated from those metrics alone.
+"""
+import json
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Tuple
+
+from ..results import build_suite_validation_result
+
+MetricKey = Tuple
+
+
+class MetricError(NamedTuple):
+    message: str
+
+
+def _json_key(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, default=str)
+
+
+def _between(value, min_value, max_value, strict_min=False, strict_max=False) -> bool:
+    if value is None:
+        return False
+    if min_value is not None:
+        if value < min_value or (strict_min and value == min_value):
+            return False
+    if max_value is not None:
+        if value > max_value or (strict_max and value == max_value):
+            return False
+    return True
+
+
+def _map_result(
+    metrics: Dict[MetricKey, Any], column: str, unexpected_key: MetricKey, mostly: float
+) -> Tuple[bool, Dict[str, Any]]:
+    row_count = metrics[("row_count",)]
+    null_count = metrics[("null_count", column)]
+    unexpected_count = metrics[unexpected_key]
+    nonnull_count = row_count - null_count
+    unexpected_percent = 100.0 * unexpected_count / nonnull_count if nonnull_count else 0.0
+    return (
+        unexpected_percent <= 100.0 * (1 - mostly),
+        {
+            "element_count": row_count,
+            "missing_count": null_count,
+            "missing_percent": 100.0 * null_count / row_count if row_count else None,
+            "unexpected_count": unexpected_count,
+            "unexpected_percent": unexpected_percent,
+            "unexpected_percent_nonmissing": unexpected_percent,
+        },
+    )
+
+
+def _range_kwargs(kwargs: Dict[str, Any]) -> Tuple:
+    return (
+        kwargs.get("min_value"),
+        kwargs.get("max_value"),
+        bool(kwargs.get("strict_min", False)),
+        bool(kwargs.get("strict_max", False)),
+    )
+
+
+class ExpectationSpec(NamedTuple):
+    kwargs: Tuple[str, ...]
+    metrics: Callable[[Dict[str, Any]], List[MetricKey]]
+    evaluate: Callable[[Dict[str, Any], Dict[MetricKey, Any]], Tuple[bool, Dict[str, Any]]]
+
+
+def _aggregate_spec(metric: str) -> ExpectationSpec:
+    return ExpectationSpec(
+        kwargs=("column", "min_value", "max_value", "strict_min", "strict_max"),
+        metrics=lambda kw: [(metric, kw["column"])],
+        evaluate=lambda kw, m: (
+            _between(m[(metric, kw["column"])], *_range_kwargs(kw)),
+            {"observed_value": m[(metric, kw["column"])]},
+        ),
+    )
+
+
+EXPECTATION_SPECS: Dict[str, ExpectationSpec] = {
+    "expect_column_to_exist": ExpectationSpec(
+        kwargs=("column", "column_index"),
+        metrics=lambda kw: [("columns",)],
+        evaluate=lambda kw, m: (
+            kw["column"] in m[("columns",)]
+            and (
+                kw.get("column_index") is None
+                or m[("columns",)].index(kw["column"]) == kw["column_index"]
+            ),
+            {},
+        ),
+    ),
+    "expect_table_columns_to_match_ordered_list": ExpectationSpec(
+        kwargs=("column_list",),
+        metrics=lambda kw: [("columns",)],
+        evaluate=lambda kw, m: (
+            list(m[("columns",)]) == list(kw["column_list"]),
+            {"observed_value": list(m[("columns",)])},
+        ),
+    ),
+    "expect_table_columns_to_match_set": ExpectationSpec(
+        kwargs=("column_set", "exact_match"),
+        metrics=lambda kw: [("columns",)],
+        evaluate=lambda kw, m: (
+            set(m[("columns",)]) == set(kw["column_set"])
+            if kw.get("exact_match", True)
+            else set(kw["column_set"]).issubset(m[("columns",)]),
+            {"observed_value": list(m[("columns",)])},
+        ),
+    ),
+    "expect_table_column_count_to_equal": ExpectationSpec(
+        kwargs=("value",),
+        metrics=lambda kw: [("columns",)],
+        evaluate=lambda kw, m: (
+            len(m[("columns",)]) == kw["value"],
+            {"observed_value": len(m[("columns",)])},
+        ),
+    ),
+    "expect_table_row_count_to_be_between": ExpectationSpec(
+        kwargs=("min_value", "max_value", "strict_min", "strict_max"),
+        metrics=lambda kw: [("row_count",)],
+        evaluate=lambda kw, m: (
+            _between(m[("row_count",)], *_range_kwargs(kw)),
+            {"observed_value": m[("row_count",)]},
+        ),
+    ),
+    "expect_table_row_count_to_equal": ExpectationSpec(
+        kwargs=("value",),
+        metrics=lambda kw: [("row_count",)],
+        evaluate=lambda kw, m: (
+            m[("row_count",)] == kw["value"],
+            {"observed_value": m[("row_count",)]},
+        ),
+    ),
+    "expect_column_values_to_not_be_null": ExpectationSpec(
+        kwargs=("column", "mostly"),
+        metrics=lambda kw: [("row_count",), ("null_count", kw["column"])],
+        evaluate=lambda kw, m: (
+            m[("null_count", kw["column"])]
+            <= (1 - kw.get("mostly", 1)) * m[("row_count",)],
+            {
+                "element_count": m[("row_count",)],
+                "unexpected_count": m[("null_count", kw["column"])],
+                "unexpected_percent": 100.0
+                * m[("null_count", kw["column"])]
+                / m[("row_count",)]
+                if m[("row_count",)]
+                else 0.0,
+            },
+        ),
+    ),
+    "expect_column_values_to_be_null": ExpectationSpec(
+        kwargs=("column", "mostly"),
+        metrics=lambda kw: [("row_count",), ("null_count", kw["column"])],
+        evaluate=lambda kw, m: (
+            m[("row_count",)] - m[("null_count", kw["column"])]
+            <= (1 - kw.get("mostly", 1)) * m[("row_count",)],
+            {
+                "element_count": m[("row_count",)],
+                "unexpected_count": m[("row_count",)] - m[("null_count", kw["column"])],
+            },
+        ),
+    ),
+    "expect_column_values_to_be_between": ExpectationSpec(
+        kwargs=("column", "min_value", "max_value", "strict_min", "strict_max", "mostly"),
+        metrics=lambda kw: [
+            ("row_count",),
+            ("null_count", kw["column"]),
+            ("out_of_range_count", kw["column"], *_range_kwargs(kw)),
+        ],
+        evaluate=lambda kw, m: _map_result(
+            m,
+            kw["column"],
+            ("out_of_range_count", kw["column"], *_range_kwargs(kw)),
+            kw.get("mostly", 1),
+        ),
+    ),
+    "expect_column_values_to_be_in_set": ExpectationSpec(
+        kwargs=("column", "value_set", "mostly"),
+        metrics=lambda kw: [
+            ("row_count",),
+            ("null_count", kw["column"]),
+            ("not_in_set_count", kw["column"], _json_key(kw["value_set"])),
+        ],
+        evaluate=lambda kw, m: _map_result(
+            m,
+            kw["column"],
+            ("not_in_set_count", kw["column"], _json_key(kw["value_set"])),
+            kw.get("mostly", 1),
+        ),
+    ),
+    "expect_column_values_to_not_be_in_set": ExpectationSpec(
+        kwargs=("column", "value_set", "mostly"),
+        metrics=lambda kw: [
+            ("row_count",),
+            ("null_count", kw["column"]),
+            ("in_set_count", kw["column"], _json_key(kw["value_set"])),
+        ],
+        evaluate=lambda kw, m: _map_result(
+            m,
+            kw["column"],
+            ("in_set_count", kw["column"], _json_key(kw["value_set"])),
+            kw.get("mostly", 1),
+        ),
+    ),
+    "expect_column_values_to_be_unique": ExpectationSpec(
+        kwargs=("column", "mostly"),
+        metrics=lambda kw: [
+            ("row_count",),
+            ("null_count", kw["column"]),
+            ("duplicate_count", kw["column"]),
+        ],
+        evaluate=lambda kw, m: _map_result(
+            m, kw["column"], ("duplicate_count", kw["column"]), kw.get("mostly", 1)
+        ),
+    ),
+    "expect_column_unique_value_count_to_be_between": _aggregate_spec("distinct_count"),
+    "expect_column_min_to_be_between": _aggregate_spec("min"),
+    "expect_column_max_to_be_between": _aggregate_spec("max"),
+    "expect_column_mean_to_be_between": _aggregate_spec("mean"),
+    "expect_column_sum_to_be_between": _aggregate_spec("sum"),
+    "expect_column_stdev_to_be_between": _aggregate_spec("stdev"),
+}
+
+# Kwargs which never change what is computed
+_NEUTRAL_KWARGS = {"result_format", "include_config", "catch_exceptions", "meta"}
+
+
+def is_supported(expectation_type: str, kwargs: Dict[str, Any]) -> bool:
+    spec = EXPECTATION_SPECS.get(expectation_type)
+    if spec is None:
+        return False
+    unsupported = set(kwargs) - set(spec.kwargs) - _NEUTRAL_KWARGS
+    return not unsupported and not any(isinstance(v, dict) for v in kwargs.values())
+
+
+def is_suite_supported(expectation_suite: Any) -> bool:
+    return all(
+        is_supported(e.expectation_type, e.kwargs) for e in expectation_suite.expectations
+    )
+
+
+def required_metrics(expectation_suite: Any) -> List[MetricKey]:
+    metrics = []
+    for e in expectation_suite.expectations:
+        for metric in EXPECTATION_SPECS[e.expectation_type].metrics(e.kwargs):
+            if metric not in metrics:
+                metrics.append(metric)
+    return metrics
+
+
+def required_columns(metrics: Iterable[MetricKey]) -> List[str]:
+    columns = []
+    for metric in metrics:
+        if len(metric) > 1 and metric[1] not in columns:
+            columns.append(metric[1])
+    return columns
+
+
+def build_validation_result(
+    expectation_suite: Any,
+    metrics: Dict[MetricKey, Any],
+    run_id: str,
+    batch_kwargs: Dict[str, Any],
+    backend: str,
+) -> Any:
+    """
+    Evaluates the suite from computed metrics, shaped like the results of
+    Great Expectations' own validation.
+    """
+    from great_expectations.core import ExpectationValidationResult
+
+    results = []
+    for e in expectation_suite.expectations:
+        spec = EXPECTATION_SPECS[e.expectation_type]
+        exception_info = {
+            "raised_exception": False,
+            "exception_message": None,
+            "exception_traceback": None,
+        }
+        missing_column = (
+            "column" in e.kwargs
+            and ("columns",) not in spec.metrics(e.kwargs)
+            and e.kwargs["column"] not in metrics[("columns",)]
+        )
+        errors = [
+            metrics[key]
+            for key in spec.metrics(e.kwargs)
+            if isinstance(metrics.get(key), MetricError)
+        ]
+        if missing_column or errors:
+            message = (
+                f"Column {e.kwargs['column']} does not exist"
+                if missing_column
+                else errors[0].message
+            )
+            success, result = False, {}
+            exception_info.update(raised_exception=True, exception_message=message)
+        else:
+            success, result = spec.evaluate(e.kwargs, metrics)
+        results.append(
+            ExpectationValidationResult(
+                success=bool(success),
+                result=result,
+                expectation_config=e,
+                exception_info=exception_info,
+            )
+        )
+
+    return build_suite_validation_result(
+        expectation_suite, results, run_id, batch_kwargs, {"backend": backend}
+    )
@@ -0,0 +1,110 @@
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
+
+
+class ValidationBudget(NamedTuple):
+    max_seconds: Optional[float] = None
+    max_rows: Optional[int] = None
+    max_memory: Optional[int] = None
+
+
+class SkippedSuite(NamedTuple):
+    suite: str
+    dataset: str
+    reason: str
+
+
+class SampledSuite(NamedTuple):
+    suite: str
+    dataset: str
+    rows: int
+
+
+def resolve_budget(
+    budgets: Dict[str, Union[ValidationBudget, Dict[str, Any]]],
+    dataset_name: str,
+    suite_name: str,
+) -> ValidationBudget:
+    """
+    A suite budget overrides the fields of its dataset budget.
+    """
+    resolved = {}
+    for key in (dataset_name, suite_name):
+        budget = budgets.get(key)
+        if budget is None:
+            continue
+        if isinstance(budget, dict):
+            budget = ValidationBudget(**budget)
+        resolved.update(
+            {field: value for field, value in budget._asdict().items() if value is not None}
+        )
+    return ValidationBudget(**resolved)
+
+
+def get_suite_priority(
+    priorities: Dict[Optional[str], int], suite_name: str, default: int
+) -> int:
+    if suite_name in priorities:
+        return priorities[suite_name]
+    suite_type = suite_name.rsplit(".", 1)[1] if "." in suite_name else None
+    return priorities.get(suite_type, default)
+
+
+def order_suites_by_priority(
+    priorities: Dict[Optional[str], int], suite_names: List[str]
+) -> List[str]:
+    default = max(priorities.values(), default=0) + 1
+    return sorted(
+        suite_names, key=lambda name: (get_suite_priority(priorities, name, default), name)
+    )
+
+
+def _is_spark_frame(df: Any) -> bool:
+    return type(df).__module__.startswith("pyspark")
+
+
+def count_rows(df: Any) -> int:
+    if _is_spark_frame(df):
+        return df.count()
+    return len(df)
+
+
+def estimate_memory(df: Any) -> Optional[int]:
+    memory_usage = getattr(df, "memory_usage", None)
+    if memory_usage is None:
+        return None
+    return int(memory_usage(deep=True).sum())
+
+
+def sample_frame(df: Any, rows: int, total_rows: int, seed: int = 0) -> Any:
+    if rows >= total_rows:
+        return df
+    if _is_spark_frame(df):
+        return df.sample(fraction=rows / total_rows, seed=seed)
+    return df.sample(n=rows, random_state=seed)
+
+
+def fit_rows_to_budget(
+    df: Any, budget: ValidationBudget, frame_memory: Optional[int] = None
+) -> Optional[Tuple[int, int]]:
+    """
+    Returns the number of rows that fits within the budget along with the total
+    number of rows, or None if the whole frame fits.
+    """
+    if budget.max_rows is None and budget.max_memory is None:
+        return None
+
+    total_rows = count_rows(df)
+    allowed_rows = total_rows
+    if budget.max_rows is not None:
+        allowed_rows = min(allowed_rows, budget.max_rows)
+    if budget.max_memory is not None and total_rows > 0:
+        if frame_memory is None:
+            frame_memory = estimate_memory(df)
+        if frame_memory is not None and frame_memory > budget.max_memory:
+            allowed_rows = min(
+                allowed_rows, int(total_rows * budget.max_memory / frame_memory)
+            )
+
+    if allowed_rows >= total_rows:
+        return None
+    return max(allowed_rows, 1), total_rows
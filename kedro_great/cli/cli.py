@@ -14,10 +14,16 @@ def great():
 from .init import init
 from .suite import suite_new
 from .datasource import datasource_new
+from .serve import serve
+from .validate import validate
+from .replay import replay
 
 great.add_command(init)
 great.add_command(suite_new)
 great.add_command(datasource_new)
+great.add_command(serve)
+great.add_command(validate)
+great.add_command(replay)
 
 
 def main():
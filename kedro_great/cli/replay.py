@@ -0,0 +1,163 @@
+import datetime
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import click
+import pandas as pd
+from great_expectations.cli import toolkit
+from great_expectations.cli.util import cli_message
+from kedro.framework.context import load_context
+
+from ..kedro_great import KedroGreat, get_recordings_directory
+from ..recording import RecordedValidation, file_fingerprint, load_recording
+
+SuiteKey = Tuple[str, str]
+
+
+def _fastest_timings(
+    validations: List[RecordedValidation],
+) -> Dict[SuiteKey, Tuple[float, Optional[int]]]:
+    timings = {}
+    for validation in validations:
+        for suite_name, seconds in validation.seconds.items():
+            key = (validation.dataset, suite_name)
+            if key not in timings or seconds < timings[key][0]:
+                timings[key] = (seconds, validation.get_suite_rows(suite_name))
+    return timings
+
+
+def compare_timings(
+    recorded: List[RecordedValidation], replayed: List[RecordedValidation]
+) -> List[Dict]:
+    """
+    Compares the fastest replayed time of each suite to its recorded time.
+    When the replay ran on fewer rows, e.g. on the recorded sample,
+    the recorded time is scaled to the replayed rows first.
+    """
+    recorded_timings = _fastest_timings(recorded)
+    replayed_timings = _fastest_timings(replayed)
+    comparisons = []
+    for key, (recorded_seconds, recorded_rows) in recorded_timings.items():
+        if key not in replayed_timings:
+            continue
+        replayed_seconds, replayed_rows = replayed_timings[key]
+        expected_seconds = recorded_seconds
+        if recorded_rows and replayed_rows is not None:
+            expected_seconds = recorded_seconds * replayed_rows / recorded_rows
+        comparisons.append(
+            {
+                "dataset": key[0],
+                "suite": key[1],
+                "recorded_seconds": recorded_seconds,
+                "recorded_rows": recorded_rows,
+                "replayed_seconds": replayed_seconds,
+                "replayed_rows": replayed_rows,
+                "delta": (replayed_seconds - expected_seconds) / expected_seconds
+                if expected_seconds
+                else None,
+            }
+        )
+    return comparisons
+
+
+@click.command(name="replay")
+@click.argument("run_id")
+@click.option("--env", "-e", default=None, help="The kedro configuration environment.")
+@click.option(
+    "--from-catalog",
+    is_flag=True,
+    help="Validate the datasets loaded from the catalog, instead of the recorded samples.",
+)
+@click.option(
+    "--repeat", default=1, type=int, help="Replay this many times, keeping the fastest."
+)
+@click.option("--json", "json_path", default=None, help="Write the timings to this path.")
+def replay(run_id, env, from_catalog, repeat, json_path):
+    """
+    Replay the validations recorded for a run, with the same hook options,
+    and compare their timings to the recorded ones.
+
+    Runs are recorded by the KedroGreat hook when `record_runs` is enabled.
+    """
+    kedro_context = load_context(Path.cwd(), env=env)
+    ge_context = toolkit.load_data_context_with_error_handling(None)
+    recordings_directory = get_recordings_directory(ge_context)
+    run_directory = os.path.join(recordings_directory, run_id)
+    if not os.path.isdir(run_directory):
+        cli_message(f"<red>No recording found for run {run_id}.</red>")
+        sys.exit(1)
+
+    options, recorded = load_recording(run_directory)
+    replay_run_id = "{}-replay-{}".format(
+        run_id,
+        datetime.datetime.now(datetime.timezone.utc).strftime("%Y%m%dT%H%M%S.%fZ"),
+    )
+    # The replay is recorded like any other run, to read its timings back.
+    # Loading is not timed, so the parquet copies would only make the repeats differ.
+    options.update(record_runs=True, record_sample_rows=0, conversion_cache=False)
+
+    catalog = kedro_context.catalog
+    for _ in range(repeat):
+        # A new hook for each repeat, so none of them runs with the suites,
+        # plans and expectation results cached by the previous one
+        kedro_great = KedroGreat(**options)
+        if kedro_great.expectation_context is None:
+            sys.exit(1)
+        for validation in recorded:
+            if from_catalog:
+                dataset = catalog._get_dataset(validation.dataset)
+                if validation.fingerprint is not None and validation.fingerprint != (
+                    file_fingerprint(validation.dataset_path)
+                ):
+                    cli_message(
+                        f"<yellow>{validation.dataset} has changed since it was recorded.</yellow>"
+                    )
+                df = kedro_great.load_dataset(dataset)
+            elif validation.sample is not None:
+                df = pd.read_parquet(
+                    os.path.join(run_directory, "samples", validation.sample)
+                )
+            else:
+                cli_message(
+                    f"<yellow>{validation.dataset} has no recorded sample, "
+                    f"replay it with --from-catalog.</yellow>"
+                )
+                continue
+
+            kedro_great.run_suites(
+                validation.dataset,
+                validation.dataset_path,
+                df,
+                validation.suites,
+                replay_run_id,
+                stop_on_failure=options.get("fail_fast", False),
+            )
+
+    replay_directory = os.path.join(recordings_directory, replay_run_id)
+    if not os.path.isdir(replay_directory):
+        cli_message("<yellow>Nothing was replayed.</yellow>")
+        sys.exit(1)
+    _, replayed = load_recording(replay_directory)
+
+    comparisons = compare_timings(recorded, replayed)
+    for comparison in comparisons:
+        delta = comparison["delta"]
+        color = "red" if delta is not None and delta > 0 else "green"
+        cli_message(
+            f"{comparison['dataset']}: {comparison['suite']} "
+            f"recorded {comparison['recorded_seconds']:.3f}s "
+            f"({comparison['recorded_rows']} rows), "
+            f"replayed {comparison['replayed_seconds']:.3f}s "
+            f"({comparison['replayed_rows']} rows)"
+            + (f" <{color}>{delta:+.0%}</{color}>" if delta is not None else "")
+        )
+    if json_path:
+        with open(json_path, "w") as f:
+            json.dump(
+                {"run_id": run_id, "replay_run_id": replay_run_id, "suites": comparisons},
+                f,
+                indent=2,
+            )
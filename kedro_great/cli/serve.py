@@ -0,0 +1,74 @@
+import sys
+from pathlib import Path
+
+import click
+from great_expectations.cli import toolkit
+from great_expectations.cli.util import cli_message
+from kedro.framework.context import load_context
+
+from ..daemon import DEFAULT_WORKERS, ValidationDaemon
+from ..kedro_great import get_daemon_socket_path
+from .validate import find_kedro_great_hook
+
+
+def _warm_spark_session(catalog) -> None:
+    from kedro.extras.datasets.spark import SparkDataSet
+
+    for dataset_name in catalog.list():
+        if isinstance(catalog._get_dataset(dataset_name), SparkDataSet):
+            SparkDataSet._get_spark()
+            return
+
+
+@click.command(name="serve")
+@click.option(
+    "--directory",
+    "-d",
+    default=None,
+    help="The project's great_expectations directory.",
+)
+@click.option(
+    "--socket",
+    "socket_path",
+    default=None,
+    help="The Unix socket to listen on. Defaults to great_expectations/uncommitted/kedro_great/daemon.sock",
+)
+@click.option("--env", "-e", default=None, help="The kedro configuration environment.")
+@click.option(
+    "--workers",
+    default=DEFAULT_WORKERS,
+    type=int,
+    help="The number of validations run at the same time.",
+)
+def serve(directory, socket_path, env, workers):
+    """
+    Run a validation daemon that keeps the Great Expectations context,
+    the parsed suites and any Spark session warm between pipeline runs.
+
+    Use it from the hook with `KedroGreat(use_daemon=True)`.
+    """
+    ge_context = toolkit.load_data_context_with_error_handling(directory)
+    kedro_context = load_context(Path.cwd(), env=env)
+    catalog = kedro_context.catalog
+
+    if socket_path is None:
+        socket_path = get_daemon_socket_path(ge_context)
+
+    _warm_spark_session(catalog)
+    # Validates with the options of the project's hook, on the chosen
+    # Great Expectations directory, and never forwards to a daemon itself
+    kedro_great = find_kedro_great_hook(kedro_context).with_options(
+        context_root_dir=ge_context.root_directory,
+        cache_suites=True,
+        use_daemon=False,
+        daemon_socket=None,
+    )
+    if kedro_great.expectation_context is None:
+        sys.exit(1)
+
+    with ValidationDaemon(socket_path, catalog, kedro_great, workers) as daemon:
+        cli_message(f"Kedro Great daemon listening on <green>{socket_path}</green>")
+        try:
+            daemon.serve_forever()
+        except KeyboardInterrupt:
+            cli_message("Kedro Great daemon stopped")
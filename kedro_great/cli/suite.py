@@ -6,12 +6,17 @@ import click
 from great_expectations import DataContext
 from great_expectations.cli import toolkit
 from great_expectations.cli.toolkit import create_empty_suite
+from great_expectations.cli.util import cli_message
 from kedro.framework.context import KedroContext, load_context
 
-from ..data import generate_datasource_name
+from ..data import find_datasource_name, identify_dataset_type
+from ..kedro_great import get_timings_path
+from ..optimize import find_implied_across_suites, optimize_suite
+from ..timings import TimingHistory
+from .validate import find_kedro_great_hook, get_dataset_suite_names, select_datasets
 
 
-@click.command(name="suites")
+@click.group(name="suites", invoke_without_command=True)
 @click.option(
     "--directory",
     "-d",
@@ -27,12 +32,16 @@ from ..data import generate_datasource_name
     default=None,
     help="Additional keyword arguments to be provided to get_batch when loading the data asset. Must be a valid JSON dictionary",
 )
-def suite_new(directory, empty, replace, batch_kwargs):
+@click.pass_context
+def suite_new(ctx, directory, empty, replace, batch_kwargs):
     """
     Create Great Expectation Suites based on the kedro catalog using the BasicSuiteBuilderProfiler.
 
     If you wish to create suites without using the BasicSuiteBuilderProfiler, add the `--empty` flag.
     """
+    if ctx.invoked_subcommand is not None:
+        ctx.obj = {"directory": directory}
+        return
 
     kedro_context = load_context(Path.cwd())
     ge_context = toolkit.load_data_context_with_error_handling(directory)
@@ -55,6 +64,9 @@ def generate_basic_suites(
     if batch_kwargs is None:
         batch_kwargs = {}
     catalog = kedro_context.catalog
+    kedro_great = find_kedro_great_hook(kedro_context)
+    conversion_cache = kedro_great.conversion_cache
+    plan_cache = kedro_great.plan_cache
 
     existing_datasource_names = {ds["name"] for ds in ge_context.list_datasources()}
     for dataset_name in catalog.list():
@@ -62,12 +74,17 @@ def generate_basic_suites(
         if suite_name in ge_context.list_expectation_suite_names() and not replace:
             continue
 
-        datasource_name = generate_datasource_name(dataset_name)
+        dataset = catalog._get_dataset(dataset_name)
+        data_path = str(getattr(dataset, "_filepath", ""))
+        datasource_name = find_datasource_name(
+            dataset_name,
+            identify_dataset_type(dataset),
+            data_path,
+            existing_datasource_names,
+        )
         if datasource_name not in existing_datasource_names:
             continue
 
-        dataset = catalog._get_dataset(dataset_name)
-        data_path = str(dataset._filepath)
         dataasset_name, _ = os.path.splitext(os.path.basename(data_path))
 
         suite_batch_kwargs = {
@@ -76,6 +93,14 @@ def generate_basic_suites(
             "path": data_path,
             "reader_options": dataset._load_args,
         }
+        converted_path = (
+            conversion_cache.convert(dataset) if conversion_cache is not None else None
+        )
+        if converted_path is not None:
+            # Profile the parquet copy, which is much faster to read than the source
+            suite_batch_kwargs.update(
+                path=converted_path, reader_method="read_parquet", reader_options={}
+            )
 
         batch_kwargs_generator_name = "path"
         profiler_configuration = "demo"
@@ -99,3 +124,82 @@ def generate_basic_suites(
                 run_id=run_id,
                 additional_batch_kwargs=additional_batch_kwargs,
             )
+
+        if plan_cache is not None:
+            # Compile ahead of time, so the first validation does not have to
+            plan_cache.compile(ge_context, suite_name)
+
+
+@suite_new.command(name="optimize")
+@click.option(
+    "--dataset",
+    "-n",
+    "patterns",
+    multiple=True,
+    help="Catalog dataset name or glob pattern to optimize the suites of. Can be repeated. Defaults to every dataset.",
+)
+@click.option("--env", "-e", default=None, help="The kedro configuration environment.")
+@click.option(
+    "--dry-run", is_flag=True, help="Only report what would change, without saving the suites."
+)
+@click.pass_context
+def suite_optimize(ctx, patterns, env, dry_run):
+    """
+    Remove the expectations of each suite which are implied by another expectation
+    of the same suite, and order the rest cheapest first.
+
+    Reports the estimated validation time saved. Expectations implied by another
+    suite of the same dataset are only reported, since each suite passes or fails on its own.
+    """
+    kedro_context = load_context(Path.cwd(), env=env)
+    ge_context = toolkit.load_data_context_with_error_handling(ctx.obj["directory"])
+    kedro_great = find_kedro_great_hook(kedro_context)
+    timings_path = get_timings_path(ge_context)
+    history = TimingHistory(timings_path) if os.path.exists(timings_path) else None
+
+    existing_suite_names = set(ge_context.list_expectation_suite_names())
+    saved_seconds = 0.0
+    for dataset_name in select_datasets(kedro_context, list(patterns), []):
+        suite_names = [
+            suite_name
+            for suite_name in get_dataset_suite_names(kedro_great, dataset_name)
+            if suite_name in existing_suite_names
+        ]
+        expectation_suites = [
+            ge_context.get_expectation_suite(suite_name)
+            for suite_name in sorted(suite_names)
+        ]
+        for hint in find_implied_across_suites(expectation_suites):
+            cli_message(f"<yellow>{dataset_name}: {hint}</yellow>")
+
+        for expectation_suite in expectation_suites:
+            optimized = optimize_suite(expectation_suite)
+            if not optimized.removed and not optimized.reordered:
+                continue
+            for removed in optimized.removed:
+                cli_message(
+                    f"{optimized.suite}: removed {removed.expectation_type} "
+                    f"{removed.kwargs}, {removed.reason}"
+                )
+
+            predicted_seconds = (
+                history.predict(dataset_name, optimized.suite)
+                if history is not None
+                else None
+            )
+            savings = f"an estimated {optimized.savings:.0%} faster"
+            if predicted_seconds is not None:
+                saved_seconds += predicted_seconds * optimized.savings
+                savings += f", {predicted_seconds * optimized.savings:.2f}s per run"
+            cli_message(
+                f"{optimized.suite}: removed {len(optimized.removed)} expectations"
+                f"{', reordered by cost' if optimized.reordered else ''}, {savings}"
+            )
+
+            if not dry_run:
+                ge_context.save_expectation_suite(expectation_suite)
+                if kedro_great.plan_cache is not None:
+                    kedro_great.plan_cache.compile(ge_context, optimized.suite)
+
+    if saved_seconds:
+        cli_message(f"Saves an estimated {saved_seconds:.2f}s of validation per run.")
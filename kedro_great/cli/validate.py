@@ -0,0 +1,250 @@
+import datetime
+import fnmatch
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from xml.etree import ElementTree
+
+import click
+from great_expectations.cli.util import cli_message
+from kedro.framework.context import KedroContext, load_context
+
+from ..data import get_suite_names
+from ..kedro_great import KedroGreat, get_timings_path
+from ..timings import TimingHistory, order_datasets_longest_first
+
+_worker_state = {}
+
+
+def find_kedro_great_hook(kedro_context: KedroContext) -> KedroGreat:
+    """
+    Reuses the KedroGreat hook configured on the project context, if any,
+    so the CLI validates with the same options as `kedro run`.
+    """
+    for hook in getattr(kedro_context, "hooks", ()):
+        if isinstance(hook, KedroGreat):
+            return hook
+    return KedroGreat()
+
+
+def select_datasets(
+    kedro_context: KedroContext,
+    patterns: List[str],
+    tags: List[str],
+    pipeline_name: Optional[str] = None,
+) -> List[str]:
+    dataset_names = [
+        name
+        for name in kedro_context.catalog.list()
+        if name != "parameters" and not name.startswith("params:")
+    ]
+    if patterns:
+        dataset_names = [
+            name
+            for name in dataset_names
+            if any(fnmatch.fnmatchcase(name, pattern) for pattern in patterns)
+        ]
+    if tags:
+        pipeline = kedro_context.pipelines[pipeline_name or "__default__"]
+        tagged_names = pipeline.only_nodes_with_tags(*tags).data_sets()
+        dataset_names = [name for name in dataset_names if name in tagged_names]
+    return sorted(dataset_names)
+
+
+def get_dataset_suite_names(kedro_great: KedroGreat, dataset_name: str) -> List[str]:
+    return [
+        suite_name
+        for suite_name in get_suite_names(
+            kedro_great.expectations_map, dataset_name, kedro_great.suite_types
+        )
+        if suite_name in kedro_great.expectation_suite_names
+    ]
+
+
+def _init_worker(env: Optional[str]) -> None:
+    kedro_context = load_context(Path.cwd(), env=env)
+    _worker_state["catalog"] = kedro_context.catalog
+    _worker_state["kedro_great"] = find_kedro_great_hook(kedro_context)
+
+
+def _validate_dataset(dataset_name: str, run_id: str, fail_fast: bool) -> Dict[str, Any]:
+    catalog = _worker_state["catalog"]
+    kedro_great = _worker_state["kedro_great"]
+
+    started_at = time.perf_counter()
+    report = {"dataset": dataset_name, "suites": {}, "skipped": {}, "error": None}
+    try:
+        if kedro_great.expectation_context is None:
+            raise RuntimeError("Great Expectations has not been initialized")
+        suite_names = get_dataset_suite_names(kedro_great, dataset_name)
+        if suite_names:
+            dataset = catalog._get_dataset(dataset_name)
+            # Validated like the hook reads datasets before a node, so the schema
+            # pre-flight, the statistics cache and the backends apply
+            with kedro_great.capture_report() as validation_report:
+                report["suites"] = kedro_great.validate_dataset(
+                    dataset_name,
+                    dataset,
+                    None,
+                    run_id,
+                    True,
+                    kedro_great.order_suites(dataset_name, suite_names, fail_fast),
+                    stop_on_failure=fail_fast,
+                )
+            report["skipped"] = {
+                skipped.suite: skipped.reason for skipped in validation_report.skipped
+            }
+            kedro_great.save_timings()
+    except Exception as e:  # pylint: disable=broad-except
+        report["error"] = f"{type(e).__name__}: {e}"
+    report["seconds"] = time.perf_counter() - started_at
+    return report
+
+
+def write_junit_report(reports: List[Dict[str, Any]], path: str) -> None:
+    testsuites = ElementTree.Element("testsuites", name="kedro-great")
+    for report in reports:
+        suites = report["suites"]
+        skipped = report.get("skipped", {})
+        testsuite = ElementTree.SubElement(
+            testsuites,
+            "testsuite",
+            name=report["dataset"],
+            tests=str(max(len(suites) + len(skipped), 1)),
+            failures=str(sum(not success for success in suites.values())),
+            errors=str(int(report["error"] is not None)),
+            skipped=str(len(skipped)),
+            time=f"{report['seconds']:.3f}",
+        )
+        if report["error"] is not None:
+            testcase = ElementTree.SubElement(
+                testsuite, "testcase", classname=report["dataset"], name="load"
+            )
+            ElementTree.SubElement(testcase, "error", message=report["error"])
+        for suite_name, success in sorted(suites.items()):
+            testcase = ElementTree.SubElement(
+                testsuite, "testcase", classname=report["dataset"], name=suite_name
+            )
+            if not success:
+                ElementTree.SubElement(
+                    testcase, "failure", message=f"Suite {suite_name} failed"
+                )
+        for suite_name, reason in sorted(skipped.items()):
+            testcase = ElementTree.SubElement(
+                testsuite, "testcase", classname=report["dataset"], name=suite_name
+            )
+            ElementTree.SubElement(testcase, "skipped", message=reason)
+    ElementTree.ElementTree(testsuites).write(path, encoding="utf-8", xml_declaration=True)
+
+
+@click.command(name="validate")
+@click.option(
+    "--dataset",
+    "-n",
+    "patterns",
+    multiple=True,
+    help="Catalog dataset name or glob pattern to validate. Can be repeated. Defaults to every dataset.",
+)
+@click.option(
+    "--tag",
+    "-t",
+    "tags",
+    multiple=True,
+    help="Only validate datasets used by pipeline nodes with this tag. Can be repeated.",
+)
+@click.option("--pipeline", default=None, help="The pipeline to look up tags in.")
+@click.option("--env", "-e", default=None, help="The kedro configuration environment.")
+@click.option(
+    "--workers",
+    "-j",
+    default=None,
+    type=int,
+    help="Number of processes to validate with. Defaults to the number of CPUs.",
+)
+@click.option(
+    "--fail-fast",
+    is_flag=True,
+    help="Stop at the first failing expectation, skipping the remaining suites and datasets.",
+)
+@click.option("--json", "json_path", default=None, help="Write a JSON summary to this path.")
+@click.option("--junit", "junit_path", default=None, help="Write a JUnit XML summary to this path.")
+def validate(patterns, tags, pipeline, env, workers, fail_fast, json_path, junit_path):
+    """
+    Validate catalog datasets against their suites, without running the pipeline.
+
+    Datasets are validated in parallel, and the command exits with a non-zero
+    status if any suite fails.
+    """
+    kedro_context = load_context(Path.cwd(), env=env)
+    dataset_names = select_datasets(kedro_context, list(patterns), list(tags), pipeline)
+    if not dataset_names:
+        cli_message("<yellow>No datasets selected.</yellow>")
+        sys.exit(1)
+
+    kedro_great = find_kedro_great_hook(kedro_context)
+    timings_path = (
+        get_timings_path(kedro_great.expectation_context)
+        if kedro_great.expectation_context is not None
+        else None
+    )
+    if timings_path is not None and os.path.exists(timings_path):
+        # Longest datasets first, so workers are not left idle waiting on one at the end
+        dataset_names = order_datasets_longest_first(
+            TimingHistory(timings_path),
+            {
+                dataset_name: get_dataset_suite_names(kedro_great, dataset_name)
+                for dataset_name in dataset_names
+            },
+        )
+
+    run_id = datetime.datetime.now(datetime.timezone.utc).strftime("%Y%m%dT%H%M%S.%fZ")
+    reports = []
+    with ProcessPoolExecutor(
+        max_workers=workers or os.cpu_count(),
+        initializer=_init_worker,
+        initargs=(env,),
+    ) as executor:
+        futures = [
+            executor.submit(_validate_dataset, dataset_name, run_id, fail_fast)
+            for dataset_name in dataset_names
+        ]
+        for future in as_completed(futures):
+            if future.cancelled():
+                continue
+            report = future.result()
+            reports.append(report)
+            for suite_name, success in sorted(report["suites"].items()):
+                status = "<green>passed</green>" if success else "<red>failed</red>"
+                cli_message(f"{report['dataset']}: {suite_name} {status}")
+            for suite_name, reason in sorted(report["skipped"].items()):
+                cli_message(f"{report['dataset']}: {suite_name} <yellow>skipped, {reason}</yellow>")
+            if report["error"] is not None:
+                cli_message(f"<red>{report['dataset']}: {report['error']}</red>")
+            elif not report["suites"] and not report["skipped"]:
+                cli_message(f"{report['dataset']}: <yellow>no suites</yellow>")
+            if fail_fast and (
+                report["error"] is not None or not all(report["suites"].values())
+            ):
+                cancelled = sum(future.cancel() for future in futures)
+                if cancelled:
+                    cli_message(f"<yellow>Skipped {cancelled} remaining datasets.</yellow>")
+
+    reports.sort(key=lambda report: report["dataset"])
+    if json_path:
+        with open(json_path, "w") as f:
+            json.dump({"run_id": run_id, "datasets": reports}, f, indent=2)
+    if junit_path:
+        write_junit_report(reports, junit_path)
+
+    failed = [
+        report
+        for report in reports
+        if report["error"] is not None or not all(report["suites"].values())
+    ]
+    cli_message(f"Validated {len(reports)} datasets, {len(failed)} failed.")
+    if failed:
+        sys.exit(1)
@@ -0,0 +1,137 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from typing import Any, Optional
+
+from kedro.io import AbstractDataSet
+
+from .stats import dataset_fingerprint
+
+DEFAULT_MAX_BYTES = 1024 ** 3
+
+logger = logging.getLogger("KedroGreat")
+
+
+def parquet_engine_available() -> bool:
+    """
+    Whether pandas can read and write parquet, with either of its engines.
+    """
+    for engine in ("pyarrow", "fastparquet"):
+        try:
+            __import__(engine)
+            return True
+        except ImportError:
+            continue
+    return False
+
+
+def is_convertible_dataset(dataset: AbstractDataSet) -> bool:
+    """
+    Whether the dataset is slow to parse, and so worth converting to parquet.
+    """
+    from kedro.extras.datasets.pandas import CSVDataSet, ExcelDataSet
+
+    return isinstance(dataset, (CSVDataSet, ExcelDataSet))
+
+
+class ConversionCache:
+    """
+    Keeps a parquet copy of slow to parse datasets, keyed by their file fingerprint
+    and load arguments, so they are only parsed once until the file changes.
+    The least recently used copies are evicted once the directory outgrows `max_bytes`.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def get_path(self, dataset: AbstractDataSet) -> Optional[str]:
+        if not is_convertible_dataset(dataset):
+            return None
+        fingerprint = dataset_fingerprint(dataset)
+        if fingerprint is None:
+            return None
+        key = hashlib.sha1(
+            json.dumps(
+                {
+                    "fingerprint": fingerprint,
+                    "load_args": getattr(dataset, "_load_args", None),
+                },
+                sort_keys=True,
+                default=str,
+            ).encode()
+        ).hexdigest()
+        return os.path.join(self.directory, f"{key}.parquet")
+
+    def convert(self, dataset: AbstractDataSet, df: Any = None) -> Optional[str]:
+        """
+        Returns the path of the parquet copy of the dataset, converting it first
+        if needed. None if the dataset cannot be converted.
+        """
+        path = self.get_path(dataset)
+        if path is None:
+            return None
+        if os.path.exists(path):
+            # The modification time orders the copies for eviction
+            os.utime(path)
+            return path
+
+        if df is None:
+            df = dataset.load()
+        os.makedirs(self.directory, exist_ok=True)
+        # A temp file per writer, threads and processes may convert the same dataset
+        with tempfile.NamedTemporaryFile(
+            dir=self.directory, suffix=".tmp", delete=False
+        ) as f:
+            tmp_path = f.name
+        try:
+            df.to_parquet(tmp_path)
+        except Exception as e:  # pylint: disable=broad-except
+            # e.g. pyarrow is not installed, or a column mixes types
+            logger.debug(f"Could not convert {path} to parquet: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return None
+        os.replace(tmp_path, path)
+        self._evict(keep=os.path.basename(path))
+        return path
+
+    def load(self, dataset: AbstractDataSet) -> Any:
+        """
+        Loads the dataset from its parquet copy, converting it on a miss.
+        """
+        import pandas as pd
+
+        path = self.get_path(dataset)
+        if path is not None and os.path.exists(path):
+            os.utime(path)
+            return pd.read_parquet(path)
+        df = dataset.load()
+        if path is not None:
+            self.convert(dataset, df)
+        return df
+
+    def _evict(self, keep: str) -> None:
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(".parquet") or name == keep:
+                continue
+            try:
+                stat = os.stat(os.path.join(self.directory, name))
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, name))
+
+        total_bytes = sum(size for _, size, _ in entries) + os.path.getsize(
+            os.path.join(self.directory, keep)
+        )
+        for _, size, name in sorted(entries):
+            if total_bytes <= self.max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                continue
+            total_bytes -= size
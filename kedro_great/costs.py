@@ -0,0 +1,90 @@
+from typing import Any, Dict, List
+
+# Relative cost tiers of evaluating an expectation on a frame
+METADATA_COST = 0
+AGGREGATE_COST = 1
+SCAN_COST = 2
+PARSE_COST = 3
+
+_METADATA_EXPECTATIONS = {
+    "expect_column_to_exist",
+    "expect_table_columns_to_match_ordered_list",
+    "expect_table_columns_to_match_set",
+    "expect_table_column_count_to_equal",
+    "expect_table_column_count_to_be_between",
+    "expect_table_row_count_to_equal",
+    "expect_table_row_count_to_be_between",
+}
+
+_AGGREGATE_EXPECTATIONS = {
+    "expect_column_min_to_be_between",
+    "expect_column_max_to_be_between",
+    "expect_column_sum_to_be_between",
+    "expect_column_mean_to_be_between",
+    "expect_column_stdev_to_be_between",
+    "expect_column_values_to_be_null",
+    "expect_column_values_to_not_be_null",
+    "expect_column_values_to_be_of_type",
+    "expect_column_values_to_be_in_type_list",
+}
+
+_SCAN_EXPECTATIONS = {
+    "expect_column_values_to_be_between",
+    "expect_column_values_to_be_in_set",
+    "expect_column_values_to_not_be_in_set",
+    "expect_column_values_to_be_unique",
+    "expect_column_values_to_be_increasing",
+    "expect_column_values_to_be_decreasing",
+    "expect_column_value_lengths_to_be_between",
+    "expect_column_value_lengths_to_equal",
+    "expect_column_unique_value_count_to_be_between",
+    "expect_column_proportion_of_unique_values_to_be_between",
+    "expect_column_distinct_values_to_be_in_set",
+    "expect_column_distinct_values_to_contain_set",
+    "expect_column_distinct_values_to_equal_set",
+    "expect_column_most_common_value_to_be_in_set",
+    "expect_column_median_to_be_between",
+    "expect_column_quantile_values_to_be_between",
+}
+
+
+def expectation_cost(expectation_type: str, kwargs: Dict[str, Any]) -> int:
+    """
+    Estimates how expensive an expectation is to evaluate, from its type alone.
+    Unknown expectations, e.g. regexes, parsers and multi column ones, are the most expensive.
+    """
+    if expectation_type in _METADATA_EXPECTATIONS:
+        return METADATA_COST
+    if expectation_type in _AGGREGATE_EXPECTATIONS:
+        return AGGREGATE_COST
+    if expectation_type in _SCAN_EXPECTATIONS:
+        return SCAN_COST
+    return PARSE_COST
+
+
+def order_expectations_by_cost(expectations: List[Any]) -> List[Any]:
+    """
+    Orders expectation configurations cheapest first, keeping the suite order within a tier.
+    """
+    return sorted(
+        expectations, key=lambda e: expectation_cost(e.expectation_type, e.kwargs)
+    )
+
+
+# Rough runtimes of each tier relative to an aggregate, on a pandas frame
+RELATIVE_COSTS = {
+    METADATA_COST: 0.01,
+    AGGREGATE_COST: 1.0,
+    SCAN_COST: 3.0,
+    PARSE_COST: 10.0,
+}
+
+
+def estimate_suite_cost(expectations: List[Any]) -> float:
+    """
+    The estimated runtime of the expectations, relative to a single aggregate.
+    """
+    return sum(
+        RELATIVE_COSTS[expectation_cost(e.expectation_type, e.kwargs)]
+        for e in expectations
+    )
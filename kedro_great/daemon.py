@@ -0,0 +1,225 @@
+import json
+import logging
+import os
+import socket
+import socketserver
+import struct
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional, Tuple
+
+from kedro.io import DataCatalog
+
+DEFAULT_SOCKET_NAME = "daemon.sock"
+DEFAULT_WORKERS = 4
+# Past this, the hook stops waiting on the daemon and validates in-process
+DEFAULT_TIMEOUT_SECONDS = 600.0
+
+_HEADER_LENGTH = struct.Struct(">II")
+
+
+def _read_exactly(stream: Any, size: int) -> bytes:
+    data = b""
+    while len(data) < size:
+        chunk = stream.read(size - len(data))
+        if not chunk:
+            raise ConnectionError("Connection closed mid-message")
+        data += chunk
+    return data
+
+
+def write_message(stream: Any, header: Dict[str, Any], payload: bytes = b"") -> None:
+    encoded_header = json.dumps(header).encode("utf-8")
+    stream.write(_HEADER_LENGTH.pack(len(encoded_header), len(payload)))
+    stream.write(encoded_header)
+    stream.write(payload)
+    stream.flush()
+
+
+def read_message(stream: Any) -> Tuple[Dict[str, Any], bytes]:
+    header_length, payload_length = _HEADER_LENGTH.unpack(
+        _read_exactly(stream, _HEADER_LENGTH.size)
+    )
+    header = json.loads(_read_exactly(stream, header_length).decode("utf-8"))
+    payload = _read_exactly(stream, payload_length) if payload_length else b""
+    return header, payload
+
+
+def frame_to_arrow(df: Any) -> Optional[bytes]:
+    """
+    Serializes a pandas frame to the Arrow IPC stream format.
+    Returns None for anything else, which cannot be shipped to the daemon.
+    """
+    import pandas as pd
+
+    if not isinstance(df, pd.DataFrame):
+        return None
+
+    import pyarrow as pa
+
+    table = pa.Table.from_pandas(df)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def arrow_to_frame(payload: bytes) -> Any:
+    import pyarrow as pa
+
+    return pa.ipc.open_stream(payload).read_all().to_pandas()
+
+
+class _ValidationRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        try:
+            header, payload = read_message(self.rfile)
+            write_message(self.wfile, self.server.validate(header, payload))
+        except Exception as e:  # pylint: disable=broad-except
+            self.server.logger.exception("Validation request failed")
+            write_message(self.wfile, {"error": f"{type(e).__name__}: {e}"})
+
+
+class ValidationDaemon(socketserver.UnixStreamServer):
+    """
+    Keeps a KedroGreat hook, its DataContext and parsed suites, and any Spark
+    session warm between pipeline runs, validating datasets sent over a local
+    Unix socket.
+
+    Requests are handled by a fixed pool of worker threads. The hook keeps a
+    DataContext per thread, so each worker builds one once and reuses it.
+    What a request's validations report is captured apart from the hook's
+    own run report, and sent back to the client, so nothing accumulates
+    in the daemon between requests.
+    """
+
+    # Unix sockets refuse connections past the backlog, so runner threads
+    # connecting at once would fall back to validating in-process
+    request_queue_size = 64
+
+    def __init__(
+        self,
+        socket_path: str,
+        catalog: DataCatalog,
+        kedro_great: Any,
+        workers: int = DEFAULT_WORKERS,
+    ):
+        self.catalog = catalog
+        self.kedro_great = kedro_great
+        self.logger = logging.getLogger("KedroGreat")
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="KedroGreatDaemon"
+        )
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        os.makedirs(os.path.dirname(os.path.abspath(socket_path)), exist_ok=True)
+        super().__init__(socket_path, _ValidationRequestHandler)
+
+    def process_request(self, request, client_address):
+        self._executor.submit(self._process_request_in_worker, request, client_address)
+
+    def _process_request_in_worker(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:  # pylint: disable=broad-except
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def validate(self, header: Dict[str, Any], payload: bytes) -> Dict[str, Any]:
+        dataset_name = header["dataset"]
+        dataset = self.catalog._get_dataset(dataset_name)
+        with self.kedro_great.capture_report() as report:
+            # Validated like the hook would in-process, so backends,
+            # e.g. dask, and the statistics cache apply
+            results = self.kedro_great.validate_dataset(
+                dataset_name,
+                dataset,
+                arrow_to_frame(payload) if payload else None,
+                header["run_id"],
+                not payload,
+                header["suites"],
+                stop_on_failure=header.get("fail_fast", False),
+            )
+        self.kedro_great.save_timings()
+        return {"results": results, "report": report.to_dict()}
+
+    def server_close(self):
+        super().server_close()
+        self._executor.shutdown(wait=True)
+        if os.path.exists(self.server_address):
+            os.remove(self.server_address)
+
+
+class DaemonClient:
+    def __init__(
+        self, socket_path: str, timeout: Optional[float] = DEFAULT_TIMEOUT_SECONDS
+    ):
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self.logger = logging.getLogger("KedroGreat")
+
+    def validate(
+        self,
+        dataset_name: str,
+        suite_names: list,
+        run_id: str,
+        df: Any = None,
+        fail_fast: bool = False,
+    ) -> Optional[Tuple[Dict[str, bool], Dict[str, Any]]]:
+        """
+        Asks the daemon to validate the dataset, loading it from the catalog
+        unless an in-memory frame is given. Returns the success of each suite,
+        and what the validations reported, as a serialized ValidationReport.
+        Returns None if the daemon cannot take the request, so the caller can
+        validate in-process instead.
+        """
+        payload = b""
+        if df is not None:
+            try:
+                payload = frame_to_arrow(df)
+            except (ImportError, ValueError, TypeError) as e:
+                # pyarrow is not installed, or cannot convert a column
+                self.logger.info(
+                    f"Cannot ship DataSet {dataset_name} to the validation daemon ({e}), "
+                    f"validating in-process"
+                )
+                return None
+            if payload is None:
+                return None
+
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.settimeout(self.timeout)
+                sock.connect(self.socket_path)
+                with sock.makefile("rwb") as stream:
+                    write_message(
+                        stream,
+                        {
+                            "dataset": dataset_name,
+                            "suites": suite_names,
+                            "run_id": run_id,
+                            "fail_fast": fail_fast,
+                        },
+                        payload,
+                    )
+                    response, _ = read_message(stream)
+        except socket.timeout:
+            self.logger.warning(
+                f"Validation daemon did not answer within {self.timeout}s "
+                f"on DataSet {dataset_name}, validating in-process"
+            )
+            return None
+        except (OSError, ValueError, struct.error) as e:
+            self.logger.info(
+                f"Validation daemon unavailable at {self.socket_path} ({e}), "
+                f"validating in-process"
+            )
+            return None
+
+        if "error" in response:
+            self.logger.warning(
+                f"Validation daemon failed on DataSet {dataset_name}: {response['error']}, "
+                f"validating in-process"
+            )
+            return None
+        return response["results"], response["report"]
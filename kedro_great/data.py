@@ -1,4 +1,6 @@
-from typing import Dict, Optional, List, Type, Union
+import os
+import re
+from typing import Dict, Optional, List, Set, Type, Union
 
 from great_expectations.cli.datasource import DatasourceTypes
 from kedro.io import AbstractDataSet
@@ -46,6 +48,49 @@ def generate_datasource_name(dataset_name: str) -> str:
     return f"{dataset_name}___kedro_great_datasource"
 
 
+def get_datasource_base_directory(dataset_path: str) -> str:
+    path = os.path.dirname(str(dataset_path))
+    if path.startswith("./"):
+        path = path[2:]
+    return path
+
+
+def generate_shared_datasource_name(
+    datasource_type: DatasourceTypes, base_directory: str
+) -> str:
+    slug = re.sub(r"[^0-9a-zA-Z]+", "_", base_directory).strip("_") or "root"
+    return f"{datasource_type.value}__{slug}___kedro_great_datasource"
+
+
+def find_datasource_name(
+    dataset_name: str,
+    datasource_type: Optional[DatasourceTypes],
+    dataset_path: Optional[str],
+    existing_datasource_names: Set[str],
+) -> str:
+    """
+    The datasource of a dataset is its own one when it exists,
+    otherwise the one shared by the datasets of its type in its directory.
+    """
+    datasource_name = generate_datasource_name(dataset_name)
+    if (
+        datasource_name in existing_datasource_names
+        or datasource_type is None
+        or not dataset_path
+    ):
+        return datasource_name
+    shared_datasource_name = generate_shared_datasource_name(
+        datasource_type, get_datasource_base_directory(dataset_path)
+    )
+    if shared_datasource_name in existing_datasource_names:
+        return shared_datasource_name
+    return datasource_name
+
+
+def get_kedro_great_directory(ge_root_directory: str, *parts: str) -> str:
+    return os.path.join(ge_root_directory, "uncommitted", "kedro_great", *parts)
+
+
 def get_suite_names(
     expectations_map: Dict[str, Union[str, List[str]]],
     dataset_name: str,
@@ -0,0 +1,111 @@
+"""
+Extraction of the rows failing a suite, in a second pass over the failed expectations only,
+so passing validations never pay for collecting unexpected indexes.
+"""
+import os
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from .results import get_suite_validation_results
+
+DEFAULT_MAX_FAILING_ROWS = 1000
+FAILED_EXPECTATIONS_COLUMN = "kedro_great_failed_expectations"
+
+
+class FailingRows(NamedTuple):
+    suite: str
+    dataset: str
+    path: str
+    rows: int
+
+
+def get_failed_expectations(validation: Any) -> List[Any]:
+    return [
+        result.expectation_config
+        for suite_validation in get_suite_validation_results(validation)
+        for result in suite_validation.results
+        if not result.success and result.expectation_config is not None
+    ]
+
+
+def get_evaluation_parameters(validation: Any) -> Dict[str, Any]:
+    """
+    The evaluation parameters the expectations of a validation were evaluated with.
+    """
+    evaluation_parameters = {}
+    for suite_validation in get_suite_validation_results(validation):
+        evaluation_parameters.update(suite_validation.evaluation_parameters or {})
+    return evaluation_parameters
+
+
+def find_failing_rows(
+    df: Any,
+    failed_expectations: List[Any],
+    max_rows: int,
+    evaluation_parameters: Optional[Dict[str, Any]] = None,
+) -> Optional[Any]:
+    """
+    Re-evaluates the failed expectations asking for the unexpected indexes,
+    and returns up to `max_rows` of the failing rows, with the expectations
+    each one failed. Only pandas frames have row indexes to report.
+    None if no row can be blamed, e.g. when only aggregate expectations failed.
+    """
+    import pandas as pd
+    import great_expectations as ge
+    from great_expectations.core.evaluation_parameters import (
+        build_evaluation_parameters,
+    )
+
+    if not isinstance(df, pd.DataFrame):
+        return None
+    if not df.index.is_unique:
+        df = df.reset_index(drop=True)
+
+    ge_df = ge.from_pandas(df)
+    failed_by_index: Dict[Any, List[str]] = {}
+    for e in failed_expectations:
+        expectation_method = getattr(ge_df, e.expectation_type, None)
+        if expectation_method is None:
+            continue
+        kwargs = {k: v for k, v in e.kwargs.items() if k != "result_format"}
+        try:
+            kwargs, _ = build_evaluation_parameters(kwargs, evaluation_parameters or {})
+        except Exception:  # pylint: disable=broad-except
+            # The parameters it was validated with are unknown, so no row can be blamed
+            continue
+        result = expectation_method(
+            catch_exceptions=True,
+            result_format={
+                "result_format": "SUMMARY",
+                "partial_unexpected_count": max_rows,
+            },
+            **kwargs,
+        )
+        for index in (result.result or {}).get("partial_unexpected_index_list") or []:
+            failed_by_index.setdefault(index, []).append(e.expectation_type)
+    if not failed_by_index:
+        return None
+
+    indexes = list(failed_by_index)[:max_rows]
+    rows = df.loc[indexes].copy()
+    rows[FAILED_EXPECTATIONS_COLUMN] = [
+        ", ".join(failed_by_index[index]) for index in indexes
+    ]
+    return rows
+
+
+def get_failing_rows_path(
+    validations_directory: str,
+    suite_name: str,
+    run_id: str,
+    dataset_name: str,
+    file_format: str = "parquet",
+) -> str:
+    """
+    Places the failing rows next to the validation results of the suite for the run.
+    """
+    return os.path.join(
+        validations_directory,
+        *suite_name.split("."),
+        run_id,
+        f"{dataset_name}.failing_rows.{file_format}",
+    )
@@ -1,23 +1,106 @@
 import datetime
+import gc
 import logging
 import os
-from copy import copy
-from typing import Any, Dict, List, Optional, NamedTuple
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from copy import copy, deepcopy
+from typing import Any, Dict, Iterable, Iterator, List, Optional, NamedTuple, Union
 
 import great_expectations as ge
+from great_expectations.cli.datasource import DatasourceTypes
 from great_expectations.core.batch import Batch
+from great_expectations.core.evaluation_parameters import build_evaluation_parameters
 from great_expectations.core.id_dict import BatchKwargs
+from great_expectations.data_asset.util import (
+    parse_result_format,
+    recursively_convert_to_json_serializable,
+)
 from great_expectations.datasource.types import BatchMarkers
 from great_expectations.validator.validator import Validator
 from great_expectations.exceptions import ConfigNotFoundError
 from kedro.framework.hooks import hook_impl
-from kedro.io import DataCatalog, MemoryDataSet
+from kedro.io import AbstractDataSet, DataCatalog, MemoryDataSet
+from kedro.pipeline.node import Node
 
 from .exceptions import UnsupportedDataSet, SuiteValidationFailure
 from .data import (
     get_suite_names,
-    generate_datasource_name,
+    find_datasource_name,
+    get_kedro_great_directory,
+)
+from .memo import ExpectationMemo
+from .budget import (
+    ValidationBudget,
+    SkippedSuite,
+    SampledSuite,
+    resolve_budget,
+    order_suites_by_priority,
+    get_suite_priority,
+    fit_rows_to_budget,
+    sample_frame,
+    estimate_memory,
+)
+from .schema import (
+    TYPE_EXPECTATION_TYPES,
+    SchemaFrame,
+    build_schema_suite,
+    check_column_type,
+    read_schema_frame,
+)
+from .stats import StatisticsCache, make_statistics_resolver
+from .daemon import DaemonClient, DEFAULT_SOCKET_NAME
+from .sketches import ApproximationConfig, make_sketch_resolver
+from .plans import PlanCache, get_plans_columns, project_frame
+from .backends import ValidationBackend, get_backend
+from .backends.dask import is_dask_dataset, is_dask_frame
+from .tracing import Tracer, describe_frame
+from .memory import MemoryTracker, SuiteMemoryUsage, fit_rows_to_memory_ceiling
+from .results import (
+    OPERATOR_RESULT_FORMAT,
+    ValidationSummary,
+    ValidationTotals,
+    build_suite_validation_result,
+    resolve_result_format,
+    summarize_validation,
+)
+from .costs import order_expectations_by_cost
+from .conversion import DEFAULT_MAX_BYTES, ConversionCache, parquet_engine_available
+from .recording import DEFAULT_SAMPLE_ROWS, RunRecorder
+from .failures import (
+    DEFAULT_MAX_FAILING_ROWS,
+    FailingRows,
+    find_failing_rows,
+    get_evaluation_parameters,
+    get_failed_expectations,
+    get_failing_rows_path,
 )
+from .timings import (
+    MIN_REGRESSION_SECONDS,
+    TimingHistory,
+    TimingRegression,
+    frame_rows,
+    order_suites_by_cost,
+)
+
+# Great Expectations parses its configuration with a module level YAML parser,
+# which is not thread safe
+_yaml_lock = threading.RLock()
+
+
+class _ThreadDataContext(ge.data_context.DataContext):
+    """
+    The context of a runner thread. It re-reads the config variables on most
+    property accesses, so each read holds the lock shared by all threads.
+    """
+
+    def _load_config_variables_file(self):
+        with _yaml_lock:
+            return super()._load_config_variables_file()
+
+
+VALIDATION_OPERATOR_NAME = "action_list_operator"
 
 
 class FailedSuite(NamedTuple):
@@ -25,8 +108,109 @@ class FailedSuite(NamedTuple):
     dataset: str
 
 
+class ValidationReport:
+    """
+    What the validations report beyond the success of each suite. The hook
+    keeps one for the run, and each validation daemon request one of its own,
+    which is sent back and merged into the run's.
+    """
+
+    RECORD_TYPES = {
+        "failed": FailedSuite,
+        "skipped": SkippedSuite,
+        "sampled": SampledSuite,
+        "memory": SuiteMemoryUsage,
+        "regressions": TimingRegression,
+        "failing_rows": FailingRows,
+    }
+
+    def __init__(self):
+        self.failed: List[FailedSuite] = []
+        self.skipped: List[SkippedSuite] = []
+        self.sampled: List[SampledSuite] = []
+        self.memory: List[SuiteMemoryUsage] = []
+        self.regressions: List[TimingRegression] = []
+        self.failing_rows: List[FailingRows] = []
+        self.summaries: List[ValidationSummary] = []
+        self.totals = ValidationTotals()
+        self.trace_events: List[Dict[str, Any]] = []
+
+    def merge(self, other: "ValidationReport") -> None:
+        for field in self.RECORD_TYPES:
+            getattr(self, field).extend(getattr(other, field))
+        self.summaries.extend(other.summaries)
+        self.totals.merge(other.totals)
+
+    def to_dict(self) -> Dict[str, Any]:
+        report = {
+            field: [record._asdict() for record in getattr(self, field)]
+            for field in self.RECORD_TYPES
+        }
+        report["summaries"] = [summary.to_dict() for summary in self.summaries]
+        report["totals"] = self.totals.to_dict()
+        report["trace_events"] = self.trace_events
+        return report
+
+    @classmethod
+    def from_dict(cls, report: Dict[str, Any]) -> "ValidationReport":
+        validation_report = cls()
+        for field, record_type in cls.RECORD_TYPES.items():
+            setattr(
+                validation_report,
+                field,
+                [record_type(**record) for record in report[field]],
+            )
+        validation_report.summaries = [
+            ValidationSummary(
+                **{**summary, "failed_expectations": tuple(summary["failed_expectations"])}
+            )
+            for summary in report["summaries"]
+        ]
+        validation_report.totals = ValidationTotals.from_dict(report["totals"])
+        validation_report.trace_events = report["trace_events"]
+        return validation_report
+
+
+def get_run_identifier(run_id: Any) -> Any:
+    """
+    Converts a Kedro run id to a RunIdentifier the way the validation
+    operator does, so results made outside of it are stored alongside.
+    """
+    from dateutil.parser import parse
+    from great_expectations.core import RunIdentifier
+
+    if not isinstance(run_id, str):
+        return run_id
+    try:
+        run_time = parse(run_id)
+    except (ValueError, TypeError, OverflowError):
+        run_time = None
+    return RunIdentifier(run_name=run_id, run_time=run_time)
+
+
+def get_daemon_socket_path(expectation_context: ge.data_context.DataContext) -> str:
+    return get_kedro_great_directory(
+        expectation_context.root_directory, DEFAULT_SOCKET_NAME
+    )
+
+
+def get_plans_directory(expectation_context: ge.data_context.DataContext) -> str:
+    return get_kedro_great_directory(expectation_context.root_directory, "plans")
+
+
+def get_recordings_directory(expectation_context: ge.data_context.DataContext) -> str:
+    return get_kedro_great_directory(expectation_context.root_directory, "recordings")
+
+
+def get_timings_path(expectation_context: ge.data_context.DataContext) -> str:
+    return get_kedro_great_directory(
+        expectation_context.root_directory, "timings.json"
+    )
+
+
 class KedroGreat:
     DEFAULT_SUITE_TYPES = ["warning", "basic", None]
+    CRITICAL_PRIORITY = 0
 
     def __init__(
         self,
@@ -36,28 +220,136 @@ class KedroGreat:
         run_after_node: bool = False,
         fail_fast: bool = False,
         fail_after_pipeline_run: bool = False,
+        memoize_expectations: bool = True,
+        validation_budgets: Dict[str, Union[ValidationBudget, Dict]] = None,
+        suite_priorities: Dict[Optional[str], int] = None,
+        schema_preflight: bool = False,
+        full_validation_after_preflight: bool = True,
+        statistics_cache: bool = False,
+        use_daemon: bool = False,
+        daemon_socket: Optional[str] = None,
+        cache_suites: bool = False,
+        approximate_expectations: Union[bool, ApproximationConfig, Dict] = False,
+        compiled_plans: bool = False,
+        backends: Dict[str, str] = None,
+        trace: bool = False,
+        track_memory: bool = False,
+        trace_allocations: bool = False,
+        memory_ceiling: Optional[int] = None,
+        adaptive_scheduling: bool = False,
+        regression_threshold: float = 2.0,
+        result_formats: Dict[str, str] = None,
+        conversion_cache: Union[bool, int] = False,
+        record_runs: bool = False,
+        record_sample_rows: int = DEFAULT_SAMPLE_ROWS,
+        extract_failing_rows: Union[bool, int] = False,
+        context_root_dir: Optional[str] = None,
     ):
+        # Kept as given, so recorded runs can be replayed with the same options
+        options = {key: value for key, value in locals().items() if key != "self"}
+        self._options = options
         if expectations_map is None:
             expectations_map = {}
         if suite_types is None:
             suite_types = copy(KedroGreat.DEFAULT_SUITE_TYPES)
         self.expectations_map = expectations_map
         self.suite_types = suite_types
+        self.validation_budgets = validation_budgets or {}
+        self.suite_priorities = suite_priorities or {}
+        self.backends = backends or {}
+        self.result_formats = result_formats or {}
 
         self._before_node_run = run_before_node
         self._after_node_run = run_after_node
         self._fail_fast = fail_fast
         self._fail_after_pipeline_run = fail_after_pipeline_run
+        self._memoize_expectations = memoize_expectations
+        self._schema_preflight = schema_preflight
+        self._full_validation_after_preflight = full_validation_after_preflight
 
         self.logger = logging.getLogger("KedroGreat")
         self._finished_suites = set()
-        self._failed_suites = list()
+        self._report = ValidationReport()
+        self._datasource_names = set()
+        self.conversion_cache = None
+        self._recorder = None
+        self._max_failing_rows = (
+            DEFAULT_MAX_FAILING_ROWS
+            if extract_failing_rows is True
+            else int(extract_failing_rows or 0)
+        )
+        self._suites_lock = threading.Lock()
+        self._failure_known = threading.Event()
+        self._thread_state = threading.local()
+        self._suite_cache = {} if cache_suites else None
+        self._daemon_client = None
+        self.plan_cache = None
+        self._backend_instances = {}
+        self._backends_lock = threading.Lock()
+        self._tracer = Tracer(enabled=trace)
+        self._node_started_at = {}
+        self._track_memory = track_memory or trace_allocations
+        self._trace_allocations = trace_allocations
+        self._memory_ceiling = memory_ceiling
+        self._timing_history = None
+        self._regression_threshold = regression_threshold
+
+        if approximate_expectations is True:
+            approximate_expectations = ApproximationConfig()
+        elif isinstance(approximate_expectations, dict):
+            approximate_expectations = ApproximationConfig(**approximate_expectations)
+        self._approximation_config = approximate_expectations or None
 
         try:
-            self.expectation_context = ge.data_context.DataContext()
+            self.expectation_context = ge.data_context.DataContext(context_root_dir)
+            self._thread_state.expectation_context = self.expectation_context
             self.expectation_suite_names = set(
                 self.expectation_context.list_expectation_suite_names()
             )
+            self._datasource_names = {
+                datasource["name"]
+                for datasource in self.expectation_context.list_datasources()
+            }
+            self._statistics_cache = (
+                StatisticsCache(
+                    get_kedro_great_directory(
+                        self.expectation_context.root_directory, "statistics"
+                    )
+                )
+                if statistics_cache
+                else None
+            )
+            self.plan_cache = (
+                PlanCache(get_plans_directory(self.expectation_context))
+                if compiled_plans
+                else None
+            )
+            if conversion_cache and not parquet_engine_available():
+                self.logger.warning(
+                    "conversion_cache requires pyarrow or fastparquet to write "
+                    "parquet copies, DataSets are parsed from their files instead"
+                )
+            elif conversion_cache:
+                self.conversion_cache = ConversionCache(
+                    get_kedro_great_directory(
+                        self.expectation_context.root_directory, "converted"
+                    ),
+                    DEFAULT_MAX_BYTES if conversion_cache is True else conversion_cache,
+                )
+            if record_runs:
+                self._recorder = RunRecorder(
+                    get_recordings_directory(self.expectation_context),
+                    options,
+                    record_sample_rows,
+                )
+            if adaptive_scheduling:
+                self._timing_history = TimingHistory(
+                    get_timings_path(self.expectation_context)
+                )
+            if use_daemon or daemon_socket is not None:
+                self._daemon_client = DaemonClient(
+                    daemon_socket or get_daemon_socket_path(self.expectation_context)
+                )
         except ConfigNotFoundError:
             self.logger.error(
                 "Great Expectations has not been initialized. "
@@ -66,77 +358,932 @@ class KedroGreat:
             )
             self.expectation_context = None
 
+    def with_options(self, **options: Any) -> "KedroGreat":
+        """
+        Builds a new hook with the options of this one, overridden by the given ones.
+        """
+        return KedroGreat(**{**self._options, **options})
+
+    def _get_expectation_context(self) -> ge.data_context.DataContext:
+        # DataContext is not thread safe, so each runner thread gets its own
+        context = getattr(self._thread_state, "expectation_context", None)
+        if context is None:
+            with _yaml_lock:
+                context = _ThreadDataContext(self.expectation_context.root_directory)
+            self._thread_state.expectation_context = context
+        return context
+
+    def _get_expectation_suite(self, suite_name: str):
+        expectation_context = self._get_expectation_context()
+        if self._suite_cache is None:
+            return expectation_context.get_expectation_suite(suite_name)
+
+        # Long lived hooks keep parsed suites, re-reading them only once edited
+        suite_path = os.path.join(
+            expectation_context.root_directory,
+            "expectations",
+            *suite_name.split("."),
+        ) + ".json"
+        modified = os.path.getmtime(suite_path) if os.path.exists(suite_path) else None
+        with self._suites_lock:
+            cached = self._suite_cache.get(suite_name)
+        if cached is not None and cached[0] == modified:
+            return cached[1]
+        suite = expectation_context.get_expectation_suite(suite_name)
+        with self._suites_lock:
+            self._suite_cache[suite_name] = (modified, suite)
+        return suite
+
+    def _claim_suite(self, suite_name: str) -> bool:
+        with self._suites_lock:
+            if suite_name in self._finished_suites:
+                return False
+            self._finished_suites.add(suite_name)
+            return True
+
+    def _release_suites(self, suite_names: Iterable[str]) -> None:
+        """
+        Suites skipped for a budget were not validated, so another load of the
+        dataset may still claim them.
+        """
+        with self._suites_lock:
+            self._finished_suites.difference_update(suite_names)
+
+    def _current_report(self) -> ValidationReport:
+        return getattr(self._thread_state, "report", None) or self._report
+
+    @contextmanager
+    def capture_report(self) -> Iterator[ValidationReport]:
+        """
+        Records what the validations of the calling thread report, and the
+        spans they trace, in a report of their own rather than the run's.
+        """
+        report = ValidationReport()
+        self._thread_state.report = report
+        try:
+            yield report
+        finally:
+            self._thread_state.report = None
+            report.trace_events = self._tracer.pop_thread_events(threading.get_ident())
+
+    def merge_report(self, report: ValidationReport) -> None:
+        with self._suites_lock:
+            self._current_report().merge(report)
+        self._release_suites(skipped.suite for skipped in report.skipped)
+        self._tracer.add_events(report.trace_events)
+
+    def _record_failed_suite(self, failed_suite: FailedSuite) -> None:
+        with self._suites_lock:
+            self._current_report().failed.append(failed_suite)
+
+    def _record_skipped_suite(self, skipped_suite: SkippedSuite) -> None:
+        self.logger.warning(
+            f"Skipped Suite {skipped_suite.suite} for DataSet {skipped_suite.dataset}: "
+            f"{skipped_suite.reason}"
+        )
+        with self._suites_lock:
+            self._current_report().skipped.append(skipped_suite)
+        self._release_suites([skipped_suite.suite])
+
+    def _record_sampled_suite(self, sampled_suite: SampledSuite) -> None:
+        self.logger.info(
+            f"Sampling {sampled_suite.rows} rows for Suite {sampled_suite.suite} "
+            f"on DataSet {sampled_suite.dataset} to fit its budget"
+        )
+        with self._suites_lock:
+            self._current_report().sampled.append(sampled_suite)
+
+    def _record_validation_summary(self, summary: ValidationSummary) -> None:
+        with self._suites_lock:
+            report = self._current_report()
+            report.totals.add(summary)
+            if not summary.success:
+                report.summaries.append(summary)
+
+    def _record_memory_usage(self, memory_usage: SuiteMemoryUsage) -> None:
+        self.logger.debug(
+            f"Suite {memory_usage.suite} for DataSet {memory_usage.dataset} used "
+            f"{memory_usage.rss_delta} bytes RSS, "
+            f"{memory_usage.allocation_peak} bytes peak allocations"
+        )
+        with self._suites_lock:
+            self._current_report().memory.append(memory_usage)
+
+    def _record_suite_timing(
+        self, dataset_name: str, suite_name: str, seconds: float, rows: Optional[int]
+    ) -> None:
+        predicted_seconds = self._timing_history.predict(dataset_name, suite_name, rows)
+        self._timing_history.record(dataset_name, suite_name, seconds, rows)
+        if (
+            predicted_seconds is not None
+            and seconds >= MIN_REGRESSION_SECONDS
+            and seconds > predicted_seconds * self._regression_threshold
+        ):
+            self.logger.warning(
+                f"Suite {suite_name} for DataSet {dataset_name} took {seconds:.2f}s, "
+                f"predicted {predicted_seconds:.2f}s from previous runs"
+            )
+            with self._suites_lock:
+                self._current_report().regressions.append(
+                    TimingRegression(suite_name, dataset_name, seconds, predicted_seconds)
+                )
+
+    def save_timings(self) -> None:
+        if self._timing_history is not None:
+            self._timing_history.save()
+
+    def order_suites(
+        self,
+        dataset_name: str,
+        suite_names: List[str],
+        stop_on_failure: bool = False,
+        rows: Optional[int] = None,
+    ) -> List[str]:
+        """
+        Orders suites by priority. When stopping on the first failure and
+        timings from previous runs are known, cheaper suites of the same
+        priority run first, so failures are found sooner.
+        """
+        if stop_on_failure and self._timing_history is not None:
+            return order_suites_by_cost(
+                self._timing_history,
+                dataset_name,
+                suite_names,
+                self.suite_priorities,
+                rows,
+            )
+        return order_suites_by_priority(self.suite_priorities, suite_names)
+
+    def _is_critical_suite(self, suite_name: str) -> bool:
+        priority = get_suite_priority(
+            self.suite_priorities, suite_name, KedroGreat.CRITICAL_PRIORITY + 1
+        )
+        return priority <= KedroGreat.CRITICAL_PRIORITY
+
+    def run_report(self) -> Dict[str, Any]:
+        with self._suites_lock:
+            return {
+                "finished": sorted(self._finished_suites),
+                "failed": list(self._report.failed),
+                "skipped": list(self._report.skipped),
+                "sampled": list(self._report.sampled),
+                "memory": list(self._report.memory),
+                "regressions": list(self._report.regressions),
+                "totals": self._report.totals.to_dict(),
+                "summaries": list(self._report.summaries),
+                "failing_rows": list(self._report.failing_rows),
+            }
+
     @hook_impl
     def after_pipeline_run(self, run_params, pipeline, catalog):
-        if self._fail_after_pipeline_run and len(self._failed_suites) > 0:
+        self._finish_run(run_params)
+
+        report = self.run_report()
+        if report["skipped"] or report["sampled"]:
+            self.logger.warning(
+                f"Skipped {len(report['skipped'])} and sampled {len(report['sampled'])} "
+                f"suites to stay within budget: {report['skipped'] + report['sampled']}"
+            )
+        measured = [m for m in report["memory"] if m.rss_delta is not None]
+        if measured:
+            peak = max(measured, key=lambda m: m.rss_delta)
+            self.logger.info(
+                f"Largest memory increase was {peak.rss_delta} bytes "
+                f"validating suite {peak.suite} for DataSet {peak.dataset}"
+            )
+        failed_suites = report["failed"]
+        if self._fail_after_pipeline_run and len(failed_suites) > 0:
             raise SuiteValidationFailure(
-                f"Failed {len(self._failed_suites)} suites: {self._failed_suites}"
+                f"Failed {len(failed_suites)} suites: {failed_suites}"
+            )
+
+    @hook_impl
+    def on_pipeline_error(self, error, run_params, pipeline, catalog):
+        # The trace and timings of a failed run are the ones most worth keeping
+        self._finish_run(run_params)
+
+    def _finish_run(self, run_params: Dict[str, Any]) -> None:
+        if self._tracer.enabled and self.expectation_context is not None:
+            trace_path = self._tracer.write(
+                get_kedro_great_directory(
+                    self.expectation_context.root_directory,
+                    "traces",
+                    f"{run_params.get('run_id', 'run')}.json",
+                )
             )
+            if trace_path:
+                self.logger.info(f"Wrote validation trace to {trace_path}")
+
+        self.save_timings()
+        self.close_backends()
 
     @hook_impl
     def before_node_run(
-        self, catalog: DataCatalog, inputs: Dict[str, Any], run_id: str
+        self, node: Node, catalog: DataCatalog, inputs: Dict[str, Any], run_id: str
     ) -> None:
-        if self._before_node_run:
-            self._run_validation(catalog, inputs, run_id, read_from_catalog=True)
+        with self._tracer.span("before_node_run", node=node.name):
+            if self._before_node_run:
+                self._run_validation(catalog, inputs, run_id, read_from_catalog=True)
+        self._node_started_at[(node.name, threading.get_ident())] = self._tracer.now()
 
     @hook_impl
     def after_node_run(
-        self, catalog: DataCatalog, outputs: Dict[str, Any], run_id: str
+        self, node: Node, catalog: DataCatalog, outputs: Dict[str, Any], run_id: str
     ) -> None:
-        if self._after_node_run:
-            self._run_validation(catalog, outputs, run_id, read_from_catalog=False)
+        started_at = self._node_started_at.pop((node.name, threading.get_ident()), None)
+        if started_at is not None:
+            self._tracer.add_span("node", started_at, self._tracer.now(), node=node.name)
+        with self._tracer.span("after_node_run", node=node.name):
+            if self._after_node_run:
+                self._run_validation(catalog, outputs, run_id, read_from_catalog=False)
+
+    @hook_impl
+    def on_node_error(self, error, node: Node, catalog, inputs, is_async, run_id):
+        started_at = self._node_started_at.pop((node.name, threading.get_ident()), None)
+        if started_at is not None:
+            self._tracer.add_span(
+                "node",
+                started_at,
+                self._tracer.now(),
+                node=node.name,
+                error=type(error).__name__,
+            )
 
     def _run_validation(self, catalog: DataCatalog, data: Dict[str, Any], run_id: str, read_from_catalog: bool):
         if self.expectation_context is None:
             return
 
         for dataset_name, dataset_value in data.items():
-            ran_suite_for_dataset = False
+            dataset = catalog._get_dataset(dataset_name)
+            try:
+                with self._tracer.span("_run_validation", dataset=dataset_name):
+                    self._validate_dataset(
+                        dataset_name, dataset, dataset_value, run_id, read_from_catalog
+                    )
+            except UnsupportedDataSet:
+                self.logger.warning(
+                    f"Unsupported DataSet Type: {dataset_name}({type(dataset)})"
+                )
 
-            target_suite_names = get_suite_names(
-                self.expectations_map, dataset_name, self.suite_types
+    def _validate_dataset(
+        self,
+        dataset_name: str,
+        dataset: AbstractDataSet,
+        dataset_value: Any,
+        run_id: str,
+        read_from_catalog: bool,
+    ):
+        if self._fail_fast and self._failure_known.is_set():
+            # Another runner thread already failed the run
+            return
+        target_suite_names = get_suite_names(
+            self.expectations_map, dataset_name, self.suite_types
+        )
+        target_suite_names = [
+            suite_name
+            for suite_name in self.order_suites(
+                dataset_name,
+                target_suite_names,
+                self._fail_fast,
+                frame_rows(dataset_value),
             )
+            if suite_name in self.expectation_suite_names
+            and self._claim_suite(suite_name)
+        ]
+        if not target_suite_names:
+            self.logger.warning(f"Missing Expectation Suite for DataSet: {dataset_name}")
+            return
 
-            dataset = catalog._get_dataset(dataset_name)
-            dataset_path = getattr(dataset, "_filepath", None)
-            if read_from_catalog:
-                df = dataset_value if isinstance(dataset, MemoryDataSet) else dataset.load()
-            else:
-                df = dataset_value
+        results = self.validate_dataset(
+            dataset_name,
+            dataset,
+            dataset_value,
+            run_id,
+            read_from_catalog,
+            target_suite_names,
+        )
+        for suite_name, success in results.items():
+            self._handle_validation_result(dataset_name, suite_name, success)
 
-            try:
-                for target_suite_name in target_suite_names:
-                    if (
-                        target_suite_name not in self.expectation_suite_names
-                        or target_suite_name in self._finished_suites
-                    ):
-                        continue
-
-                    validation = self._run_suite(
-                        dataset_name, dataset_path, df, target_suite_name, run_id
+    def validate_dataset(
+        self,
+        dataset_name: str,
+        dataset: AbstractDataSet,
+        dataset_value: Any,
+        run_id: str,
+        read_from_catalog: bool,
+        target_suite_names: List[str],
+        stop_on_failure: Optional[bool] = None,
+    ) -> Dict[str, bool]:
+        """
+        Validates the dataset against the given suites, in order, through the
+        schema pre-flight, the validation daemon, the backends and Great
+        Expectations, as configured. Failures are recorded, not raised.
+        Returns the success of every suite validated.
+        """
+        if stop_on_failure is None:
+            stop_on_failure = self._fail_fast
+        dataset_path = getattr(dataset, "_filepath", None)
+        from_file = read_from_catalog and not isinstance(dataset, MemoryDataSet)
+        results = {}
+
+        def done() -> bool:
+            return not target_suite_names or (
+                stop_on_failure and not all(results.values())
+            )
+
+        if self._schema_preflight and from_file:
+            results.update(
+                self._run_schema_preflight(
+                    dataset_name,
+                    dataset,
+                    dataset_path,
+                    target_suite_names,
+                    run_id,
+                    stop_on_failure,
+                )
+            )
+            target_suite_names = [n for n in target_suite_names if n not in results]
+            if not self._full_validation_after_preflight or done():
+                return results
+
+        if self._daemon_client is not None:
+            response = self._daemon_client.validate(
+                dataset_name,
+                target_suite_names,
+                run_id,
+                df=None if from_file else dataset_value,
+                fail_fast=stop_on_failure,
+            )
+            if response is not None:
+                daemon_results, report = response
+                self.merge_report(ValidationReport.from_dict(report))
+                results.update(daemon_results)
+                return results
+
+        backend = self._get_backend(
+            dataset_name, dataset, None if from_file else dataset_value
+        )
+        if backend is not None:
+            results.update(
+                self._run_backend(
+                    backend,
+                    dataset_name,
+                    dataset,
+                    dataset_path,
+                    None if from_file else dataset_value,
+                    target_suite_names,
+                    run_id,
+                )
+            )
+            target_suite_names = [n for n in target_suite_names if n not in results]
+            if done():
+                return results
+
+        resolvers = []
+        statistics = None
+        if self._statistics_cache is not None and from_file:
+            statistics = self._statistics_cache.load(dataset_name, dataset)
+            if statistics is not None:
+                resolvers.append(make_statistics_resolver(statistics))
+
+        if from_file and self._can_resolve_all(target_suite_names, resolvers):
+            # Every expectation is answered from cached statistics,
+            # so an empty frame with the right columns stands in for the data
+            schema_frame = read_schema_frame(dataset)
+            df = schema_frame.frame if schema_frame is not None else None
+        else:
+            df = None if from_file else dataset_value
+        if df is None:
+            with self._tracer.span("load", dataset=dataset_name) as span_args:
+                df = self.load_dataset(dataset)
+                span_args.update(describe_frame(df))
+
+        if self._statistics_cache is not None and from_file and statistics is None:
+            self._statistics_cache.save_frame(dataset_name, dataset, df)
+
+        results.update(
+            self.run_suites(
+                dataset_name,
+                dataset_path,
+                df,
+                target_suite_names,
+                run_id,
+                stop_on_failure=stop_on_failure,
+                resolvers=resolvers,
+            )
+        )
+        return results
+
+    def load_dataset(self, dataset: AbstractDataSet) -> Any:
+        """
+        Loads the dataset for validation, from its parquet copy
+        when the conversion cache is enabled and supports it.
+        """
+        if self.conversion_cache is not None:
+            return self.conversion_cache.load(dataset)
+        return dataset.load()
+
+    def run_suites(
+        self,
+        dataset_name: str,
+        dataset_path: Optional[str],
+        df: Any,
+        suite_names: List[str],
+        run_id: str,
+        stop_on_failure: bool = False,
+        resolvers: Optional[List] = None,
+    ) -> Dict[str, bool]:
+        """
+        Runs the suites against an already loaded frame, in order, within the
+        dataset budgets. Returns the success of each suite that was run.
+        """
+        resolvers = resolvers or []
+        results = {}
+        started_at = time.perf_counter()
+        source_df = df
+        if self.plan_cache is not None:
+            # Projected once for all suites, rather than copied for each of them
+            expectation_context = self._get_expectation_context()
+            df = project_frame(
+                df,
+                get_plans_columns(
+                    [
+                        self.plan_cache.get(expectation_context, suite_name)
+                        for suite_name in suite_names
+                    ]
+                ),
+            )
+        # Memos are only valid for a single frame, so sampled frames get their own
+        frames = {None: df}
+        memos = {}
+        fitted_rows_by_budget = {}
+        # Estimated once, a deep memory usage walks every object value
+        frame_memory = None
+        if self._memory_ceiling is not None or any(
+            resolve_budget(self.validation_budgets, dataset_name, suite_name).max_memory
+            is not None
+            for suite_name in suite_names
+            if not self._is_critical_suite(suite_name)
+        ):
+            frame_memory = estimate_memory(df)
+        suite_seconds = {}
+        suite_rows = {}
+
+        for target_suite_name in suite_names:
+            budget = resolve_budget(
+                self.validation_budgets, dataset_name, target_suite_name
+            )
+            critical = self._is_critical_suite(target_suite_name)
+            elapsed = time.perf_counter() - started_at
+            if (
+                not critical
+                and budget.max_seconds is not None
+                and elapsed >= budget.max_seconds
+            ):
+                self._record_skipped_suite(
+                    SkippedSuite(
+                        target_suite_name,
+                        dataset_name,
+                        f"time budget of {budget.max_seconds}s exhausted",
                     )
+                )
+                continue
 
-                    if self._fail_fast and not validation.success:
-                        raise SuiteValidationFailure(
-                            f"Suite {target_suite_name} for DataSet {dataset_name} failed!"
-                        )
-                    elif not validation.success:
-                        self._failed_suites.append(
-                            FailedSuite(target_suite_name, dataset_name)
+            fitted_rows = None
+            if not critical:
+                if budget not in fitted_rows_by_budget:
+                    fitted_rows_by_budget[budget] = fit_rows_to_budget(
+                        df, budget, frame_memory
+                    )
+                fitted_rows = fitted_rows_by_budget[budget]
+            if self._memory_ceiling is not None and not critical:
+                # Critical suites are never sampled, a sample could pass bad data
+                memory_fitted_rows = fit_rows_to_memory_ceiling(
+                    df, self._memory_ceiling, frame_memory
+                )
+                if memory_fitted_rows is not None and not memory_fitted_rows[0]:
+                    self._record_skipped_suite(
+                        SkippedSuite(
+                            target_suite_name,
+                            dataset_name,
+                            f"memory ceiling of {self._memory_ceiling} bytes reached",
                         )
+                    )
+                    continue
+                if memory_fitted_rows is not None and (
+                    fitted_rows is None or memory_fitted_rows[0] < fitted_rows[0]
+                ):
+                    fitted_rows = memory_fitted_rows
 
-                    self._finished_suites.add(target_suite_name)
-                    ran_suite_for_dataset = True
+            sample_rows = None
+            if fitted_rows is not None:
+                sample_rows, total_rows = fitted_rows
+                if sample_rows not in frames:
+                    frames[sample_rows] = sample_frame(df, sample_rows, total_rows)
+                self._record_sampled_suite(
+                    SampledSuite(target_suite_name, dataset_name, sample_rows)
+                )
 
-                if not ran_suite_for_dataset:
-                    self.logger.warning(
-                        f"Missing Expectation Suite for DataSet: {dataset_name}"
+            if sample_rows not in memos and (
+                self._memoize_expectations
+                or stop_on_failure
+                or resolvers
+                or self._approximation_config is not None
+            ):
+                frame_resolvers = list(resolvers)
+                if self._approximation_config is not None:
+                    frame_resolvers.append(
+                        make_sketch_resolver(
+                            frames[sample_rows], self._approximation_config
+                        )
                     )
-            except UnsupportedDataSet:
+                memos[sample_rows] = ExpectationMemo(frame_resolvers)
+
+            suite_started_at = time.perf_counter()
+            memory = MemoryTracker(self._trace_allocations)
+            with memory.track() if self._track_memory else nullcontext():
+                validation = self._run_suite(
+                    dataset_name,
+                    dataset_path,
+                    frames[sample_rows],
+                    target_suite_name,
+                    run_id,
+                    memo=memos.get(sample_rows),
+                    short_circuit=stop_on_failure,
+                )
+                summary = summarize_validation(
+                    dataset_name, target_suite_name, run_id, validation
+                )
+                failed_expectations = (
+                    get_failed_expectations(validation)
+                    if self._max_failing_rows and not summary.success
+                    else []
+                )
+                evaluation_parameters = (
+                    get_evaluation_parameters(validation) if failed_expectations else {}
+                )
+                # Only the summary is kept, so the full result can be released
+                del validation
+                if failed_expectations:
+                    # The rows are reported with every column, not only those the plans kept
+                    failing_frame = frames[sample_rows]
+                    if source_df is not df:
+                        failing_frame = (
+                            source_df
+                            if sample_rows is None
+                            else sample_frame(source_df, *fitted_rows)
+                        )
+                    self._extract_failing_rows(
+                        dataset_name,
+                        target_suite_name,
+                        run_id,
+                        failing_frame,
+                        failed_expectations,
+                        evaluation_parameters,
+                    )
+                results[target_suite_name] = summary.success
+                self._record_validation_summary(summary)
+                if self._memory_ceiling is not None:
+                    gc.collect()
+            suite_seconds[target_suite_name] = time.perf_counter() - suite_started_at
+            suite_rows[target_suite_name] = frame_rows(frames[sample_rows])
+            if self._timing_history is not None:
+                self._record_suite_timing(
+                    dataset_name,
+                    target_suite_name,
+                    suite_seconds[target_suite_name],
+                    suite_rows[target_suite_name],
+                )
+            if self._track_memory:
+                self._record_memory_usage(
+                    SuiteMemoryUsage(
+                        target_suite_name,
+                        dataset_name,
+                        memory.rss_delta,
+                        memory.allocation_peak,
+                    )
+                )
+            if stop_on_failure and not results[target_suite_name]:
+                break
+
+        if self._recorder is not None and suite_seconds:
+            self._recorder.record(
+                run_id, dataset_name, dataset_path, source_df, suite_seconds, suite_rows
+            )
+
+        memo_hits = sum(memo.hits for memo in memos.values())
+        if memo_hits:
+            self.logger.debug(
+                f"Reused {memo_hits} expectation results for DataSet: {dataset_name}"
+            )
+        memo_resolved = sum(memo.resolved for memo in memos.values())
+        if memo_resolved:
+            self.logger.debug(
+                f"Answered {memo_resolved} expectations from cached statistics "
+                f"or sketches for DataSet: {dataset_name}"
+            )
+        return results
+
+    def _get_backend(
+        self, dataset_name: str, dataset: AbstractDataSet, df: Any = None
+    ) -> Optional[ValidationBackend]:
+        backend_name = self.backends.get(
+            dataset_name, self.backends.get(type(dataset).__name__)
+        )
+        if backend_name is None and (is_dask_dataset(dataset) or is_dask_frame(df)):
+            # Great Expectations cannot validate dask frames at all
+            backend_name = "dask"
+        with self._backends_lock:
+            if backend_name not in self._backend_instances:
+                self._backend_instances[backend_name] = get_backend(backend_name)
+            return self._backend_instances[backend_name]
+
+    def close_backends(self) -> None:
+        """
+        Closes the backends used so far, releasing e.g. their clusters.
+        """
+        with self._backends_lock:
+            backends = [b for b in self._backend_instances.values() if b is not None]
+            self._backend_instances.clear()
+        for backend in backends:
+            backend.close()
+
+    def _run_backend(
+        self,
+        backend: ValidationBackend,
+        dataset_name: str,
+        dataset: AbstractDataSet,
+        dataset_path: Optional[str],
+        df: Any,
+        target_suite_names: List[str],
+        run_id: str,
+    ) -> Dict[str, bool]:
+        """
+        Validates the suites the backend supports in a single pass.
+        Returns their results, the other suites are left to Great Expectations.
+        """
+        if not backend.can_validate(dataset, df):
+            return {}
+
+        batch_kwargs = self._build_batch_kwargs(dataset_name, dataset_path, df)
+        with self._tracer.span(
+            f"{backend.name} backend", dataset=dataset_name, **describe_frame(df)
+        ):
+            validations = backend.validate_suites(
+                dataset,
+                df,
+                [self._get_expectation_suite(name) for name in target_suite_names],
+                run_id,
+                batch_kwargs,
+            )
+        remaining_suite_names = [n for n in target_suite_names if n not in validations]
+        results = {}
+        for suite_name in target_suite_names:
+            validation = validations.pop(suite_name, None)
+            if validation is None:
+                continue
+            summary = self._record_validation_result(
+                dataset_name, suite_name, validation, batch_kwargs, run_id
+            )
+            del validation
+            results[suite_name] = summary.success
+
+        if remaining_suite_names:
+            self.logger.info(
+                f"The {backend.name} backend does not support every expectation of "
+                f"{remaining_suite_names}, validating them with Great Expectations"
+            )
+        return results
+
+    def _record_validation_result(
+        self,
+        dataset_name: str,
+        suite_name: str,
+        validation: Any,
+        batch_kwargs: Dict,
+        run_id: str,
+    ) -> ValidationSummary:
+        """
+        Stores and summarizes a validation made outside of the validation operator.
+        """
+        self._run_validation_actions(suite_name, validation, batch_kwargs, run_id)
+        summary = summarize_validation(dataset_name, suite_name, run_id, validation)
+        self._record_validation_summary(summary)
+        return summary
+
+    def _run_validation_actions(
+        self,
+        suite_name: str,
+        validation: Any,
+        batch_kwargs: Dict,
+        run_id: str,
+        data_asset: Any = None,
+    ) -> None:
+        """
+        Runs the actions of the validation operator, e.g. storing the result,
+        updating data docs or sending notifications, on a validation made
+        outside of it, like the operator would have.
+        """
+        from great_expectations.data_context.types.resource_identifiers import (
+            ExpectationSuiteIdentifier,
+            ValidationResultIdentifier,
+        )
+
+        expectation_context = self._get_expectation_context()
+        identifier = ValidationResultIdentifier(
+            expectation_suite_identifier=ExpectationSuiteIdentifier(suite_name),
+            run_id=get_run_identifier(run_id),
+            batch_identifier=BatchKwargs(batch_kwargs).to_id(),
+        )
+        operator = expectation_context.validation_operators.get(VALIDATION_OPERATOR_NAME)
+        try:
+            if operator is None:
+                expectation_context.validations_store.set(identifier, validation)
+                return
+            actions_results = {}
+            for action in operator.action_list:
+                action_result = operator.actions[action["name"]].run(
+                    validation_result_suite_identifier=identifier,
+                    validation_result_suite=validation,
+                    data_asset=data_asset,
+                    payload=actions_results,
+                )
+                actions_results[action["name"]] = action_result or {}
+                actions_results[action["name"]]["class"] = action["action"]["class_name"]
+        except Exception as e:  # pylint: disable=broad-except
+            self.logger.warning(
+                f"Could not run the validation actions of Suite {suite_name}: {e}"
+            )
+
+    def _extract_failing_rows(
+        self,
+        dataset_name: str,
+        suite_name: str,
+        run_id: str,
+        df: Any,
+        failed_expectations: List,
+        evaluation_parameters: Dict[str, Any],
+    ) -> None:
+        with self._tracer.span(
+            "_extract_failing_rows", dataset=dataset_name, suite=suite_name
+        ):
+            rows = find_failing_rows(
+                df, failed_expectations, self._max_failing_rows, evaluation_parameters
+            )
+            if rows is None:
+                return
+            store_backend = self._get_expectation_context().validations_store.store_backend
+            validations_directory = getattr(
+                store_backend,
+                "full_base_directory",
+                get_kedro_great_directory(
+                    self.expectation_context.root_directory, "failing_rows"
+                ),
+            )
+            # Without a parquet engine, the rows are written as CSV instead
+            file_format = "parquet" if parquet_engine_available() else "csv"
+            path = get_failing_rows_path(
+                validations_directory, suite_name, run_id, dataset_name, file_format
+            )
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                if file_format == "parquet":
+                    rows.to_parquet(path)
+                else:
+                    rows.to_csv(path)
+            except Exception as e:  # pylint: disable=broad-except
                 self.logger.warning(
-                    f"Unsupported DataSet Type: {dataset_name}({type(dataset)})"
+                    f"Could not write the failing rows of Suite {suite_name}: {e}"
+                )
+                return
+        self.logger.info(
+            f"Wrote {len(rows)} failing rows of Suite {suite_name} "
+            f"for DataSet {dataset_name} to {path}"
+        )
+        with self._suites_lock:
+            self._current_report().failing_rows.append(
+                FailingRows(suite_name, dataset_name, path, len(rows))
+            )
+
+    def _can_resolve_all(self, suite_names: List[str], resolvers: List) -> bool:
+        if not resolvers:
+            return False
+        memo = ExpectationMemo(resolvers)
+        return all(
+            memo.can_resolve(e.expectation_type, e.kwargs)
+            for suite_name in suite_names
+            for e in self._get_expectation_suite(suite_name).expectations
+        )
+
+    def _handle_validation_result(
+        self, dataset_name: str, suite_name: str, success: bool
+    ) -> None:
+        if self._fail_fast and not success:
+            self._failure_known.set()
+            raise SuiteValidationFailure(
+                f"Suite {suite_name} for DataSet {dataset_name} failed!"
+            )
+        elif not success:
+            self._record_failed_suite(FailedSuite(suite_name, dataset_name))
+
+    def _run_schema_preflight(
+        self,
+        dataset_name: str,
+        dataset: AbstractDataSet,
+        dataset_path: Optional[str],
+        target_suite_names: List[str],
+        run_id: str,
+        stop_on_failure: bool = False,
+    ) -> Dict[str, bool]:
+        """
+        Checks the schema-level expectations of each suite against the dataset
+        metadata, without loading the data. Failed suites are recorded like any
+        other validation, as are passed ones when no full validation follows.
+        Returns the results recorded, the other suites still need a full validation.
+        """
+        with self._tracer.span("read_schema_frame", dataset=dataset_name):
+            schema_frame = read_schema_frame(dataset)
+        if schema_frame is None:
+            self.logger.debug(f"No schema pre-flight available for DataSet: {dataset_name}")
+            return {}
+
+        batch_kwargs = self._build_batch_kwargs(
+            dataset_name, dataset_path, schema_frame.frame
+        )
+        results = {}
+        for target_suite_name in target_suite_names:
+            schema_suite = build_schema_suite(
+                self._get_expectation_suite(target_suite_name),
+                schema_frame.has_types,
+            )
+            if schema_suite is None:
+                continue
+
+            validation = self._validate_schema(
+                dataset_name, dataset_path, schema_frame, schema_suite, run_id
+            )
+            if validation.success and self._full_validation_after_preflight:
+                continue
+            summary = self._record_validation_result(
+                dataset_name, target_suite_name, validation, batch_kwargs, run_id
+            )
+            results[target_suite_name] = summary.success
+            if not summary.success:
+                self.logger.warning(
+                    f"Suite {target_suite_name} for DataSet {dataset_name} failed schema pre-flight"
                 )
+                if stop_on_failure:
+                    break
+
+        return results
+
+    def _validate_schema(
+        self,
+        dataset_name: str,
+        dataset_path: Optional[str],
+        schema_frame: SchemaFrame,
+        schema_suite: Any,
+        run_id: str,
+    ) -> Any:
+        """
+        Validates a schema suite, a copy, against an empty frame. On pandas frames
+        the column types are checked against the dtypes, since Great Expectations
+        checks the values of object columns, and would pass any type without rows.
+        """
+        results = []
+        if not type(schema_frame.frame).__module__.startswith("pyspark"):
+            results = [
+                check_column_type(schema_frame, e)
+                for e in schema_suite.expectations
+                if e.expectation_type in TYPE_EXPECTATION_TYPES
+            ]
+            schema_suite.expectations = [
+                e
+                for e in schema_suite.expectations
+                if e.expectation_type not in TYPE_EXPECTATION_TYPES
+            ]
+
+        batch = self._build_batch(
+            dataset_name,
+            dataset_path,
+            schema_frame.frame,
+            self._get_expectation_context(),
+        )
+        if schema_suite.expectations:
+            try:
+                v = Validator(batch=batch, expectation_suite=schema_suite)
+            except ValueError:
+                raise UnsupportedDataSet
+            results.extend(v.get_dataset().validate().results)
+
+        return build_suite_validation_result(
+            schema_suite,
+            results,
+            run_id,
+            dict(batch.batch_kwargs),
+            {"schema_preflight": True},
+        )
 
     def _run_suite(
         self,
@@ -145,10 +1292,155 @@ class KedroGreat:
         df: Any,
         target_expectation_suite_name: str,
         run_id: str,
+        memo: Optional[ExpectationMemo] = None,
+        short_circuit: bool = False,
     ):
-        target_suite = self.expectation_context.get_expectation_suite(
-            target_expectation_suite_name
+        with self._tracer.span(
+            "_run_suite",
+            dataset=dataset_name,
+            suite=target_expectation_suite_name,
+            **describe_frame(df),
+        ):
+            expectation_context = self._get_expectation_context()
+            if self.plan_cache is not None:
+                plan = self.plan_cache.get(
+                    expectation_context, target_expectation_suite_name
+                )
+                target_suite = plan.expectation_suite
+                expectation_types = plan.expectation_types
+            else:
+                target_suite = self._get_expectation_suite(target_expectation_suite_name)
+                expectation_types = [e.expectation_type for e in target_suite.expectations]
+            batch = self._build_batch(dataset_name, dataset_path, df, expectation_context)
+
+            with self._tracer.span(
+                "Validator", dataset=dataset_name, suite=target_expectation_suite_name
+            ):
+                try:
+                    v = Validator(batch=batch, expectation_suite=target_suite,)
+                except ValueError:
+                    raise UnsupportedDataSet
+
+                validator_dataset_batch = v.get_dataset()
+            if memo is not None:
+                memo.attach(validator_dataset_batch, expectation_types)
+
+            operator_kwargs = {}
+            result_format = resolve_result_format(
+                self.result_formats, dataset_name, target_expectation_suite_name
+            )
+            if result_format is None and self._max_failing_rows:
+                # Failing rows are extracted in a second pass, so none are collected here.
+                # Not BOOLEAN_ONLY, which fails expect_column_values_to_not_be_null
+                result_format = "BASIC"
+            # Always passed explicitly, so the short circuit pass and the validation
+            # operator call the expectations with the same kwargs and share the memo
+            operator_kwargs["result_format"] = (
+                {"result_format": result_format}
+                if result_format is not None
+                else parse_result_format(OPERATOR_RESULT_FORMAT)
+            )
+
+            if short_circuit:
+                with self._tracer.span(
+                    "short_circuit",
+                    dataset=dataset_name,
+                    suite=target_expectation_suite_name,
+                ):
+                    evaluated_results = self._evaluate_until_failure(
+                        validator_dataset_batch,
+                        target_suite,
+                        operator_kwargs["result_format"],
+                        run_id,
+                    )
+                if evaluated_results is not None:
+                    validation = build_suite_validation_result(
+                        target_suite,
+                        evaluated_results,
+                        run_id,
+                        dict(batch.batch_kwargs),
+                        {"short_circuit": True},
+                    )
+                    self._run_validation_actions(
+                        target_expectation_suite_name,
+                        validation,
+                        batch.batch_kwargs,
+                        run_id,
+                        validator_dataset_batch,
+                    )
+                    return validation
+
+            with self._tracer.span(
+                "run_validation_operator",
+                dataset=dataset_name,
+                suite=target_expectation_suite_name,
+            ):
+                validation = expectation_context.run_validation_operator(
+                    VALIDATION_OPERATOR_NAME,
+                    [validator_dataset_batch],
+                    run_id=run_id,
+                    **operator_kwargs,
+                )
+            return validation
+
+    @staticmethod
+    def _evaluate_until_failure(
+        ge_dataset: Any, expectation_suite: Any, result_format: Dict, run_id: Any
+    ) -> Optional[List]:
+        """
+        Evaluates the expectations of the suite cheapest first, until one fails.
+        Returns the results evaluated so far when one failed, or None if all passed.
+        The expectations are called the way `DataAsset.validate` calls them, with the
+        same result format and evaluation parameters, so with a memo attached the
+        results of a passing suite are reused by the full validation.
+        """
+        # Kedro run ids are strings, the parameter store only takes identifiers
+        run_id = get_run_identifier(run_id)
+        data_context = getattr(ge_dataset, "_data_context", None)
+        evaluation_parameters = (
+            data_context.evaluation_parameter_store.get_bind_params(run_id)
+            if data_context is not None
+            else {}
+        )
+        evaluation_parameters.update(expectation_suite.evaluation_parameters or {})
+        evaluation_parameters = recursively_convert_to_json_serializable(
+            evaluation_parameters
         )
+        interactive_evaluation = ge_dataset._config.get("interactive_evaluation", True)
+
+        results = []
+        for e in order_expectations_by_cost(expectation_suite.expectations):
+            expectation_method = getattr(ge_dataset, e.expectation_type, None)
+            if expectation_method is None:
+                # Left for the validation operator to report
+                return None
+            expectation_kwargs = deepcopy(e.kwargs)
+            expectation_kwargs["result_format"] = result_format
+            try:
+                kwargs, _ = build_evaluation_parameters(
+                    expectation_kwargs,
+                    evaluation_parameters,
+                    interactive_evaluation,
+                    data_context,
+                )
+            except Exception:  # pylint: disable=broad-except
+                # e.g. a missing parameter, left for the validation operator to report
+                return None
+            result = expectation_method(
+                catch_exceptions=True, include_config=True, **kwargs
+            )
+            results.append(result)
+            if not result.success:
+                return results
+        return None
+
+    def _build_batch(
+        self,
+        dataset_name: str,
+        dataset_path: Optional[str],
+        df: Any,
+        expectation_context: ge.data_context.DataContext,
+    ) -> Batch:
         batch_markers = BatchMarkers(
             {
                 "ge_load_time": datetime.datetime.now(datetime.timezone.utc).strftime(
@@ -157,28 +1449,34 @@ class KedroGreat:
             }
         )
 
-        batch_kwargs = {"datasource": generate_datasource_name(dataset_name)}
-
-        if dataset_path:
-            dataasset_name, _ = os.path.splitext(os.path.basename(dataset_path))
-            batch_kwargs["path"] = str(dataset_path)
-            batch_kwargs["data_asset_name"] = dataasset_name
-
-        batch = Batch(
+        return Batch(
             "kedro",
-            batch_kwargs=BatchKwargs(batch_kwargs),
+            batch_kwargs=BatchKwargs(
+                self._build_batch_kwargs(dataset_name, dataset_path, df)
+            ),
             data=df,
             batch_parameters=None,
             batch_markers=batch_markers,
-            data_context=self.expectation_context,
+            data_context=expectation_context,
         )
 
-        try:
-            v = Validator(batch=batch, expectation_suite=target_suite,)
-        except ValueError:
-            raise UnsupportedDataSet
-
-        validator_dataset_batch = v.get_dataset()
-        return self.expectation_context.run_validation_operator(
-            "action_list_operator", [validator_dataset_batch], run_id=run_id
+    def _build_batch_kwargs(
+        self, dataset_name: str, dataset_path: Optional[str], df: Any = None
+    ) -> Dict[str, str]:
+        datasource_type = (
+            DatasourceTypes.SPARK
+            if type(df).__module__.startswith("pyspark")
+            else DatasourceTypes.PANDAS
         )
+        batch_kwargs = {
+            "datasource": find_datasource_name(
+                dataset_name, datasource_type, dataset_path, self._datasource_names
+            )
+        }
+
+        if dataset_path:
+            dataasset_name, _ = os.path.splitext(os.path.basename(dataset_path))
+            batch_kwargs["path"] = str(dataset_path)
+            batch_kwargs["data_asset_name"] = dataasset_name
+
+        return batch_kwargs
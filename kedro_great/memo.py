@@ -0,0 +1,78 @@
+import json
+from copy import deepcopy
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+def _expectation_key(expectation_type: str, kwargs: Dict[str, Any]) -> Tuple[str, str]:
+    return expectation_type, json.dumps(kwargs, sort_keys=True, default=str)
+
+
+class ExpectationMemo:
+    """
+    Caches expectation results for a single in-memory frame, so identical
+    expectations (same type and kwargs) shared by several suites are only
+    evaluated once.
+
+    Resolvers are consulted before evaluating an expectation, and may answer it
+    without touching the data by returning a result instead of None.
+    """
+
+    def __init__(self, resolvers: Optional[List[Callable]] = None):
+        self._results = {}
+        self.resolvers = resolvers or []
+        self.hits = 0
+        self.misses = 0
+        self.resolved = 0
+
+    def can_resolve(self, expectation_type: str, kwargs: Dict[str, Any]) -> bool:
+        return any(
+            resolver(expectation_type, kwargs) is not None for resolver in self.resolvers
+        )
+
+    def _resolve(self, expectation_type: str, kwargs: Dict[str, Any]) -> Any:
+        for resolver in self.resolvers:
+            result = resolver(expectation_type, kwargs)
+            if result is not None:
+                return result
+        return None
+
+    def __contains__(self, key: Tuple[str, str]) -> bool:
+        return key in self._results
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def get(self, expectation_type: str, kwargs: Dict[str, Any]) -> Any:
+        result = self._results.get(_expectation_key(expectation_type, kwargs))
+        return None if result is None else deepcopy(result)
+
+    def put(self, expectation_type: str, kwargs: Dict[str, Any], result: Any) -> None:
+        self._results[_expectation_key(expectation_type, kwargs)] = deepcopy(result)
+
+    def _wrap(self, expectation_type: str, method: Callable) -> Callable:
+        def memoized(**kwargs):
+            key = _expectation_key(expectation_type, kwargs)
+            if key in self._results:
+                self.hits += 1
+                return deepcopy(self._results[key])
+            result = self._resolve(expectation_type, kwargs)
+            if result is not None:
+                self.resolved += 1
+            else:
+                self.misses += 1
+                result = method(**kwargs)
+            self._results[key] = deepcopy(result)
+            return result
+
+        return memoized
+
+    def attach(self, ge_dataset: Any, expectation_types: Iterable[str]) -> None:
+        """
+        Shadow the expectation methods of a Great Expectations dataset with
+        memoized versions. Only the instance is touched, never its class.
+        """
+        for expectation_type in set(expectation_types):
+            method = getattr(ge_dataset, expectation_type, None)
+            if method is None:
+                continue
+            setattr(ge_dataset, expectation_type, self._wrap(expectation_type, method))
@@ -0,0 +1,120 @@
+import os
+import threading
+import tracemalloc
+from contextlib import contextmanager
+from typing import Any, Iterator, NamedTuple, Optional, Tuple
+
+from .budget import count_rows, estimate_memory
+
+# Great Expectations wraps the frame in its own dataset, and keeps results
+# alongside it, so a validation needs a multiple of the frame size
+VALIDATION_MEMORY_FACTOR = 2.0
+# Smaller samples say too little about the data to be worth validating
+MIN_SAMPLE_ROWS = 1_000
+
+
+class SuiteMemoryUsage(NamedTuple):
+    suite: str
+    dataset: str
+    rss_delta: Optional[int]
+    allocation_peak: Optional[int]
+
+
+def current_rss() -> Optional[int]:
+    """
+    The resident set size of this process in bytes,
+    or None if it cannot be measured on this platform.
+    """
+    try:
+        import psutil
+
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        pass
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+# tracemalloc is process wide, so the trackers of concurrent suites share it.
+# It is started by the first of them, and stopped once the last one is done.
+_tracing_lock = threading.Lock()
+_tracing_users = 0
+_started_tracing = False
+
+
+def _acquire_tracing() -> None:
+    global _tracing_users, _started_tracing
+    with _tracing_lock:
+        if _tracing_users == 0:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                _started_tracing = True
+            elif hasattr(tracemalloc, "reset_peak"):
+                tracemalloc.reset_peak()
+        _tracing_users += 1
+
+
+def _release_tracing() -> Optional[int]:
+    """
+    Returns the allocation peak, and stops tracing if it was started here
+    and no other tracker still uses it.
+    """
+    global _tracing_users, _started_tracing
+    with _tracing_lock:
+        _, peak = tracemalloc.get_traced_memory()
+        _tracing_users -= 1
+        if _tracing_users == 0 and _started_tracing:
+            tracemalloc.stop()
+            _started_tracing = False
+        return peak
+
+
+class MemoryTracker:
+    def __init__(self, trace_allocations: bool = False):
+        self.trace_allocations = trace_allocations
+        self.rss_delta: Optional[int] = None
+        self.allocation_peak: Optional[int] = None
+
+    @contextmanager
+    def track(self) -> Iterator["MemoryTracker"]:
+        if self.trace_allocations:
+            _acquire_tracing()
+        rss_before = current_rss()
+        try:
+            yield self
+        finally:
+            rss_after = current_rss()
+            if rss_before is not None and rss_after is not None:
+                self.rss_delta = rss_after - rss_before
+            if self.trace_allocations:
+                self.allocation_peak = _release_tracing()
+
+
+def fit_rows_to_memory_ceiling(
+    df: Any, memory_ceiling: int, frame_memory: Optional[int] = None
+) -> Optional[Tuple[int, int]]:
+    """
+    Returns the number of rows which can be validated without the process
+    exceeding the memory ceiling, along with the total number of rows,
+    or None if the whole frame fits or its size cannot be estimated.
+    The number of rows is 0 when fewer than MIN_SAMPLE_ROWS would fit.
+    """
+    rss = current_rss()
+    if frame_memory is None:
+        frame_memory = estimate_memory(df)
+    if rss is None or not frame_memory:
+        return None
+
+    required = frame_memory * VALIDATION_MEMORY_FACTOR
+    available = max(memory_ceiling - rss, 0)
+    if required <= available:
+        return None
+
+    total_rows = count_rows(df)
+    rows = int(total_rows * available / required)
+    if rows < MIN_SAMPLE_ROWS:
+        rows = 0
+    return rows, total_rows
@@ -0,0 +1,197 @@
+"""
+Pruning of expectations which are implied by another expectation of the same suite.
+
+Expectation `a` implies `b` when every batch passing `a` also passes `b`, e.g. a
+range within another range, a value set within another value set, or a higher `mostly`.
+"""
+import json
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from .costs import estimate_suite_cost, order_expectations_by_cost
+
+# Kwargs which only change how a result is reported, not whether it passes
+_REPORTING_KWARGS = {"result_format", "include_config", "catch_exceptions", "meta"}
+_RANGE_KWARGS = {"min_value", "max_value", "strict_min", "strict_max"}
+
+# Value set kwargs, and whether a smaller set is the stricter one
+_SET_KWARGS = {
+    "expect_column_values_to_be_in_set": ("value_set", True),
+    "expect_column_distinct_values_to_be_in_set": ("value_set", True),
+    "expect_column_values_to_not_be_in_set": ("value_set", False),
+}
+
+_COLUMN_LIST_EXPECTATIONS = {
+    "expect_table_columns_to_match_ordered_list",
+    "expect_table_columns_to_match_set",
+}
+
+
+class RemovedExpectation(NamedTuple):
+    expectation_type: str
+    kwargs: Dict[str, Any]
+    reason: str
+
+
+class OptimizedSuite(NamedTuple):
+    suite: str
+    removed: List[RemovedExpectation]
+    reordered: bool
+    cost_before: float
+    cost_after: float
+
+    @property
+    def savings(self) -> float:
+        """
+        The estimated share of the suite runtime saved, between 0 and 1.
+        """
+        if not self.cost_before:
+            return 0.0
+        return 1 - self.cost_after / self.cost_before
+
+
+def _comparable_kwargs(expectation_type: str, kwargs: Dict[str, Any]) -> str:
+    excluded = _REPORTING_KWARGS | _RANGE_KWARGS | {"mostly"}
+    if expectation_type in _SET_KWARGS:
+        excluded = excluded | {_SET_KWARGS[expectation_type][0]}
+    return json.dumps(
+        {k: v for k, v in kwargs.items() if k not in excluded}, sort_keys=True, default=str
+    )
+
+
+def _bound_within(
+    inner: Dict[str, Any], outer: Dict[str, Any], bound: str, strict: str, tighter: int
+) -> bool:
+    outer_value, inner_value = outer.get(bound), inner.get(bound)
+    if outer_value is None:
+        return True
+    if inner_value is None:
+        return False
+    if inner_value == outer_value:
+        return inner.get(strict, False) or not outer.get(strict, False)
+    return (inner_value > outer_value) if tighter > 0 else (inner_value < outer_value)
+
+
+def _range_within(inner: Dict[str, Any], outer: Dict[str, Any]) -> bool:
+    try:
+        return _bound_within(
+            inner, outer, "min_value", "strict_min", 1
+        ) and _bound_within(inner, outer, "max_value", "strict_max", -1)
+    except TypeError:
+        # Bounds of different types, e.g. a date and a number, cannot be compared
+        return False
+
+
+def _value_set(kwargs: Dict[str, Any], key: str) -> Optional[set]:
+    values = kwargs.get(key)
+    if not isinstance(values, (list, tuple, set)):
+        return None
+    return {json.dumps(value, sort_keys=True, default=str) for value in values}
+
+
+def _column_implied_by_list(a: Any, b: Any) -> bool:
+    if b.expectation_type != "expect_column_to_exist":
+        return False
+    if a.expectation_type not in _COLUMN_LIST_EXPECTATIONS:
+        return False
+    column_list = a.kwargs.get("column_list") or []
+    column, column_index = b.kwargs.get("column"), b.kwargs.get("column_index")
+    if column_index is None:
+        return column in column_list
+    return (
+        a.expectation_type == "expect_table_columns_to_match_ordered_list"
+        and column_index < len(column_list)
+        and column_list[column_index] == column
+    )
+
+
+def implies(a: Any, b: Any) -> bool:
+    """
+    Whether every batch passing expectation `a` also passes expectation `b`.
+    """
+    if _column_implied_by_list(a, b):
+        return True
+    if a.expectation_type != b.expectation_type:
+        return False
+    expectation_type = a.expectation_type
+    if _comparable_kwargs(expectation_type, a.kwargs) != _comparable_kwargs(
+        expectation_type, b.kwargs
+    ):
+        return False
+    if a.kwargs.get("mostly", 1) < b.kwargs.get("mostly", 1):
+        return False
+    if not _range_within(a.kwargs, b.kwargs):
+        return False
+    if expectation_type in _SET_KWARGS:
+        key, smaller_is_stricter = _SET_KWARGS[expectation_type]
+        a_set, b_set = _value_set(a.kwargs, key), _value_set(b.kwargs, key)
+        if a_set is None or b_set is None:
+            return a.kwargs.get(key) == b.kwargs.get(key)
+        return a_set <= b_set if smaller_is_stricter else a_set >= b_set
+    return True
+
+
+def _describe(expectation: Any) -> str:
+    column = expectation.kwargs.get("column")
+    return (
+        f"{expectation.expectation_type}({column})"
+        if column is not None
+        else expectation.expectation_type
+    )
+
+
+def find_implied_expectations(expectations: List[Any]) -> Dict[int, RemovedExpectation]:
+    """
+    Finds the expectations implied by another one of the list, by index.
+    Of several equivalent expectations, the first one is kept.
+    """
+    implied = {}
+    for j, b in enumerate(expectations):
+        for i, a in enumerate(expectations):
+            if i == j or i in implied:
+                continue
+            if implies(a, b) and (i < j or not implies(b, a)):
+                implied[j] = RemovedExpectation(
+                    b.expectation_type, dict(b.kwargs), f"implied by {_describe(a)}"
+                )
+                break
+    return implied
+
+
+def optimize_suite(expectation_suite: Any) -> OptimizedSuite:
+    """
+    Removes the implied expectations of the suite, and orders the rest
+    cheapest first. The suite is changed in place.
+    """
+    expectations = list(expectation_suite.expectations)
+    implied = find_implied_expectations(expectations)
+    kept = [e for i, e in enumerate(expectations) if i not in implied]
+    ordered = order_expectations_by_cost(kept)
+    expectation_suite.expectations = ordered
+    return OptimizedSuite(
+        expectation_suite.expectation_suite_name,
+        [implied[i] for i in sorted(implied)],
+        [id(e) for e in ordered] != [id(e) for e in kept],
+        estimate_suite_cost(expectations),
+        estimate_suite_cost(ordered),
+    )
+
+
+def find_implied_across_suites(expectation_suites: List[Any]) -> List[str]:
+    """
+    Describes the expectations implied by an expectation of another suite of the
+    same dataset. They are only reported, since suites pass or fail independently.
+    """
+    hints = []
+    for b_suite in expectation_suites:
+        for b in b_suite.expectations:
+            for a_suite in expectation_suites:
+                if a_suite is b_suite:
+                    continue
+                a = next((a for a in a_suite.expectations if implies(a, b)), None)
+                if a is not None:
+                    hints.append(
+                        f"{_describe(b)} of {b_suite.expectation_suite_name} is implied "
+                        f"by {_describe(a)} of {a_suite.expectation_suite_name}"
+                    )
+                    break
+    return hints
@@ -0,0 +1,175 @@
+import json
+import os
+import tempfile
+import threading
+from typing import Any, Dict, List, NamedTuple, Optional
+
+COLUMN_KWARGS = ("column", "column_A", "column_B")
+COLUMN_LIST_KWARGS = ("column_list", "column_set")
+
+
+class ExecutionStep(NamedTuple):
+    expectation_type: str
+    kwargs: Dict[str, Any]
+    columns: Optional[List[str]]
+
+
+class ExecutionPlan(NamedTuple):
+    suite_name: str
+    source_modified: Optional[float]
+    steps: List[ExecutionStep]
+    # None when a step depends on the whole table, so no projection is possible
+    columns: Optional[List[str]]
+    expectation_suite: Any
+
+    @property
+    def expectation_types(self) -> List[str]:
+        return sorted({step.expectation_type for step in self.steps})
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "suite_name": self.suite_name,
+            "source_modified": self.source_modified,
+            "steps": [step._asdict() for step in self.steps],
+            "columns": self.columns,
+            "expectation_suite": self.expectation_suite.to_json_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ExecutionPlan":
+        from great_expectations.core import expectationSuiteSchema
+
+        return cls(
+            suite_name=data["suite_name"],
+            source_modified=data["source_modified"],
+            steps=[ExecutionStep(**step) for step in data["steps"]],
+            columns=data["columns"],
+            expectation_suite=expectationSuiteSchema.load(data["expectation_suite"]),
+        )
+
+
+def get_plans_columns(plans: List[ExecutionPlan]) -> Optional[List[str]]:
+    """
+    The columns any of the plans depends on, or None if one depends on the whole table.
+    """
+    columns: List[str] = []
+    for plan in plans:
+        if plan.columns is None:
+            return None
+        columns += [column for column in plan.columns if column not in columns]
+    return columns
+
+
+def project_frame(df: Any, columns: Optional[List[str]]) -> Any:
+    """
+    Drops the columns no expectation depends on, so Great Expectations
+    has less to wrap. Returns the frame untouched if all columns are needed.
+    """
+    if columns is None or len(columns) == len(df.columns):
+        return df
+    if any(column not in df.columns for column in columns):
+        # Let Great Expectations report the missing columns
+        return df
+    if type(df).__module__.startswith("pyspark"):
+        return df.select(*columns)
+    return df[columns]
+
+
+def get_step_columns(expectation_type: str, kwargs: Dict[str, Any]) -> Optional[List[str]]:
+    """
+    The columns an expectation reads, or None if it depends on the whole table.
+    """
+    if expectation_type.startswith("expect_table_"):
+        return None
+    columns = [kwargs[k] for k in COLUMN_KWARGS if k in kwargs]
+    for k in COLUMN_LIST_KWARGS:
+        columns += list(kwargs.get(k) or [])
+    if "row_condition" in kwargs or not columns:
+        # Row conditions can reference any column
+        return None
+    return columns
+
+
+def compile_suite(expectation_suite: Any, source_modified: Optional[float]) -> ExecutionPlan:
+    steps = [
+        ExecutionStep(
+            expectation_type=e.expectation_type,
+            kwargs=dict(e.kwargs),
+            columns=get_step_columns(e.expectation_type, e.kwargs),
+        )
+        for e in expectation_suite.expectations
+    ]
+
+    columns: Optional[List[str]] = []
+    for step in steps:
+        if step.columns is None:
+            columns = None
+            break
+        columns += [column for column in step.columns if column not in columns]
+
+    return ExecutionPlan(
+        suite_name=expectation_suite.expectation_suite_name,
+        source_modified=source_modified,
+        steps=steps,
+        columns=columns,
+        expectation_suite=expectation_suite,
+    )
+
+
+def get_suite_path(ge_root_directory: str, suite_name: str) -> str:
+    return os.path.join(ge_root_directory, "expectations", *suite_name.split(".")) + ".json"
+
+
+class PlanCache:
+    """
+    Keeps compiled execution plans in memory and on disk, recompiling a plan
+    only once its suite file has been modified.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self._plans: Dict[str, ExecutionPlan] = {}
+        self._lock = threading.Lock()
+
+    def _plan_path(self, suite_name: str) -> str:
+        return os.path.join(self.directory, f"{suite_name}.json")
+
+    def _read(self, suite_name: str) -> Optional[ExecutionPlan]:
+        try:
+            with open(self._plan_path(suite_name)) as f:
+                return ExecutionPlan.from_dict(json.load(f))
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _write(self, plan: ExecutionPlan) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        # A temp file per writer, threads may compile the same suite concurrently
+        with tempfile.NamedTemporaryFile(
+            "w", dir=self.directory, suffix=".tmp", delete=False
+        ) as f:
+            json.dump(plan.to_dict(), f)
+        os.replace(f.name, self._plan_path(plan.suite_name))
+
+    def compile(self, expectation_context: Any, suite_name: str) -> ExecutionPlan:
+        suite_path = get_suite_path(expectation_context.root_directory, suite_name)
+        modified = os.path.getmtime(suite_path) if os.path.exists(suite_path) else None
+        plan = compile_suite(expectation_context.get_expectation_suite(suite_name), modified)
+        self._write(plan)
+        with self._lock:
+            self._plans[suite_name] = plan
+        return plan
+
+    def get(self, expectation_context: Any, suite_name: str) -> ExecutionPlan:
+        suite_path = get_suite_path(expectation_context.root_directory, suite_name)
+        modified = os.path.getmtime(suite_path) if os.path.exists(suite_path) else None
+
+        with self._lock:
+            plan = self._plans.get(suite_name)
+        if plan is None or plan.source_modified != modified:
+            plan = self._read(suite_name)
+        if plan is None or modified is None or plan.source_modified != modified:
+            return self.compile(expectation_context, suite_name)
+
+        with self._lock:
+            self._plans[suite_name] = plan
+        return plan
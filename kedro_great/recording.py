@@ -0,0 +1,149 @@
+import json
+import logging
+import os
+import threading
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from .budget import sample_frame
+from .conversion import parquet_engine_available
+from .timings import frame_rows
+
+DEFAULT_SAMPLE_ROWS = 10_000
+
+
+class RecordedValidation(NamedTuple):
+    dataset: str
+    dataset_path: Optional[str]
+    suites: List[str]
+    seconds: Dict[str, float]
+    rows: Optional[int]
+    columns: List[str]
+    fingerprint: Optional[Dict[str, Any]]
+    sample: Optional[str]
+    # The rows each suite validated, fewer than `rows` when it was sampled
+    suite_rows: Optional[Dict[str, Optional[int]]] = None
+
+    def get_suite_rows(self, suite_name: str) -> Optional[int]:
+        return (self.suite_rows or {}).get(suite_name, self.rows)
+
+
+def serializable_options(value: Any) -> Any:
+    """
+    Converts hook options to JSON, keeping NamedTuples such as
+    ValidationBudget as dicts so they can be passed back to KedroGreat.
+    """
+    if isinstance(value, tuple) and hasattr(value, "_asdict"):
+        return serializable_options(value._asdict())
+    if isinstance(value, dict):
+        return {key: serializable_options(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [serializable_options(item) for item in value]
+    return value
+
+
+def file_fingerprint(dataset_path: Optional[str]) -> Optional[Dict[str, Any]]:
+    if not dataset_path or not os.path.exists(dataset_path):
+        return None
+    stat = os.stat(dataset_path)
+    return {"path": dataset_path, "size": stat.st_size, "modified": str(stat.st_mtime)}
+
+
+class RunRecorder:
+    """
+    Records the validations of each run: which suites ran on which dataset,
+    how long each took, the shape and fingerprint of the data, and a sample of it,
+    so the workload can be replayed locally with `kedro great replay`.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        options: Dict[str, Any],
+        sample_rows: int = DEFAULT_SAMPLE_ROWS,
+    ):
+        self.directory = directory
+        self.options = serializable_options(options)
+        unrecordable = []
+        for key, value in self.options.items():
+            try:
+                json.dumps(value)
+            except (TypeError, ValueError):
+                unrecordable.append(key)
+        if unrecordable:
+            raise ValueError(
+                f"Cannot record runs with options which do not convert to JSON, "
+                f"they could not be replayed: {unrecordable}"
+            )
+        self.sample_rows = sample_rows
+        if sample_rows and not parquet_engine_available():
+            logging.getLogger("KedroGreat").warning(
+                "Recording samples requires pyarrow or fastparquet, runs are recorded "
+                "without samples and can only be replayed with --from-catalog"
+            )
+            self.sample_rows = 0
+        self._lock = threading.Lock()
+
+    def get_run_directory(self, run_id: str) -> str:
+        return os.path.join(self.directory, run_id)
+
+    def _write_sample(
+        self, run_directory: str, dataset_name: str, df: Any
+    ) -> Optional[str]:
+        rows = frame_rows(df)
+        if not self.sample_rows or rows is None or not hasattr(df, "to_parquet"):
+            return None
+        sample_name = f"{dataset_name}.parquet"
+        sample_path = os.path.join(run_directory, "samples", sample_name)
+        if os.path.exists(sample_path):
+            return sample_name
+        os.makedirs(os.path.dirname(sample_path), exist_ok=True)
+        try:
+            sample_frame(df, self.sample_rows, rows).to_parquet(sample_path)
+        except Exception:  # pylint: disable=broad-except
+            # e.g. a column mixes types
+            return None
+        return sample_name
+
+    def record(
+        self,
+        run_id: str,
+        dataset_name: str,
+        dataset_path: Optional[str],
+        df: Any,
+        seconds: Dict[str, float],
+        suite_rows: Optional[Dict[str, Optional[int]]] = None,
+    ) -> None:
+        run_directory = self.get_run_directory(run_id)
+        with self._lock:
+            os.makedirs(run_directory, exist_ok=True)
+            options_path = os.path.join(run_directory, "options.json")
+            if not os.path.exists(options_path):
+                with open(options_path, "w") as f:
+                    json.dump(self.options, f, indent=2)
+            recorded = RecordedValidation(
+                dataset_name,
+                str(dataset_path) if dataset_path else None,
+                list(seconds),
+                seconds,
+                frame_rows(df),
+                [str(column) for column in getattr(df, "columns", [])],
+                file_fingerprint(str(dataset_path) if dataset_path else None),
+                self._write_sample(run_directory, dataset_name, df),
+                suite_rows,
+            )
+            # Appending a line at a time lets parallel processes share the file
+            with open(os.path.join(run_directory, "validations.jsonl"), "a") as f:
+                f.write(json.dumps(recorded._asdict(), default=str) + "\n")
+
+
+def load_recording(
+    run_directory: str,
+) -> Tuple[Dict[str, Any], List[RecordedValidation]]:
+    """
+    Returns the hook options and the validations recorded for a run.
+    """
+    with open(os.path.join(run_directory, "options.json")) as f:
+        options = json.load(f)
+    with open(os.path.join(run_directory, "validations.jsonl")) as f:
+        validations = [RecordedValidation(**json.loads(line)) for line in f if line.strip()]
+    return options, validations
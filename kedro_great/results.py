@@ -0,0 +1,183 @@
+import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+RESULT_FORMATS = ("BOOLEAN_ONLY", "BASIC", "SUMMARY", "COMPLETE")
+# The default of Great Expectations' validation operators
+OPERATOR_RESULT_FORMAT = "SUMMARY"
+
+
+def resolve_result_format(
+    result_formats: Dict[str, str], dataset_name: str, suite_name: str
+) -> Optional[str]:
+    """
+    A suite result format overrides its dataset result format.
+    None leaves the validation operator default in place.
+    """
+    result_format = result_formats.get(suite_name, result_formats.get(dataset_name))
+    if result_format is not None and result_format not in RESULT_FORMATS:
+        raise ValueError(
+            f"Unknown result_format {result_format}, expected one of {RESULT_FORMATS}"
+        )
+    return result_format
+
+
+class ValidationSummary:
+    """
+    The outcome of a suite validation, without the per expectation results,
+    which can hold large lists of unexpected values and indexes.
+    """
+
+    __slots__ = (
+        "suite",
+        "dataset",
+        "run_id",
+        "success",
+        "evaluated",
+        "successful",
+        "failed_expectations",
+    )
+
+    def __init__(
+        self,
+        suite: str,
+        dataset: str,
+        run_id: str,
+        success: bool,
+        evaluated: int,
+        successful: int,
+        failed_expectations: Tuple[str, ...],
+    ):
+        self.suite = suite
+        self.dataset = dataset
+        self.run_id = run_id
+        self.success = success
+        self.evaluated = evaluated
+        self.successful = successful
+        self.failed_expectations = failed_expectations
+
+    def __repr__(self) -> str:
+        return (
+            f"ValidationSummary(suite={self.suite!r}, dataset={self.dataset!r}, "
+            f"success={self.success}, evaluated={self.evaluated}, "
+            f"successful={self.successful}, failed_expectations={self.failed_expectations})"
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {field: getattr(self, field) for field in self.__slots__}
+
+
+class ValidationTotals:
+    """
+    Running totals of the suite validations of a run, so long runs
+    do not keep a summary per validation.
+    """
+
+    __slots__ = ("suites", "passed", "evaluated", "successful")
+
+    def __init__(self):
+        self.suites = 0
+        self.passed = 0
+        self.evaluated = 0
+        self.successful = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"ValidationTotals(suites={self.suites}, passed={self.passed}, "
+            f"evaluated={self.evaluated}, successful={self.successful})"
+        )
+
+    def add(self, summary: ValidationSummary) -> None:
+        self.suites += 1
+        self.passed += summary.success
+        self.evaluated += summary.evaluated
+        self.successful += summary.successful
+
+    def merge(self, other: "ValidationTotals") -> None:
+        for field in self.__slots__:
+            setattr(self, field, getattr(self, field) + getattr(other, field))
+
+    def to_dict(self) -> Dict[str, int]:
+        return {field: getattr(self, field) for field in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, totals: Dict[str, int]) -> "ValidationTotals":
+        validation_totals = cls()
+        for field in cls.__slots__:
+            setattr(validation_totals, field, totals[field])
+        return validation_totals
+
+
+def get_suite_validation_results(validation: Any) -> Any:
+    """
+    Unwraps the suite validation results of a validation operator result.
+    """
+    run_results = getattr(validation, "run_results", None)
+    if run_results is None:
+        return [validation]
+    return [run_result["validation_result"] for run_result in run_results.values()]
+
+
+def summarize_validation(
+    dataset_name: str, suite_name: str, run_id: str, validation: Any
+) -> ValidationSummary:
+    evaluated = 0
+    successful = 0
+    failed_expectations = []
+    for suite_validation in get_suite_validation_results(validation):
+        statistics = suite_validation.statistics or {}
+        evaluated += statistics.get("evaluated_expectations", 0)
+        successful += statistics.get("successful_expectations", 0)
+        failed_expectations.extend(
+            result.expectation_config.expectation_type
+            for result in suite_validation.results
+            if not result.success and result.expectation_config is not None
+        )
+    return ValidationSummary(
+        suite_name,
+        dataset_name,
+        run_id,
+        bool(validation.success),
+        evaluated,
+        successful,
+        tuple(failed_expectations),
+    )
+
+
+def build_suite_validation_result(
+    expectation_suite: Any,
+    results: List[Any],
+    run_id: str,
+    batch_kwargs: Dict[str, Any],
+    kedro_great_meta: Dict[str, Any],
+) -> Any:
+    """
+    Wraps expectation results evaluated outside of a validation operator,
+    shaped like the results of Great Expectations' own validation.
+    """
+    from great_expectations import __version__ as ge_version
+    from great_expectations.core import ExpectationSuiteValidationResult
+
+    successful = sum(result.success for result in results)
+    return ExpectationSuiteValidationResult(
+        success=successful == len(results),
+        results=results,
+        statistics={
+            "evaluated_expectations": len(results),
+            "successful_expectations": successful,
+            "unsuccessful_expectations": len(results) - successful,
+            "success_percent": 100.0 * successful / len(results) if results else None,
+        },
+        meta={
+            "great_expectations.__version__": ge_version,
+            "expectation_suite_name": expectation_suite.expectation_suite_name,
+            "run_id": run_id,
+            "batch_kwargs": batch_kwargs,
+            "batch_markers": {},
+            "batch_parameters": None,
+            "validation_time": datetime.datetime.now(datetime.timezone.utc).strftime(
+                "%Y%m%dT%H%M%S.%fZ"
+            ),
+            "kedro_great": kedro_great_meta,
+        },
+        evaluation_parameters={},
+    )
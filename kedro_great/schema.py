@@ -0,0 +1,226 @@
+from copy import deepcopy
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from kedro.io import AbstractDataSet
+
+SCHEMA_EXPECTATION_TYPES = {
+    "expect_column_to_exist",
+    "expect_table_columns_to_match_ordered_list",
+    "expect_table_columns_to_match_set",
+    "expect_table_column_count_to_equal",
+    "expect_table_column_count_to_be_between",
+    "expect_column_values_to_be_of_type",
+    "expect_column_values_to_be_in_type_list",
+}
+
+TYPE_EXPECTATION_TYPES = {
+    "expect_column_values_to_be_of_type",
+    "expect_column_values_to_be_in_type_list",
+}
+
+# Formats whose metadata carries real column types
+TYPED_FILE_FORMATS = {"parquet", "orc", "avro", "feather", "delta"}
+
+
+class SchemaFrame(NamedTuple):
+    frame: Any
+    has_types: bool
+    # The Python type of the values of object columns, where the metadata tells it
+    value_types: Optional[Dict[str, type]] = None
+
+
+def _get_load_path(dataset: AbstractDataSet) -> str:
+    get_load_path = getattr(dataset, "_get_load_path", None)
+    load_path = get_load_path() if get_load_path else dataset._filepath
+    return str(load_path)
+
+
+def _open(dataset: AbstractDataSet, load_path: str):
+    fs = getattr(dataset, "_fs", None)
+    return fs.open(load_path, mode="rb") if fs is not None else open(load_path, "rb")
+
+
+def _arrow_value_types(schema: Any) -> Dict[str, type]:
+    import pyarrow as pa
+
+    value_types = {}
+    for field in schema:
+        if pa.types.is_string(field.type) or pa.types.is_large_string(field.type):
+            value_types[field.name] = str
+        elif pa.types.is_binary(field.type) or pa.types.is_large_binary(field.type):
+            value_types[field.name] = bytes
+        elif pa.types.is_list(field.type) or pa.types.is_large_list(field.type):
+            value_types[field.name] = list
+        elif pa.types.is_struct(field.type) or pa.types.is_map(field.type):
+            value_types[field.name] = dict
+    return value_types
+
+
+def _dtype_value_types(dtype: Any) -> Dict[str, type]:
+    if not isinstance(dtype, dict):
+        return {}
+    return {
+        column: str for column, column_dtype in dtype.items() if column_dtype in (str, "str")
+    }
+
+
+def _read_pandas_schema(dataset: AbstractDataSet) -> Optional[SchemaFrame]:
+    import pandas as pd
+    from kedro.extras.datasets.pandas import CSVDataSet, ExcelDataSet, ParquetDataSet
+
+    load_args = dict(getattr(dataset, "_load_args", None) or {})
+    load_path = _get_load_path(dataset)
+
+    if isinstance(dataset, ParquetDataSet):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            # The footer cannot be read on its own, the DataSet is loaded instead
+            return None
+
+        with _open(dataset, load_path) as f:
+            schema = pq.read_schema(f)
+        return SchemaFrame(
+            schema.empty_table().to_pandas(),
+            has_types=True,
+            value_types=_arrow_value_types(schema),
+        )
+
+    if isinstance(dataset, CSVDataSet):
+        load_args["nrows"] = 0
+        with _open(dataset, load_path) as f:
+            frame = pd.read_csv(f, **load_args)
+        return SchemaFrame(
+            frame,
+            has_types="dtype" in load_args,
+            value_types=_dtype_value_types(load_args.get("dtype")),
+        )
+
+    if isinstance(dataset, ExcelDataSet):
+        load_args["nrows"] = 0
+        with _open(dataset, load_path) as f:
+            frame = pd.read_excel(f, **load_args)
+        return SchemaFrame(
+            frame,
+            has_types="dtype" in load_args,
+            value_types=_dtype_value_types(load_args.get("dtype")),
+        )
+
+    return None
+
+
+def _read_spark_schema(dataset: AbstractDataSet) -> Optional[SchemaFrame]:
+    from kedro.extras.datasets.spark import SparkDataSet
+
+    if not isinstance(dataset, SparkDataSet):
+        return None
+
+    load_args = dict(getattr(dataset, "_load_args", None) or {})
+    file_format = getattr(dataset, "_file_format", "parquet")
+    if file_format not in TYPED_FILE_FORMATS:
+        # Schema inference would have to scan the data, which defeats the purpose
+        load_args.pop("inferSchema", None)
+
+    reader = dataset._get_spark().read
+    frame = reader.load(_get_load_path(dataset), file_format, **load_args).limit(0)
+    return SchemaFrame(
+        frame,
+        has_types=file_format in TYPED_FILE_FORMATS or "schema" in load_args,
+    )
+
+
+def read_schema_frame(dataset: AbstractDataSet) -> Optional[SchemaFrame]:
+    """
+    Builds an empty frame carrying the columns (and where known, the types) of
+    the dataset, using only file metadata such as parquet footers, CSV headers
+    or Spark schemas. Returns None when the dataset type is not supported.
+    """
+    for reader in (_read_pandas_schema, _read_spark_schema):
+        schema_frame = reader(dataset)
+        if schema_frame is not None:
+            return schema_frame
+    return None
+
+
+def build_schema_suite(expectation_suite: Any, has_types: bool) -> Optional[Any]:
+    """
+    Copies the suite, keeping only the expectations that can be answered
+    from a schema. Returns None if there are no such expectations.
+    """
+    expectation_types = SCHEMA_EXPECTATION_TYPES
+    if not has_types:
+        expectation_types = expectation_types - TYPE_EXPECTATION_TYPES
+
+    if not any(
+        e.expectation_type in expectation_types for e in expectation_suite.expectations
+    ):
+        return None
+
+    schema_suite = deepcopy(expectation_suite)
+    schema_suite.expectations = [
+        e for e in schema_suite.expectations if e.expectation_type in expectation_types
+    ]
+    return schema_suite
+
+
+def _expected_types(type_names: List[str]) -> List[type]:
+    """
+    Resolves type names the way Great Expectations does for pandas columns.
+    """
+    import numpy as np
+    import pandas as pd
+    from great_expectations.dataset import PandasDataset
+
+    expected_types = []
+    for type_name in type_names:
+        try:
+            expected_types.append(np.dtype(type_name).type)
+        except TypeError:
+            for module in (pd, pd.core.dtypes.dtypes):
+                pandas_type = getattr(module, type_name, None)
+                if isinstance(pandas_type, type):
+                    expected_types.append(pandas_type)
+        expected_types.extend(PandasDataset._native_type_type_map(type_name) or ())
+    return expected_types
+
+
+def check_column_type(schema_frame: SchemaFrame, expectation: Any) -> Any:
+    """
+    Checks a column type expectation against the dtype of a pandas schema frame.
+
+    Great Expectations checks each value of object columns, so any type passes
+    on an empty frame. Here the type of their values is taken from the metadata,
+    and columns holding values of unknown types only pass when `object` is expected.
+    """
+    import numpy as np
+    from great_expectations.core import ExpectationValidationResult
+
+    column = expectation.kwargs.get("column")
+    if expectation.expectation_type == "expect_column_values_to_be_of_type":
+        type_names = expectation.kwargs.get("type_")
+        type_names = None if type_names is None else [type_names]
+    else:
+        type_names = expectation.kwargs.get("type_list")
+
+    observed_value = None
+    if column not in schema_frame.frame.columns:
+        success = False
+    else:
+        dtype_type = schema_frame.frame[column].dtype.type
+        observed_type = dtype_type
+        if dtype_type is np.object_:
+            observed_type = (schema_frame.value_types or {}).get(column, np.object_)
+        observed_value = observed_type.__name__
+        expected_types = [] if type_names is None else _expected_types(type_names)
+        success = (
+            type_names is None
+            or observed_type in expected_types
+            or dtype_type in expected_types
+        )
+
+    return ExpectationValidationResult(
+        success=success,
+        result={"observed_value": observed_value},
+        expectation_config=expectation,
+        meta={"kedro_great": {"schema_preflight": True}},
+    )
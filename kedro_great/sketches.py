@@ -0,0 +1,431 @@
+import math
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+# Rows hashed per chunk, which bounds the working memory of pandas sketches
+CHUNK_ROWS = 250_000
+# Columns with fewer distinct values are counted exactly, from a set of their hashes
+EXACT_DISTINCT_LIMIT = 100_000
+# Approximate counts are within this many standard errors of the true count,
+# 99.7% of the time, so bounds are widened by as much
+ERROR_DEVIATIONS = 3
+
+APPROXIMATE_EXPECTATION_TYPES = {
+    "expect_column_values_to_be_unique",
+    "expect_column_unique_value_count_to_be_between",
+    "expect_column_proportion_of_unique_values_to_be_between",
+    "expect_column_quantile_values_to_be_between",
+    "expect_column_median_to_be_between",
+}
+
+_SUPPORTED_KWARGS = {
+    "column",
+    "min_value",
+    "max_value",
+    "strict_min",
+    "strict_max",
+    "mostly",
+    "quantile_ranges",
+    "allow_relative_error",
+    "result_format",
+    "include_config",
+    "catch_exceptions",
+    "meta",
+}
+
+
+class ApproximationConfig(NamedTuple):
+    distinct_relative_error: float = 0.01
+    bloom_false_positive_rate: float = 0.001
+    quantile_rank_error: float = 0.01
+
+
+def _bit_length(values: np.ndarray) -> np.ndarray:
+    """Exact bit length of uint64 values, computed on their 32 bit halves."""
+    high = (values >> np.uint64(32)).astype(np.float64)
+    low = (values & np.uint64(0xFFFFFFFF)).astype(np.float64)
+    _, high_length = np.frexp(high)
+    _, low_length = np.frexp(low)
+    return np.where(high > 0, 32 + high_length, low_length)
+
+
+class HyperLogLog:
+    def __init__(self, relative_error: float):
+        self.precision = min(max(math.ceil(2 * math.log2(1.04 / relative_error)), 4), 18)
+        self.registers = np.zeros(1 << self.precision, dtype=np.uint8)
+
+    @property
+    def relative_error(self) -> float:
+        return 1.04 / math.sqrt(len(self.registers))
+
+    def update(self, hashes: np.ndarray) -> None:
+        p = self.precision
+        index = (hashes >> np.uint64(64 - p)).astype(np.int64)
+        remaining = hashes & np.uint64((1 << (64 - p)) - 1)
+        rank = ((64 - p) - _bit_length(remaining) + 1).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+
+    def estimate(self) -> int:
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.power(2.0, -self.registers.astype(np.float64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and zeros:
+            # Linear counting, more accurate while registers are still empty
+            estimate = m * math.log(m / zeros)
+        return int(round(estimate))
+
+
+class BloomFilter:
+    def __init__(self, capacity: int, false_positive_rate: float):
+        capacity = max(capacity, 1)
+        self.size = max(
+            int(-capacity * math.log(false_positive_rate) / math.log(2) ** 2), 64
+        )
+        self.hash_count = max(int(round(self.size / capacity * math.log(2))), 1)
+        self.bits = np.zeros((self.size + 7) // 8, dtype=np.uint8)
+        self.false_positive_rate = false_positive_rate
+
+    def _positions(self, hashes: np.ndarray) -> np.ndarray:
+        # Kirsch-Mitzenmacher double hashing from the two halves of each hash
+        h1 = (hashes >> np.uint64(32)).astype(np.uint64)
+        h2 = (hashes & np.uint64(0xFFFFFFFF)).astype(np.uint64) | np.uint64(1)
+        i = np.arange(self.hash_count, dtype=np.uint64)
+        return ((h1[:, None] + i[None, :] * h2[:, None]) % np.uint64(self.size)).astype(
+            np.int64
+        )
+
+    def _contains(self, positions: np.ndarray) -> np.ndarray:
+        is_set = (self.bits[positions >> 3] >> (positions & 7).astype(np.uint8)) & 1
+        return is_set.all(axis=1)
+
+    def _add(self, positions: np.ndarray) -> None:
+        np.bitwise_or.at(
+            self.bits,
+            (positions >> 3).ravel(),
+            (np.uint8(1) << (positions & 7).astype(np.uint8)).ravel(),
+        )
+
+    def add(self, hashes: np.ndarray) -> None:
+        self._add(self._positions(hashes))
+
+    def contains(self, hashes: np.ndarray) -> np.ndarray:
+        """
+        Which of the hashes were (probably) added.
+        """
+        return self._contains(self._positions(hashes))
+
+    def add_and_find_seen(self, hashes: np.ndarray) -> np.ndarray:
+        """
+        Adds the hashes, returning which of them were (probably) seen before,
+        either in an earlier call or earlier in this one.
+        """
+        positions = self._positions(hashes)
+        seen = self._contains(positions)
+        unseen = np.flatnonzero(~seen)
+        _, first_index = np.unique(hashes[unseen], return_index=True)
+        repeated = np.ones(len(unseen), dtype=bool)
+        repeated[first_index] = False
+        seen[unseen[repeated]] = True
+        self._add(positions)
+        return seen
+
+
+class KLLSketch:
+    def __init__(self, rank_error: float, seed: int = 0):
+        self.k = max(int(math.ceil(1.7 / rank_error)), 8)
+        self.levels: List[np.ndarray] = [np.empty(0)]
+        self._random = np.random.default_rng(seed)
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - level - 1
+        return max(int(self.k * (2 / 3) ** depth), 2)
+
+    def update(self, values: np.ndarray) -> None:
+        # Large batches are halved straight down to the level they fit in,
+        # which is what repeated compactions would do, without the passes
+        values = np.sort(values.astype(np.float64))
+        start_level = 0
+        while len(values) > self.k:
+            values = values[int(self._random.integers(2)) :: 2]
+            start_level += 1
+        while len(self.levels) <= start_level:
+            self.levels.append(np.empty(0))
+        self.levels[start_level] = np.concatenate([self.levels[start_level], values])
+
+        level = 0
+        while level < len(self.levels):
+            if len(self.levels[level]) > self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                compacted = np.sort(self.levels[level])
+                leftover = compacted[len(compacted) - len(compacted) % 2 :]
+                compacted = compacted[: len(compacted) - len(compacted) % 2]
+                offset = int(self._random.integers(2))
+                self.levels[level + 1] = np.concatenate(
+                    [self.levels[level + 1], compacted[offset::2]]
+                )
+                self.levels[level] = leftover
+            level += 1
+
+    def quantiles(self, quantiles: List[float]) -> List[Optional[float]]:
+        values = np.concatenate(self.levels)
+        if len(values) == 0:
+            return [None for _ in quantiles]
+        weights = np.concatenate(
+            [np.full(len(level), 2.0 ** i) for i, level in enumerate(self.levels)]
+        )
+        order = np.argsort(values, kind="stable")
+        values, cumulative = values[order], np.cumsum(weights[order])
+        indexes = np.searchsorted(cumulative, np.asarray(quantiles) * cumulative[-1])
+        return [float(values[min(i, len(values) - 1)]) for i in indexes]
+
+
+def _is_spark_frame(df: Any) -> bool:
+    return type(df).__module__.startswith("pyspark")
+
+
+class _PandasSketches:
+    def __init__(self, df: Any, config: ApproximationConfig):
+        self.df = df
+        self.config = config
+
+    def _chunks(self, column: str):
+        series = self.df[column].dropna()
+        for start in range(0, len(series), CHUNK_ROWS):
+            yield series.iloc[start : start + CHUNK_ROWS]
+
+    def non_null_count(self, column: str) -> int:
+        return int(self.df[column].count())
+
+    def distinct_count(self, column: str) -> Tuple[int, float]:
+        """
+        The distinct count and its relative standard error. Counted exactly until
+        the column has more than EXACT_DISTINCT_LIMIT distinct values.
+        """
+        import pandas as pd
+
+        distinct_hashes = np.empty(0, dtype=np.uint64)
+        hll = None
+        for chunk in self._chunks(column):
+            hashes = pd.util.hash_pandas_object(chunk, index=False).values
+            if hll is not None:
+                hll.update(hashes)
+                continue
+            distinct_hashes = np.union1d(distinct_hashes, hashes)
+            if len(distinct_hashes) > EXACT_DISTINCT_LIMIT:
+                hll = HyperLogLog(self.config.distinct_relative_error)
+                hll.update(distinct_hashes)
+                distinct_hashes = None
+        if hll is None:
+            return len(distinct_hashes), 0.0
+        return hll.estimate(), hll.relative_error
+
+    def duplicate_count(self, column: str) -> int:
+        """
+        Counts the rows whose value occurs more than once, first occurrences included,
+        like Great Expectations does. A first pass finds the values seen again, a second
+        pass counts every row holding one of them.
+        """
+        import pandas as pd
+
+        capacity = self.non_null_count(column)
+        seen = BloomFilter(capacity, self.config.bloom_false_positive_rate)
+        duplicated = BloomFilter(capacity, self.config.bloom_false_positive_rate)
+        for chunk in self._chunks(column):
+            hashes = pd.util.hash_pandas_object(chunk, index=False).values
+            duplicated.add(hashes[seen.add_and_find_seen(hashes)])
+        return sum(
+            int(
+                duplicated.contains(
+                    pd.util.hash_pandas_object(chunk, index=False).values
+                ).sum()
+            )
+            for chunk in self._chunks(column)
+        )
+
+    def quantiles(self, column: str, quantiles: List[float]) -> List[Optional[float]]:
+        kll = KLLSketch(self.config.quantile_rank_error)
+        for chunk in self._chunks(column):
+            kll.update(chunk.to_numpy())
+        return kll.quantiles(quantiles)
+
+
+class _SparkSketches:
+    def __init__(self, df: Any, config: ApproximationConfig):
+        self.df = df
+        self.config = config
+
+    def non_null_count(self, column: str) -> int:
+        from pyspark.sql import functions as F
+
+        return self.df.select(F.count(F.col(column))).collect()[0][0]
+
+    def distinct_count(self, column: str) -> Tuple[int, float]:
+        from pyspark.sql import functions as F
+
+        distinct_count = self.df.select(
+            F.approx_count_distinct(F.col(column), rsd=self.config.distinct_relative_error)
+        ).collect()[0][0]
+        return int(distinct_count), self.config.distinct_relative_error
+
+    def duplicate_count(self, column: str) -> int:
+        """
+        Counts the rows whose value occurs more than once, first occurrences included.
+        A single aggregation, exact since a sketch cannot tell which values repeat.
+        """
+        from pyspark.sql import functions as F
+
+        value_counts = self.df.where(F.col(column).isNotNull()).groupBy(column).count()
+        duplicated = value_counts.where(F.col("count") > 1).agg(F.sum("count"))
+        return int(duplicated.collect()[0][0] or 0)
+
+    def quantiles(self, column: str, quantiles: List[float]) -> List[Optional[float]]:
+        return self.df.approxQuantile(
+            column, list(quantiles), self.config.quantile_rank_error
+        )
+
+
+def _between(
+    value: Optional[float],
+    min_value,
+    max_value,
+    strict_min=False,
+    strict_max=False,
+    tolerance: float = 0.0,
+) -> bool:
+    """
+    Whether the value is within the bounds, each widened by `tolerance`
+    relative to itself, so an approximate value is never failed for its error.
+    """
+    if value is None:
+        return False
+    if min_value is not None:
+        min_value = min_value * (1 - tolerance)
+        if value < min_value or (strict_min and not tolerance and value == min_value):
+            return False
+    if max_value is not None:
+        max_value = max_value * (1 + tolerance)
+        if value > max_value or (strict_max and not tolerance and value == max_value):
+            return False
+    return True
+
+
+def make_sketch_resolver(df: Any, config: ApproximationConfig) -> Callable:
+    """
+    Builds an ExpectationMemo resolver which answers uniqueness, cardinality
+    and quantile expectations from sketches in bounded memory, recording the
+    error bounds of each answer in its result meta.
+    """
+    from great_expectations.core import (
+        ExpectationConfiguration,
+        ExpectationValidationResult,
+    )
+
+    if _is_spark_frame(df):
+        sketches = _SparkSketches(df, config)
+    else:
+        sketches = _PandasSketches(df, config)
+
+    def resolve(expectation_type: str, kwargs: Dict[str, Any]):
+        if expectation_type not in APPROXIMATE_EXPECTATION_TYPES:
+            return None
+        if set(kwargs) - _SUPPORTED_KWARGS:
+            return None
+        column = kwargs.get("column")
+        if column is None or column not in df.columns:
+            return None
+
+        result: Dict[str, Any]
+        if expectation_type == "expect_column_values_to_be_unique":
+            element_count = sketches.non_null_count(column)
+            unexpected_count = sketches.duplicate_count(column)
+            unexpected_percent = (
+                100.0 * unexpected_count / element_count if element_count else 0.0
+            )
+            success = unexpected_percent <= 100.0 * (1 - kwargs.get("mostly", 1))
+            result = {
+                "element_count": element_count,
+                "unexpected_count": unexpected_count,
+                "unexpected_percent": unexpected_percent,
+            }
+            if _is_spark_frame(df):
+                error = {"method": "exact"}
+            else:
+                # A row is miscounted when either of the two filters gives a false positive
+                error = {
+                    "method": "bloom_filter",
+                    "false_positive_rate": 2 * config.bloom_false_positive_rate,
+                }
+        elif expectation_type in (
+            "expect_column_unique_value_count_to_be_between",
+            "expect_column_proportion_of_unique_values_to_be_between",
+        ):
+            observed_value, relative_error = sketches.distinct_count(column)
+            proportion = expectation_type.startswith("expect_column_proportion")
+            if proportion:
+                element_count = sketches.non_null_count(column)
+                observed_value = observed_value / element_count if element_count else None
+            tolerance = ERROR_DEVIATIONS * relative_error
+            success = _between(
+                observed_value,
+                kwargs.get("min_value"),
+                kwargs.get("max_value"),
+                kwargs.get("strict_min", False),
+                kwargs.get("strict_max", False),
+                tolerance,
+            )
+            result = {"observed_value": observed_value}
+            if relative_error:
+                error = {
+                    "method": "hyperloglog",
+                    "relative_error": relative_error,
+                    "bounds_tolerance": tolerance,
+                }
+            else:
+                error = {"method": "exact"}
+        elif expectation_type == "expect_column_median_to_be_between":
+            observed_value = sketches.quantiles(column, [0.5])[0]
+            success = _between(
+                observed_value,
+                kwargs.get("min_value"),
+                kwargs.get("max_value"),
+                kwargs.get("strict_min", False),
+                kwargs.get("strict_max", False),
+            )
+            result = {"observed_value": observed_value}
+            error = {"method": "kll", "rank_error": config.quantile_rank_error}
+        else:
+            quantile_ranges = kwargs.get("quantile_ranges") or {}
+            quantiles = quantile_ranges.get("quantiles", [])
+            value_ranges = quantile_ranges.get("value_ranges", [])
+            if not quantiles or len(quantiles) != len(value_ranges):
+                return None
+            values = sketches.quantiles(column, quantiles)
+            success_details = [
+                _between(value, value_range[0], value_range[1])
+                for value, value_range in zip(values, value_ranges)
+            ]
+            success = all(success_details)
+            result = {
+                "observed_value": {"quantiles": quantiles, "values": values},
+                "details": {"success_details": success_details},
+            }
+            error = {"method": "kll", "rank_error": config.quantile_rank_error}
+
+        return ExpectationValidationResult(
+            success=success,
+            result=result,
+            expectation_config=ExpectationConfiguration(
+                expectation_type=expectation_type,
+                kwargs={
+                    k: v
+                    for k, v in kwargs.items()
+                    if k not in ("include_config", "catch_exceptions", "meta")
+                },
+            ),
+            meta={"kedro_great": {"approximate": True, **error}},
+        )
+
+    return resolve
@@ -0,0 +1,384 @@
+import hashlib
+import json
+import math
+import os
+import tempfile
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+from kedro.io import AbstractDataSet
+
+from .schema import _get_load_path, _open
+
+# Bytes hashed just before the end of the cached data, used to detect appends
+APPEND_BOUNDARY_BYTES = 64 * 1024
+
+# CSV load args which cannot be applied to the appended rows alone,
+# datasets loaded with them are rescanned in full
+NON_APPENDABLE_LOAD_ARGS = {"index_col", "usecols", "nrows", "skipfooter"}
+
+# Kwargs which do not change the outcome of an aggregate expectation
+NEUTRAL_KWARGS = {"result_format", "include_config", "catch_exceptions", "meta"}
+
+
+class ColumnStatistics(NamedTuple):
+    count: int
+    null_count: int
+    mean: float
+    m2: float
+    min: float
+    max: float
+    sum: float
+    unique_count: Optional[int] = None
+
+    @property
+    def stdev(self) -> Optional[float]:
+        if self.count < 2:
+            return None
+        return math.sqrt(self.m2 / (self.count - 1))
+
+    def merge(self, other: "ColumnStatistics") -> "ColumnStatistics":
+        """
+        Merges the statistics of two disjoint sets of rows.
+        Unique counts cannot be merged, and are dropped.
+        """
+        if self.count == 0:
+            return other._replace(
+                null_count=self.null_count + other.null_count, unique_count=None
+            )
+        if other.count == 0:
+            return self._replace(
+                null_count=self.null_count + other.null_count, unique_count=None
+            )
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        return ColumnStatistics(
+            count=count,
+            null_count=self.null_count + other.null_count,
+            mean=self.mean + delta * other.count / count,
+            m2=self.m2 + other.m2 + delta ** 2 * self.count * other.count / count,
+            min=min(self.min, other.min),
+            max=max(self.max, other.max),
+            sum=self.sum + other.sum,
+            unique_count=None,
+        )
+
+
+class TableStatistics(NamedTuple):
+    row_count: int
+    columns: Dict[str, ColumnStatistics]
+    column_names: List[str]
+
+    def merge(self, other: "TableStatistics") -> "TableStatistics":
+        return TableStatistics(
+            row_count=self.row_count + other.row_count,
+            column_names=self.column_names,
+            columns={
+                name: column.merge(other.columns[name])
+                for name, column in self.columns.items()
+                if name in other.columns
+            },
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "row_count": self.row_count,
+            "columns": {name: c._asdict() for name, c in self.columns.items()},
+            "column_names": self.column_names,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TableStatistics":
+        return cls(
+            row_count=data["row_count"],
+            columns={
+                name: ColumnStatistics(**c) for name, c in data["columns"].items()
+            },
+            column_names=data["column_names"],
+        )
+
+
+def _compute_pandas_statistics(df: Any) -> TableStatistics:
+    columns = {}
+    for name in df.select_dtypes(include="number").columns:
+        series = df[name]
+        values = series.dropna()
+        count = int(values.count())
+        mean = float(values.mean()) if count else 0.0
+        columns[str(name)] = ColumnStatistics(
+            count=count,
+            null_count=int(len(series) - count),
+            mean=mean,
+            m2=float(((values - mean) ** 2).sum()) if count else 0.0,
+            min=float(values.min()) if count else math.inf,
+            max=float(values.max()) if count else -math.inf,
+            sum=float(values.sum()),
+            unique_count=int(values.nunique()),
+        )
+    return TableStatistics(
+        row_count=len(df), columns=columns, column_names=[str(c) for c in df.columns]
+    )
+
+
+def _compute_spark_statistics(df: Any) -> TableStatistics:
+    from pyspark.sql import functions as F
+    from pyspark.sql.types import NumericType
+
+    numeric_columns = [
+        field.name for field in df.schema.fields if isinstance(field.dataType, NumericType)
+    ]
+    aggregations = [F.count(F.lit(1)).alias("__row_count")]
+    for name in numeric_columns:
+        column = F.col(name)
+        aggregations += [
+            F.count(column).alias(f"{name}__count"),
+            F.avg(column).alias(f"{name}__mean"),
+            F.var_samp(column).alias(f"{name}__var"),
+            F.min(column).alias(f"{name}__min"),
+            F.max(column).alias(f"{name}__max"),
+            F.sum(column).alias(f"{name}__sum"),
+            F.countDistinct(column).alias(f"{name}__unique"),
+        ]
+    row = df.agg(*aggregations).collect()[0]
+
+    row_count = row["__row_count"]
+    columns = {}
+    for name in numeric_columns:
+        count = row[f"{name}__count"]
+        variance = row[f"{name}__var"] or 0.0
+        columns[name] = ColumnStatistics(
+            count=count,
+            null_count=row_count - count,
+            mean=float(row[f"{name}__mean"] or 0.0),
+            m2=float(variance) * max(count - 1, 0),
+            min=float(row[f"{name}__min"]) if count else math.inf,
+            max=float(row[f"{name}__max"]) if count else -math.inf,
+            sum=float(row[f"{name}__sum"] or 0.0),
+            unique_count=row[f"{name}__unique"],
+        )
+    return TableStatistics(
+        row_count=row_count, columns=columns, column_names=list(df.columns)
+    )
+
+
+def compute_statistics(df: Any) -> TableStatistics:
+    if type(df).__module__.startswith("pyspark"):
+        return _compute_spark_statistics(df)
+    return _compute_pandas_statistics(df)
+
+
+def dataset_fingerprint(dataset: AbstractDataSet) -> Optional[Dict[str, Any]]:
+    """
+    Identifies the dataset version on disk, from its load path and file info.
+    Returns None if the dataset has no file to fingerprint.
+    """
+    if getattr(dataset, "_filepath", None) is None:
+        return None
+    load_path = _get_load_path(dataset)
+    fs = getattr(dataset, "_fs", None)
+    if fs is not None:
+        info = fs.info(load_path)
+        size = info.get("size")
+        modified = next(
+            (info[k] for k in ("mtime", "LastModified", "updated", "ETag") if k in info),
+            None,
+        )
+    else:
+        stat = os.stat(load_path)
+        size, modified = stat.st_size, stat.st_mtime
+    return {"path": load_path, "size": size, "modified": str(modified)}
+
+
+def _boundary_hash(dataset: AbstractDataSet, load_path: str, size: int) -> str:
+    with _open(dataset, load_path) as f:
+        f.seek(max(size - APPEND_BOUNDARY_BYTES, 0))
+        return hashlib.sha1(f.read(min(size, APPEND_BOUNDARY_BYTES))).hexdigest()
+
+
+def _read_appended_csv(dataset: AbstractDataSet, load_path: str, offset: int, columns):
+    import pandas as pd
+
+    load_args = dict(getattr(dataset, "_load_args", None) or {})
+    load_args.update(header=None, names=columns)
+    load_args.pop("skiprows", None)
+    with _open(dataset, load_path) as f:
+        f.seek(offset)
+        return pd.read_csv(f, **load_args)
+
+
+class StatisticsCache:
+    """
+    Persists the column statistics of each dataset, keyed by its fingerprint.
+    Unchanged datasets are answered from the cache directly. Appended CSV
+    datasets only have their new rows scanned, which are merged into the cache.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def _cache_path(self, dataset_name: str) -> str:
+        return os.path.join(self.directory, f"{dataset_name}.json")
+
+    def _read(self, dataset_name: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._cache_path(dataset_name)) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write(self, dataset_name: str, entry: Dict[str, Any]) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        # A temp file per writer, threads may save the same dataset concurrently
+        with tempfile.NamedTemporaryFile(
+            "w", dir=self.directory, suffix=".tmp", delete=False
+        ) as f:
+            json.dump(entry, f)
+        os.replace(f.name, self._cache_path(dataset_name))
+
+    def save(
+        self, dataset_name: str, dataset: AbstractDataSet, statistics: TableStatistics
+    ) -> None:
+        fingerprint = dataset_fingerprint(dataset)
+        if fingerprint is None:
+            return
+        self._save(dataset_name, dataset, fingerprint, statistics)
+
+    def save_frame(self, dataset_name: str, dataset: AbstractDataSet, df: Any) -> None:
+        """
+        Computes and saves the statistics of the loaded dataset, unless it
+        has no file to fingerprint, so they could never be looked up.
+        """
+        fingerprint = dataset_fingerprint(dataset)
+        if fingerprint is None:
+            return
+        self._save(dataset_name, dataset, fingerprint, compute_statistics(df))
+
+    def _save(
+        self,
+        dataset_name: str,
+        dataset: AbstractDataSet,
+        fingerprint: Dict[str, Any],
+        statistics: TableStatistics,
+    ) -> None:
+        self._write(
+            dataset_name,
+            {
+                "fingerprint": fingerprint,
+                "boundary_hash": _boundary_hash(
+                    dataset, fingerprint["path"], fingerprint["size"]
+                ),
+                "statistics": statistics.to_dict(),
+            },
+        )
+
+    def load(
+        self, dataset_name: str, dataset: AbstractDataSet
+    ) -> Optional[TableStatistics]:
+        from kedro.extras.datasets.pandas import CSVDataSet
+
+        entry = self._read(dataset_name)
+        fingerprint = dataset_fingerprint(dataset)
+        if entry is None or fingerprint is None:
+            return None
+
+        cached = entry["fingerprint"]
+        statistics = TableStatistics.from_dict(entry["statistics"])
+        if cached == fingerprint:
+            return statistics
+
+        load_args = getattr(dataset, "_load_args", None) or {}
+        appended = (
+            isinstance(dataset, CSVDataSet)
+            and not NON_APPENDABLE_LOAD_ARGS.intersection(load_args)
+            and cached["path"] == fingerprint["path"]
+            and cached["size"] < fingerprint["size"]
+            and _boundary_hash(dataset, cached["path"], cached["size"])
+            == entry["boundary_hash"]
+        )
+        if not appended:
+            return None
+
+        new_rows = _read_appended_csv(
+            dataset, fingerprint["path"], cached["size"], statistics.column_names
+        )
+        statistics = statistics.merge(compute_statistics(new_rows))
+        self._save(dataset_name, dataset, fingerprint, statistics)
+        return statistics
+
+
+def _between(value: Optional[float], kwargs: Dict[str, Any]) -> Optional[bool]:
+    if value is None:
+        return None
+    min_value, max_value = kwargs.get("min_value"), kwargs.get("max_value")
+    if min_value is not None:
+        if value < min_value or (kwargs.get("strict_min") and value == min_value):
+            return False
+    if max_value is not None:
+        if value > max_value or (kwargs.get("strict_max") and value == max_value):
+            return False
+    return True
+
+
+_COLUMN_AGGREGATES: Dict[str, Callable[[ColumnStatistics], Any]] = {
+    "expect_column_mean_to_be_between": lambda c: c.mean if c.count else None,
+    "expect_column_min_to_be_between": lambda c: c.min if c.count else None,
+    "expect_column_max_to_be_between": lambda c: c.max if c.count else None,
+    "expect_column_sum_to_be_between": lambda c: c.sum,
+    "expect_column_stdev_to_be_between": lambda c: c.stdev,
+    "expect_column_unique_value_count_to_be_between": lambda c: c.unique_count,
+}
+
+
+def make_statistics_resolver(statistics: TableStatistics) -> Callable:
+    """
+    Builds an ExpectationMemo resolver which answers aggregate expectations
+    from cached statistics. Returns None for anything it cannot answer exactly.
+    """
+    from great_expectations.core import (
+        ExpectationConfiguration,
+        ExpectationValidationResult,
+    )
+
+    def resolve(expectation_type: str, kwargs: Dict[str, Any]):
+        significant_kwargs = {
+            k: v for k, v in kwargs.items() if k not in NEUTRAL_KWARGS
+        }
+        unsupported = set(significant_kwargs) - {
+            "column",
+            "min_value",
+            "max_value",
+            "strict_min",
+            "strict_max",
+            "value",
+        }
+        if unsupported or any(isinstance(v, dict) for v in significant_kwargs.values()):
+            # Evaluation parameters are left to Great Expectations to resolve
+            return None
+
+        if expectation_type == "expect_table_row_count_to_be_between":
+            observed_value = statistics.row_count
+            success = _between(observed_value, significant_kwargs)
+        elif expectation_type == "expect_table_row_count_to_equal":
+            observed_value = statistics.row_count
+            success = observed_value == significant_kwargs.get("value")
+        elif expectation_type in _COLUMN_AGGREGATES:
+            column = statistics.columns.get(significant_kwargs.get("column"))
+            if column is None:
+                return None
+            observed_value = _COLUMN_AGGREGATES[expectation_type](column)
+            success = _between(observed_value, significant_kwargs)
+        else:
+            return None
+
+        if success is None:
+            return None
+
+        return ExpectationValidationResult(
+            success=success,
+            result={"observed_value": observed_value},
+            expectation_config=ExpectationConfiguration(
+                expectation_type=expectation_type, kwargs=significant_kwargs
+            ),
+            meta={"kedro_great": {"source": "statistics_cache"}},
+        )
+
+    return resolve
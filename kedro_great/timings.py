@@ -0,0 +1,217 @@
+import json
+import math
+import os
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+try:
+    import fcntl
+
+    msvcrt = None
+except ImportError:  # Windows
+    import msvcrt
+
+from .budget import get_suite_priority
+
+# Weight of the latest run in the moving average of a suite's runtime,
+# so one slow run nudges the prediction rather than replacing it
+SMOOTHING = 0.3
+
+# Suites faster than this are not worth warning about, their timings are mostly noise
+MIN_REGRESSION_SECONDS = 1.0
+
+
+class SuiteTiming(NamedTuple):
+    seconds: float
+    rows: Optional[int]
+    runs: int
+
+
+class TimingRegression(NamedTuple):
+    suite: str
+    dataset: str
+    seconds: float
+    predicted_seconds: float
+
+
+def frame_rows(df: Any) -> Optional[int]:
+    """
+    The number of rows of a frame, when it is known without computing it.
+    Spark and Dask frames have to be scanned to be counted, so they return None.
+    """
+    shape = getattr(df, "shape", None)
+    if shape and isinstance(shape[0], int):
+        return shape[0]
+    return None
+
+
+class TimingHistory:
+    """
+    Persists the runtime and row count of each suite on each dataset,
+    as a moving average over previous runs, to predict what they will cost.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._timings = self._read()
+        self._updated = set()
+
+    def _read(self) -> Dict[str, Dict[str, SuiteTiming]]:
+        try:
+            with open(self.path) as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return {
+            dataset_name: {
+                suite_name: SuiteTiming(**timing) for suite_name, timing in suites.items()
+            }
+            for dataset_name, suites in entries.items()
+        }
+
+    def get(self, dataset_name: str, suite_name: str) -> Optional[SuiteTiming]:
+        with self._lock:
+            return self._timings.get(dataset_name, {}).get(suite_name)
+
+    def predict(
+        self, dataset_name: str, suite_name: str, rows: Optional[int] = None
+    ) -> Optional[float]:
+        """
+        Predicts the seconds a suite will take, scaled by the number of rows
+        when both this run and the history know it. None if it has never run.
+        """
+        timing = self.get(dataset_name, suite_name)
+        if timing is None:
+            return None
+        if rows is not None and timing.rows:
+            return timing.seconds * rows / timing.rows
+        return timing.seconds
+
+    def predict_dataset(
+        self, dataset_name: str, suite_names: Iterable[str]
+    ) -> Optional[float]:
+        predictions = [self.predict(dataset_name, name) for name in suite_names]
+        known = [p for p in predictions if p is not None]
+        if not known:
+            return None
+        # Suites that have never run are assumed to cost as much as the average one
+        return sum(known) * len(predictions) / len(known)
+
+    def record(
+        self, dataset_name: str, suite_name: str, seconds: float, rows: Optional[int]
+    ) -> None:
+        with self._lock:
+            suites = self._timings.setdefault(dataset_name, {})
+            previous = suites.get(suite_name)
+            if previous is not None:
+                seconds = SMOOTHING * seconds + (1 - SMOOTHING) * previous.seconds
+                if rows is not None and previous.rows is not None:
+                    rows = int(SMOOTHING * rows + (1 - SMOOTHING) * previous.rows)
+                elif rows is None:
+                    rows = previous.rows
+            suites[suite_name] = SuiteTiming(
+                seconds, rows, 1 if previous is None else previous.runs + 1
+            )
+            self._updated.add((dataset_name, suite_name))
+
+    def save(self) -> None:
+        """
+        Writes the timings recorded by this process over the latest file contents,
+        so that concurrent processes only overwrite the timings they both measured.
+        The file is locked while it is read, merged and written, so the `validate`
+        workers saving at the same time do not lose each other's timings.
+        """
+        with self._lock:
+            if not self._updated:
+                return
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with _file_lock(f"{self.path}.lock"):
+                timings = self._read()
+                for dataset_name, suite_name in self._updated:
+                    timings.setdefault(dataset_name, {})[suite_name] = self._timings[
+                        dataset_name
+                    ][suite_name]
+                self._updated = set()
+
+                tmp_path = f"{self.path}.{os.getpid()}.tmp"
+                with open(tmp_path, "w") as f:
+                    json.dump(
+                        {
+                            dataset_name: {
+                                suite_name: timing._asdict()
+                                for suite_name, timing in suites.items()
+                            }
+                            for dataset_name, suites in timings.items()
+                        },
+                        f,
+                    )
+                os.replace(tmp_path, self.path)
+
+
+@contextmanager
+def _file_lock(lock_path: str) -> Iterator[None]:
+    """
+    Holds an exclusive lock on the file across processes, blocking until it is free.
+    """
+    with open(lock_path, "a+") as f:
+        if msvcrt is not None:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        else:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if msvcrt is not None:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def order_suites_by_cost(
+    history: TimingHistory,
+    dataset_name: str,
+    suite_names: List[str],
+    priorities: Dict[Optional[str], int],
+    rows: Optional[int] = None,
+) -> List[str]:
+    """
+    Orders suites by priority, then cheapest first, so that a failing suite is
+    found as early as possible. Suites without a history run last in their priority.
+    """
+    default = max(priorities.values(), default=0) + 1
+
+    def cost(suite_name: str) -> float:
+        predicted = history.predict(dataset_name, suite_name, rows)
+        return math.inf if predicted is None else predicted
+
+    return sorted(
+        suite_names,
+        key=lambda name: (
+            get_suite_priority(priorities, name, default),
+            cost(name),
+            name,
+        ),
+    )
+
+
+def order_datasets_longest_first(
+    history: TimingHistory, suite_names_by_dataset: Dict[str, List[str]]
+) -> List[str]:
+    """
+    Orders datasets by their predicted cost, longest first. Handing them out in this
+    order to a pool of workers packs the long ones early, so the run does not end
+    waiting on a single long dataset. Datasets without a history go first,
+    since they may be the longest.
+    """
+
+    def cost(dataset_name: str) -> float:
+        predicted = history.predict_dataset(
+            dataset_name, suite_names_by_dataset[dataset_name]
+        )
+        return math.inf if predicted is None else predicted
+
+    return sorted(suite_names_by_dataset, key=lambda name: (-cost(name), name))
@@ -0,0 +1,96 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+
+def describe_frame(df: Any) -> Dict[str, int]:
+    """
+    Cheap size information about a frame, for span arguments.
+    Spark frames are left out, as counting them would run a job.
+    """
+    if df is None or type(df).__module__.startswith(("pyspark", "dask.")):
+        return {}
+    description = {}
+    if hasattr(df, "__len__"):
+        description["rows"] = len(df)
+    memory_usage = getattr(df, "memory_usage", None)
+    if memory_usage is not None:
+        description["bytes"] = int(memory_usage(index=True, deep=False).sum())
+    return description
+
+
+class Tracer:
+    """
+    Records nested spans as Chrome trace events, which can be opened in
+    chrome://tracing or https://ui.perfetto.dev. Spans nest by time within
+    each thread, so no explicit parent tracking is needed.
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._events: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    @staticmethod
+    def now() -> float:
+        return time.perf_counter_ns() / 1000
+
+    def add_span(self, name: str, start: float, end: float, **args: Any) -> None:
+        if not self.enabled:
+            return
+        event = {
+            "name": name,
+            "cat": "kedro_great",
+            "ph": "X",
+            "ts": start,
+            "dur": end - start,
+            "pid": self._pid,
+            "tid": threading.get_ident(),
+            "args": {k: v for k, v in args.items() if v is not None},
+        }
+        with self._lock:
+            self._events.append(event)
+
+    def add_events(self, events: List[Dict[str, Any]]) -> None:
+        """
+        Adds events recorded by another tracer, e.g. in the validation daemon.
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self._events.extend(events)
+
+    def pop_thread_events(self, thread_id: int) -> List[Dict[str, Any]]:
+        with self._lock:
+            events = [e for e in self._events if e["tid"] == thread_id]
+            self._events = [e for e in self._events if e["tid"] != thread_id]
+        return events
+
+    @contextmanager
+    def span(self, name: str, **args: Any) -> Iterator[Dict[str, Any]]:
+        """
+        Yields the span arguments, so details only known once the work is
+        done, such as row counts, can still be added to the span.
+        """
+        if not self.enabled:
+            yield args
+            return
+        start = self.now()
+        try:
+            yield args
+        finally:
+            self.add_span(name, start, self.now(), **args)
+
+    def write(self, path: str) -> Optional[str]:
+        with self._lock:
+            events, self._events = self._events, []
+        if not self.enabled or not events:
+            return None
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f, default=str)
+        return path
@@ -12,7 +12,7 @@ setup(
     description="Kedro Great makes integrating Great Expectations with Kedro easy!",
     long_description=long_description,
     long_description_content_type="text/markdown",
-    packages=["kedro_great"],
+    packages=find_packages(include=["kedro_great", "kedro_great.*"]),
     zip_safe=False,
     include_package_data=True,
     license="MIT",
@@ -24,6 +24,10 @@ setup(
         "pyspark",
         "pandas",
     ],
+    extras_require={
+        "arrow": ["pyarrow>=5.0"],
+        "dask": ["dask[dataframe]", "distributed"],
+    },
     classifiers=[
         "License :: OSI Approved :: MIT License",
         "Programming Language :: Python :: 3.6",
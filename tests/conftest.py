@@ -0,0 +1,45 @@
+import great_expectations as ge
+import pytest
+from great_expectations.core import ExpectationConfiguration, ExpectationSuite
+
+from kedro_great.kedro_great import KedroGreat
+
+
+@pytest.fixture
+def ge_context(tmp_path):
+    return ge.data_context.DataContext.create(str(tmp_path))
+
+
+@pytest.fixture
+def make_suite():
+    def make_suite(name, *expectations, **evaluation_parameters):
+        return ExpectationSuite(
+            name,
+            expectations=[
+                ExpectationConfiguration(expectation_type, kwargs)
+                for expectation_type, kwargs in expectations
+            ],
+            evaluation_parameters=evaluation_parameters,
+        )
+
+    return make_suite
+
+
+@pytest.fixture
+def orders_hook(ge_context):
+    for suite_name in ("orders.basic", "orders.warning"):
+        suite = ge_context.create_expectation_suite(suite_name)
+        suite.add_expectation(
+            ExpectationConfiguration("expect_column_values_to_not_be_null", {"column": "id"})
+        )
+        ge_context.save_expectation_suite(suite)
+
+    def orders_hook(**options):
+        return KedroGreat(
+            suite_types=["basic", "warning"],
+            suite_priorities={"basic": 0, "warning": 1},
+            context_root_dir=ge_context.root_directory,
+            **options,
+        )
+
+    return orders_hook
@@ -0,0 +1,77 @@
+import pandas as pd
+import pytest
+from kedro.extras.datasets.pandas import CSVDataSet
+
+from kedro_great.backends import arrow
+from kedro_great.backends.arrow import ArrowBackend, arrow_compute_available
+
+requires_arrow = pytest.mark.skipif(
+    not arrow_compute_available(), reason="requires a recent pyarrow"
+)
+
+CSV = "# exported\nid;name;score\n1;a;0.5\n2;b;1.5\n3;c;2.5\n"
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text(CSV)
+    return str(path)
+
+
+@requires_arrow
+@pytest.mark.parametrize(
+    "load_args",
+    [
+        {"sep": ";", "skiprows": 1},
+        {"sep": ";", "skiprows": 1, "header": 0, "names": ["a", "b", "c"]},
+        {"sep": ";", "skiprows": 2, "header": None, "names": ["a", "b", "c"]},
+        {"delimiter": ";", "skiprows": 1, "dtype": {"id": "float64", "name": "str"}},
+    ],
+)
+def test_csv_load_args_are_read_like_pandas(csv_path, load_args):
+    dataset = CSVDataSet(csv_path, load_args=load_args)
+
+    table = arrow._open_arrow_dataset(dataset).to_table()
+
+    pd.testing.assert_frame_equal(table.to_pandas(), dataset.load())
+
+
+@requires_arrow
+@pytest.mark.parametrize(
+    "load_args",
+    [
+        {"sep": ";", "skiprows": 1, "na_values": ["c"]},
+        {"sep": ";", "skiprows": [0]},
+        {"sep": r"\s*;\s*", "skiprows": 1},
+        {"sep": ";", "skiprows": 1, "dtype": {"name": "category"}},
+        {"sep": ";", "header": 1},
+    ],
+)
+def test_csv_load_args_without_arrow_equivalent_are_parsed_by_pandas(
+    csv_path, load_args
+):
+    dataset = CSVDataSet(csv_path, load_args=load_args)
+
+    assert arrow._open_arrow_dataset(dataset) is None
+
+
+@requires_arrow
+def test_metrics_of_files_parsed_by_pandas(csv_path):
+    dataset = CSVDataSet(csv_path, load_args={"sep": ";", "skiprows": 1, "na_values": ["c"]})
+
+    computed = ArrowBackend().compute_metrics(
+        dataset, None, [("row_count",), ("null_count", "name")]
+    )
+
+    assert computed[("row_count",)] == 3
+    assert computed[("null_count", "name")] == 1
+
+
+def test_backend_is_skipped_without_a_recent_pyarrow(csv_path, monkeypatch):
+    monkeypatch.setattr(arrow, "arrow_compute_available", lambda: False)
+
+    backend = ArrowBackend()
+
+    assert not backend.can_validate(CSVDataSet(csv_path), None)
+    assert not backend.can_validate(CSVDataSet(csv_path), pd.DataFrame())
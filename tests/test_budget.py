@@ -0,0 +1,143 @@
+import pandas as pd
+from kedro.io import MemoryDataSet
+
+from kedro_great.budget import (
+    ValidationBudget,
+    fit_rows_to_budget,
+    order_suites_by_priority,
+    resolve_budget,
+    sample_frame,
+)
+
+
+def test_suite_budget_overrides_dataset_budget_fields():
+    budgets = {
+        "orders": {"max_seconds": 10, "max_rows": 1000},
+        "orders.warning": ValidationBudget(max_rows=100),
+    }
+
+    assert resolve_budget(budgets, "orders", "orders.warning") == ValidationBudget(
+        max_seconds=10, max_rows=100
+    )
+    assert resolve_budget(budgets, "orders", "orders.basic") == ValidationBudget(
+        max_seconds=10, max_rows=1000
+    )
+    assert resolve_budget(budgets, "customers", "customers.basic") == ValidationBudget()
+
+
+def test_fit_rows_to_budget():
+    df = pd.DataFrame({"id": range(100), "name": ["name"] * 100})
+    memory = int(df.memory_usage(deep=True).sum())
+
+    assert fit_rows_to_budget(df, ValidationBudget()) is None
+    assert fit_rows_to_budget(df, ValidationBudget(max_rows=100)) is None
+    assert fit_rows_to_budget(df, ValidationBudget(max_rows=10)) == (10, 100)
+    assert fit_rows_to_budget(df, ValidationBudget(max_memory=memory // 4)) == (25, 100)
+    assert fit_rows_to_budget(
+        df, ValidationBudget(max_rows=50, max_memory=memory // 4)
+    ) == (25, 100)
+    assert fit_rows_to_budget(df, ValidationBudget(max_memory=1)) == (1, 100)
+
+
+def test_sample_frame_is_reproducible():
+    df = pd.DataFrame({"id": range(100)})
+
+    assert sample_frame(df, 100, 100) is df
+    sample = sample_frame(df, 10, 100)
+    assert len(sample) == 10
+    assert sample.equals(sample_frame(df, 10, 100))
+
+
+def test_order_suites_by_priority():
+    suite_names = ["orders.warning", "orders", "orders.basic", "orders.audit"]
+
+    assert order_suites_by_priority(
+        {"basic": 0, "warning": 1, None: 2}, suite_names
+    ) == ["orders.basic", "orders.warning", "orders", "orders.audit"]
+    assert order_suites_by_priority(
+        {"basic": 0, "orders.audit": 0}, suite_names
+    ) == ["orders.audit", "orders.basic", "orders", "orders.warning"]
+
+
+def test_exhausted_time_budget_skips_all_but_critical_suites(orders_hook):
+    kedro_great = orders_hook(validation_budgets={"orders": {"max_seconds": 0}})
+
+    results = kedro_great.run_suites(
+        "orders",
+        None,
+        pd.DataFrame({"id": range(100)}),
+        ["orders.basic", "orders.warning"],
+        "budget",
+    )
+
+    assert results == {"orders.basic": True}
+    report = kedro_great.run_report()
+    assert [(s.suite, s.reason) for s in report["skipped"]] == [
+        ("orders.warning", "time budget of 0s exhausted")
+    ]
+
+
+def test_row_budget_samples_non_critical_suites(orders_hook):
+    kedro_great = orders_hook(validation_budgets={"orders": {"max_rows": 10}})
+
+    results = kedro_great.run_suites(
+        "orders",
+        None,
+        pd.DataFrame({"id": range(100)}),
+        ["orders.basic", "orders.warning"],
+        "budget",
+    )
+
+    assert results == {"orders.basic": True, "orders.warning": True}
+    assert kedro_great.run_report()["sampled"] == [("orders.warning", "orders", 10)]
+
+
+def test_frame_memory_is_estimated_once(orders_hook, monkeypatch):
+    estimated = []
+
+    def estimate_memory(df):
+        estimated.append(len(df))
+        return 1000
+
+    monkeypatch.setattr("kedro_great.kedro_great.estimate_memory", estimate_memory)
+    monkeypatch.setattr("kedro_great.budget.estimate_memory", estimate_memory)
+    monkeypatch.setattr("kedro_great.memory.estimate_memory", estimate_memory)
+    kedro_great = orders_hook(
+        validation_budgets={
+            "orders": {"max_memory": 500},
+            "orders.warning": {"max_rows": 50, "max_memory": 250},
+        },
+        memory_ceiling=2 ** 40,
+    )
+    # Neither suite is critical, so both are fitted to their budgets
+    kedro_great.suite_priorities = {"basic": 1, "warning": 1}
+
+    results = kedro_great.run_suites(
+        "orders",
+        None,
+        pd.DataFrame({"id": range(100)}),
+        ["orders.basic", "orders.warning"],
+        "budget",
+    )
+
+    assert results == {"orders.basic": True, "orders.warning": True}
+    assert kedro_great.run_report()["sampled"] == [
+        ("orders.basic", "orders", 50),
+        ("orders.warning", "orders", 25),
+    ]
+    assert estimated == [100]
+
+
+def test_suites_skipped_for_budget_can_be_claimed_again(orders_hook):
+    kedro_great = orders_hook(validation_budgets={"orders": {"max_seconds": 0}})
+    df = pd.DataFrame({"id": range(100)})
+
+    kedro_great._validate_dataset("orders", MemoryDataSet(df), df, "budget", False)
+
+    assert kedro_great.run_report()["finished"] == ["orders.basic"]
+    kedro_great.validation_budgets = {}
+    kedro_great._validate_dataset("orders", MemoryDataSet(df), df, "budget", False)
+
+    report = kedro_great.run_report()
+    assert report["finished"] == ["orders.basic", "orders.warning"]
+    assert report["totals"]["passed"] == 2
@@ -0,0 +1,49 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+from kedro.extras.datasets.pandas import CSVDataSet
+
+from kedro_great.conversion import ConversionCache
+
+
+def _csv_dataset(tmp_path, name, rows=1000):
+    filepath = str(tmp_path / f"{name}.csv")
+    pd.DataFrame({"id": range(rows), "name": [str(i) for i in range(rows)]}).to_csv(
+        filepath, index=False
+    )
+    return CSVDataSet(filepath)
+
+
+def test_concurrent_conversions_of_a_dataset_do_not_collide(tmp_path):
+    dataset = _csv_dataset(tmp_path, "shared")
+    cache = ConversionCache(str(tmp_path / "cache"))
+
+    with ThreadPoolExecutor(8) as pool:
+        paths = list(pool.map(lambda _: cache.convert(dataset), range(16)))
+
+    assert len(set(paths)) == 1 and paths[0] is not None
+    assert os.listdir(str(tmp_path / "cache")) == [os.path.basename(paths[0])]
+    pd.testing.assert_frame_equal(cache.load(dataset), dataset.load())
+
+
+def test_least_recently_used_copies_are_evicted(tmp_path):
+    datasets = [_csv_dataset(tmp_path, f"dataset_{i}") for i in range(3)]
+    cache = ConversionCache(str(tmp_path / "cache"), max_bytes=0)
+
+    paths = [cache.convert(dataset) for dataset in datasets]
+
+    assert not os.path.exists(paths[0])
+    assert not os.path.exists(paths[1])
+    assert os.path.exists(paths[2])
+
+
+def test_changed_files_are_converted_again(tmp_path):
+    dataset = _csv_dataset(tmp_path, "changing")
+    cache = ConversionCache(str(tmp_path / "cache"))
+    path = cache.convert(dataset)
+
+    _csv_dataset(tmp_path, "changing", rows=10)
+
+    assert cache.get_path(dataset) != path
+    assert len(cache.load(dataset)) == 10
@@ -0,0 +1,189 @@
+import threading
+import time
+from contextlib import contextmanager
+
+import pandas as pd
+import pytest
+from kedro.io import DataCatalog, MemoryDataSet
+
+from great_expectations.core import ExpectationConfiguration
+
+from kedro_great import daemon
+from kedro_great.daemon import DaemonClient, ValidationDaemon
+from kedro_great.kedro_great import ValidationReport
+
+
+class FakeKedroGreat:
+    def __init__(self, seconds=0.0):
+        self.seconds = seconds
+        self.threads = set()
+        self.rows = []
+
+    def validate_dataset(
+        self, dataset_name, dataset, df, run_id, read_from_catalog, suite_names, **kwargs
+    ):
+        if df is None:
+            df = dataset.load()
+        self.threads.add(threading.get_ident())
+        self.rows.append(len(df))
+        time.sleep(self.seconds)
+        return {suite_name: True for suite_name in suite_names}
+
+    @contextmanager
+    def capture_report(self):
+        yield ValidationReport()
+
+    def save_timings(self):
+        pass
+
+
+@pytest.fixture
+def serve(tmp_path):
+    servers = []
+
+    def serve(kedro_great, workers=2, catalog=None):
+        socket_path = str(tmp_path / "daemon.sock")
+        if catalog is None:
+            catalog = DataCatalog({"dataset": MemoryDataSet(pd.DataFrame({"id": [1, 2]}))})
+        server = ValidationDaemon(socket_path, catalog, kedro_great, workers)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return socket_path
+
+    yield serve
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def test_requests_are_handled_by_a_fixed_pool(serve):
+    kedro_great = FakeKedroGreat(seconds=0.05)
+    client = DaemonClient(serve(kedro_great, workers=2))
+    df = pd.DataFrame({"id": range(10)})
+
+    def validate(_):
+        return client.validate("dataset", ["dataset.basic"], "run", df)
+
+    threads = [threading.Thread(target=validate, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert kedro_great.rows == [10] * 8
+    assert len(kedro_great.threads) <= 2
+
+
+def test_daemon_loads_datasets_from_its_catalog(serve):
+    kedro_great = FakeKedroGreat()
+    client = DaemonClient(serve(kedro_great))
+
+    results, _ = client.validate("dataset", ["dataset.basic"], "run")
+
+    assert results == {"dataset.basic": True}
+    assert kedro_great.rows == [2]
+
+
+def test_daemon_reports_are_merged_into_the_run_report(serve, orders_hook, ge_context):
+    suite = ge_context.get_expectation_suite("orders.warning")
+    suite.add_expectation(
+        ExpectationConfiguration(
+            "expect_column_values_to_be_between", {"column": "id", "max_value": 2}
+        )
+    )
+    ge_context.save_expectation_suite(suite)
+    served_hook = orders_hook(track_memory=True, extract_failing_rows=True)
+    orders = pd.DataFrame({"id": [1, 2, 3]})
+    socket_path = serve(
+        served_hook, catalog=DataCatalog({"orders": MemoryDataSet(orders)})
+    )
+    kedro_great = orders_hook(daemon_socket=socket_path)
+
+    for run_id in ("first", "second"):
+        kedro_great._validate_dataset("orders", MemoryDataSet(), orders, run_id, False)
+        kedro_great._finished_suites.clear()
+
+    report = kedro_great.run_report()
+    assert report["totals"]["suites"] == 4
+    assert report["totals"]["passed"] == 2
+    assert [(s.suite, s.run_id) for s in report["summaries"]] == [
+        ("orders.warning", "first"),
+        ("orders.warning", "second"),
+    ]
+    assert report["summaries"][0].failed_expectations == (
+        "expect_column_values_to_be_between",
+    )
+    assert [f.suite for f in report["failed"]] == ["orders.warning"] * 2
+    assert [(r.suite, r.rows) for r in report["failing_rows"]] == [
+        ("orders.warning", 1)
+    ] * 2
+    assert sorted(m.suite for m in report["memory"]) == [
+        "orders.basic",
+        "orders.basic",
+        "orders.warning",
+        "orders.warning",
+    ]
+    # Each request reported to the client, so nothing is left in the daemon
+    served_report = served_hook.run_report()
+    assert served_report["totals"]["suites"] == 0
+    assert served_report["summaries"] == []
+    assert served_report["memory"] == []
+    assert served_report["failing_rows"] == []
+
+
+def test_validation_report_round_trips(orders_hook):
+    kedro_great = orders_hook()
+    with kedro_great.capture_report() as captured:
+        kedro_great._validate_dataset(
+            "orders", MemoryDataSet(), pd.DataFrame({"id": [None]}), "run", False
+        )
+
+    round_tripped = ValidationReport.from_dict(captured.to_dict())
+
+    assert round_tripped.to_dict() == captured.to_dict()
+    assert [s.suite for s in round_tripped.summaries] == ["orders.basic", "orders.warning"]
+    assert kedro_great.run_report()["summaries"] == []
+
+
+def test_missing_daemon_falls_back(tmp_path):
+    client = DaemonClient(str(tmp_path / "missing.sock"))
+
+    assert client.validate("dataset", ["dataset.basic"], "run") is None
+
+
+def test_slow_daemon_falls_back(serve):
+    client = DaemonClient(serve(FakeKedroGreat(seconds=1.0)), timeout=0.1)
+
+    assert client.validate("dataset", ["dataset.basic"], "run") is None
+
+
+def test_frames_which_cannot_be_shipped_fall_back(serve, monkeypatch):
+    def frame_to_arrow(df):
+        raise ImportError("No module named 'pyarrow'")
+
+    monkeypatch.setattr(daemon, "frame_to_arrow", frame_to_arrow)
+    client = DaemonClient(serve(FakeKedroGreat()))
+
+    assert client.validate("dataset", ["dataset.basic"], "run", pd.DataFrame()) is None
+
+
+def test_client_waits_a_finite_time_by_default():
+    assert DaemonClient("daemon.sock").timeout is not None
+
+
+def test_served_hook_keeps_the_project_options(tmp_path):
+    import great_expectations as ge
+
+    from kedro_great import KedroGreat
+
+    context = ge.data_context.DataContext.create(str(tmp_path))
+    project_hook = KedroGreat(
+        context_root_dir=context.root_directory, fail_fast=True, use_daemon=True
+    )
+
+    served_hook = project_hook.with_options(use_daemon=False, cache_suites=True)
+
+    assert served_hook._fail_fast
+    assert served_hook._daemon_client is None
+    assert served_hook._suite_cache is not None
+    assert served_hook.expectation_context.root_directory == context.root_directory
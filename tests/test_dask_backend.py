@@ -0,0 +1,129 @@
+import threading
+
+import pandas as pd
+import pytest
+from great_expectations.core import ExpectationConfiguration
+from kedro.io import MemoryDataSet
+
+dd = pytest.importorskip("dask.dataframe")
+
+from kedro_great.backends import dask as dask_backend  # noqa: E402
+from kedro_great.backends.dask import DaskBackend  # noqa: E402
+
+METRICS = [
+    ("row_count",),
+    ("null_count", "score"),
+    ("min", "id"),
+    ("max", "id"),
+    ("distinct_count", "name"),
+    ("out_of_range_count", "id", 2, None, False, False),
+]
+
+
+def _frame():
+    df = pd.DataFrame(
+        {"id": [1, 2, 3, 4], "name": ["a", "b", "b", "c"], "score": [0.5, None, 1.5, 2.0]}
+    )
+    return dd.from_pandas(df, npartitions=2)
+
+
+def _check_metrics(computed):
+    assert computed[("columns",)] == ["id", "name", "score"]
+    assert computed[("row_count",)] == 4
+    assert computed[("null_count", "score")] == 1
+    assert computed[("min", "id")] == 1
+    assert computed[("max", "id")] == 4
+    assert computed[("distinct_count", "name")] == 3
+    assert computed[("out_of_range_count", "id", 2, None, False, False)] == 1
+
+
+def test_metrics_on_the_threaded_scheduler(monkeypatch):
+    backend = DaskBackend()
+    monkeypatch.setattr(backend, "_get_client", lambda: None)
+
+    _check_metrics(backend.compute_metrics(None, _frame(), METRICS))
+
+
+def test_cluster_is_private_and_closed():
+    distributed = pytest.importorskip("distributed")
+    backend = DaskBackend(n_workers=1)
+    try:
+        _check_metrics(backend.compute_metrics(None, _frame(), METRICS))
+        client = backend._client
+        assert client is not None
+        # The pipeline's own dask computations keep their scheduler
+        with pytest.raises(ValueError):
+            distributed.default_client()
+    finally:
+        backend.close()
+
+    assert backend._client is None
+    assert client.status == "closed"
+
+
+def test_hook_validates_dask_frames_and_closes_backends(orders_hook, monkeypatch):
+    closed = []
+    monkeypatch.setattr(DaskBackend, "_get_client", lambda self: None)
+    monkeypatch.setattr(DaskBackend, "close", lambda self: closed.append(self))
+    kedro_great = orders_hook()
+    ddf = _frame()
+
+    kedro_great._validate_dataset("orders", MemoryDataSet(ddf), ddf, "run", False)
+
+    assert kedro_great.run_report()["totals"]["passed"] == 2
+    kedro_great.after_pipeline_run({"run_id": "run"}, None, None)
+    assert len(closed) == 1
+
+
+def test_validate_dataset_routes_dask_frames_through_the_backend(
+    orders_hook, ge_context, monkeypatch
+):
+    monkeypatch.setattr(DaskBackend, "_get_client", lambda self: None)
+    suite = ge_context.get_expectation_suite("orders.warning")
+    suite.add_expectation(
+        ExpectationConfiguration(
+            "expect_column_max_to_be_between", {"column": "id", "max_value": 3}
+        )
+    )
+    ge_context.save_expectation_suite(suite)
+    kedro_great = orders_hook()
+    ddf = _frame()
+
+    # As the validate command and the daemon do, which never raise on failures
+    results = kedro_great.validate_dataset(
+        "orders", MemoryDataSet(ddf), ddf, "run", False, ["orders.basic", "orders.warning"]
+    )
+
+    assert results == {"orders.basic": True, "orders.warning": False}
+
+
+def test_backend_cache_is_shared_between_threads(orders_hook, monkeypatch):
+    created = []
+
+    def get_backend(name):
+        created.append(name)
+        return DaskBackend()
+
+    monkeypatch.setattr("kedro_great.kedro_great.get_backend", get_backend)
+    kedro_great = orders_hook()
+    ddf = _frame()
+    barrier = threading.Barrier(8)
+    backends = []
+
+    def run():
+        barrier.wait()
+        backends.append(kedro_great._get_backend("orders", MemoryDataSet(ddf), ddf))
+
+    threads = [threading.Thread(target=run) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert created == ["dask"]
+    assert len({id(backend) for backend in backends}) == 1
+
+
+def test_dask_datasets_are_recognized():
+    assert dask_backend.is_dask_frame(_frame())
+    assert not dask_backend.is_dask_frame(pd.DataFrame())
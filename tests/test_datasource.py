@@ -0,0 +1,124 @@
+import great_expectations as ge
+import pytest
+from click.testing import CliRunner
+from great_expectations.cli.datasource import DatasourceTypes
+from kedro.extras.datasets.pandas import CSVDataSet
+from kedro.io import DataCatalog, MemoryDataSet
+
+from kedro_great.cli.datasource import (
+    datasource_new,
+    generate_datasources,
+    migrate_to_shared_datasources,
+)
+from kedro_great.data import (
+    find_datasource_name,
+    generate_datasource_name,
+    generate_shared_datasource_name,
+)
+
+RAW = generate_shared_datasource_name(DatasourceTypes.PANDAS, "data/01_raw")
+PRIMARY = generate_shared_datasource_name(DatasourceTypes.PANDAS, "data/03_primary")
+
+
+class FakeKedroContext:
+    def __init__(self):
+        self.catalog = DataCatalog(
+            {
+                "orders": CSVDataSet("data/01_raw/orders.csv"),
+                "customers": CSVDataSet("data/01_raw/customers.csv"),
+                "sales": CSVDataSet("data/03_primary/sales.csv"),
+                "model": MemoryDataSet(),
+            }
+        )
+
+
+@pytest.fixture
+def kedro_context():
+    return FakeKedroContext()
+
+
+@pytest.fixture
+def per_dataset_context(ge_context, kedro_context):
+    generate_datasources(kedro_context, ge_context)
+    return ge_context
+
+
+def _datasource_names(directory):
+    return sorted(ds["name"] for ds in ge.data_context.DataContext(directory).list_datasources())
+
+
+def test_datasources_are_replaced_by_shared_ones(per_dataset_context, kedro_context):
+    migrated = migrate_to_shared_datasources(kedro_context, per_dataset_context)
+
+    assert migrated == {
+        generate_datasource_name("orders"): RAW,
+        generate_datasource_name("customers"): RAW,
+        generate_datasource_name("sales"): PRIMARY,
+    }
+    # Saved to the project config, so the next DataContext loads the shared ones
+    assert _datasource_names(per_dataset_context.root_directory) == sorted([RAW, PRIMARY])
+    assert (
+        find_datasource_name(
+            "orders",
+            DatasourceTypes.PANDAS,
+            "data/01_raw/orders.csv",
+            {RAW, PRIMARY},
+        )
+        == RAW
+    )
+
+
+def test_migration_is_idempotent(per_dataset_context, kedro_context):
+    migrate_to_shared_datasources(kedro_context, per_dataset_context)
+
+    context = ge.data_context.DataContext(per_dataset_context.root_directory)
+    assert migrate_to_shared_datasources(kedro_context, context) == {}
+    assert _datasource_names(context.root_directory) == sorted([RAW, PRIMARY])
+
+
+def test_existing_shared_datasources_are_reused(ge_context, kedro_context):
+    generate_datasources(kedro_context, ge_context, shared=True)
+    ge_context.add_datasource(
+        generate_datasource_name("sales"),
+        class_name="PandasDatasource",
+    )
+
+    migrated = migrate_to_shared_datasources(kedro_context, ge_context)
+
+    assert migrated == {generate_datasource_name("sales"): PRIMARY}
+    assert _datasource_names(ge_context.root_directory) == sorted([RAW, PRIMARY])
+
+
+def test_dry_run_only_measures(per_dataset_context, monkeypatch):
+    def load_context(*args, **kwargs):
+        raise AssertionError("The dry run loaded the kedro project")
+
+    monkeypatch.setattr("kedro.framework.context.load_context", load_context)
+    before = _datasource_names(per_dataset_context.root_directory)
+
+    result = CliRunner().invoke(
+        datasource_new,
+        ["--directory", per_dataset_context.root_directory, "migrate", "--dry-run"],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "3 datasources, DataContext loads in" in result.output
+    assert _datasource_names(per_dataset_context.root_directory) == before
+
+
+def test_migrate_command(per_dataset_context, kedro_context, monkeypatch):
+    monkeypatch.setattr(
+        "kedro.framework.context.load_context", lambda *args, **kwargs: kedro_context
+    )
+    directory = per_dataset_context.root_directory
+
+    result = CliRunner().invoke(datasource_new, ["--directory", directory, "migrate"])
+
+    assert result.exit_code == 0, result.output
+    assert "Migrated 3 datasources into 2 shared datasources." in result.output
+    assert "2 datasources, DataContext loads in" in result.output
+
+    result = CliRunner().invoke(datasource_new, ["--directory", directory, "migrate"])
+
+    assert result.exit_code == 0, result.output
+    assert "No datasources to migrate." in result.output
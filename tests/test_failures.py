@@ -0,0 +1,110 @@
+import pandas as pd
+import pytest
+from great_expectations.core import ExpectationConfiguration
+
+from kedro_great.failures import FAILED_EXPECTATIONS_COLUMN, find_failing_rows
+
+
+def _between(max_value):
+    return ExpectationConfiguration(
+        "expect_column_values_to_be_between", {"column": "id", "max_value": max_value}
+    )
+
+
+def _read_failing_rows(kedro_great):
+    [failing_rows] = kedro_great.run_report()["failing_rows"]
+    if failing_rows.path.endswith(".parquet"):
+        return pd.read_parquet(failing_rows.path)
+    return pd.read_csv(failing_rows.path, index_col=0)
+
+
+@pytest.fixture
+def orders():
+    return pd.DataFrame({"id": [1, 2, 3, 4], "name": ["a", "b", "c", "d"]})
+
+
+def test_failing_rows_are_the_unexpected_rows(orders):
+    rows = find_failing_rows(
+        orders,
+        [
+            _between(2),
+            ExpectationConfiguration(
+                "expect_column_values_to_be_in_set",
+                {"column": "name", "value_set": ["a", "b", "c"]},
+            ),
+        ],
+        10,
+    )
+
+    assert list(rows["id"]) == [3, 4]
+    assert list(rows[FAILED_EXPECTATIONS_COLUMN]) == [
+        "expect_column_values_to_be_between",
+        "expect_column_values_to_be_between, expect_column_values_to_be_in_set",
+    ]
+
+
+def test_failing_rows_are_capped(orders):
+    assert len(find_failing_rows(orders, [_between(0)], 2)) == 2
+
+
+def test_evaluation_parameters_are_substituted(orders):
+    rows = find_failing_rows(
+        orders, [_between({"$PARAMETER": "max_id"})], 10, {"max_id": 3}
+    )
+
+    assert list(rows["id"]) == [4]
+
+
+def test_unknown_evaluation_parameters_blame_no_row(orders):
+    assert find_failing_rows(orders, [_between({"$PARAMETER": "max_id"})], 10) is None
+
+
+def test_aggregate_failures_blame_no_row(orders):
+    expectation = ExpectationConfiguration(
+        "expect_column_max_to_be_between", {"column": "id", "max_value": 2}
+    )
+
+    assert find_failing_rows(orders, [expectation], 10) is None
+
+
+def _add_to_suite(ge_context, suite_name, expectation, **evaluation_parameters):
+    suite = ge_context.get_expectation_suite(suite_name)
+    suite.add_expectation(expectation)
+    suite.evaluation_parameters = evaluation_parameters
+    ge_context.save_expectation_suite(suite)
+
+
+def test_passing_suites_pass_when_extracting_failing_rows(orders_hook, orders):
+    kedro_great = orders_hook(extract_failing_rows=True)
+
+    assert kedro_great.run_suites(
+        "orders", None, orders, ["orders.basic", "orders.warning"], "run"
+    ) == {"orders.basic": True, "orders.warning": True}
+    assert kedro_great.run_report()["failing_rows"] == []
+
+
+def test_failing_rows_have_every_column_with_compiled_plans(
+    orders_hook, ge_context, orders
+):
+    _add_to_suite(ge_context, "orders.warning", _between(3))
+    kedro_great = orders_hook(extract_failing_rows=True, compiled_plans=True)
+
+    results = kedro_great.run_suites(
+        "orders", None, orders, ["orders.basic", "orders.warning"], "run"
+    )
+
+    assert results == {"orders.basic": True, "orders.warning": False}
+    rows = _read_failing_rows(kedro_great)
+    assert list(rows["id"]) == [4]
+    assert list(rows["name"]) == ["d"]
+
+
+def test_failing_rows_of_parameterized_expectations(orders_hook, ge_context, orders):
+    _add_to_suite(
+        ge_context, "orders.warning", _between({"$PARAMETER": "max_id"}), max_id=2
+    )
+    kedro_great = orders_hook(extract_failing_rows=True)
+
+    kedro_great.run_suites("orders", None, orders, ["orders.warning"], "run")
+
+    assert list(_read_failing_rows(kedro_great)["id"]) == [3, 4]
@@ -0,0 +1,88 @@
+import great_expectations as ge
+
+from kedro_great.memo import ExpectationMemo
+
+
+def _dataset(memo, expectation_types):
+    dataset = ge.from_pandas({"id": [1, 2, None], "name": ["a", "b", "c"]})
+    memo.attach(dataset, expectation_types)
+    return dataset
+
+
+def test_shared_expectations_are_evaluated_once(make_suite):
+    not_null = ("expect_column_values_to_not_be_null", {"column": "id"})
+    basic = make_suite("dataset.basic", not_null)
+    warning = make_suite(
+        "dataset.warning",
+        not_null,
+        ("expect_column_values_to_be_in_set", {"column": "name", "value_set": ["a", "b"]}),
+    )
+    memo = ExpectationMemo()
+    dataset = _dataset(
+        memo, [e.expectation_type for e in basic.expectations + warning.expectations]
+    )
+
+    basic_validation = dataset.validate(expectation_suite=basic)
+    warning_validation = dataset.validate(expectation_suite=warning)
+
+    assert memo.misses == 2
+    assert memo.hits == 1
+    assert not basic_validation.success
+    assert [r.success for r in warning_validation.results] == [False, False]
+    assert (
+        warning_validation.results[0].result["unexpected_count"]
+        == basic_validation.results[0].result["unexpected_count"]
+        == 1
+    )
+
+
+def test_different_kwargs_are_evaluated_separately():
+    memo = ExpectationMemo()
+    dataset = _dataset(memo, ["expect_column_values_to_not_be_null"])
+
+    assert not dataset.expect_column_values_to_not_be_null(column="id").success
+    assert dataset.expect_column_values_to_not_be_null(column="id", mostly=0.5).success
+
+    assert memo.misses == 2
+    assert memo.hits == 0
+
+
+def test_cached_results_are_copies():
+    memo = ExpectationMemo()
+    dataset = _dataset(memo, ["expect_column_values_to_not_be_null"])
+
+    first = dataset.expect_column_values_to_not_be_null(column="id")
+    first.result["unexpected_count"] = 100
+    second = dataset.expect_column_values_to_not_be_null(column="id")
+
+    assert second.result["unexpected_count"] == 1
+
+
+def test_resolvers_answer_without_evaluating():
+    resolved = ge.from_pandas({"id": [1]}).expect_column_to_exist(column="id")
+
+    def resolver(expectation_type, kwargs):
+        return resolved if expectation_type == "expect_column_to_exist" else None
+
+    memo = ExpectationMemo([resolver])
+    dataset = _dataset(
+        memo, ["expect_column_to_exist", "expect_column_values_to_not_be_null"]
+    )
+
+    assert memo.can_resolve("expect_column_to_exist", {"column": "missing"})
+    assert not memo.can_resolve("expect_column_values_to_not_be_null", {"column": "id"})
+    assert dataset.expect_column_to_exist(column="missing").success
+    dataset.expect_column_values_to_not_be_null(column="id")
+
+    assert memo.resolved == 1
+    assert memo.misses == 1
+    assert len(memo) == 2
+
+
+def test_attach_leaves_the_class_untouched():
+    memo = ExpectationMemo()
+    dataset = _dataset(memo, ["expect_column_values_to_not_be_null"])
+    dataset.expect_column_values_to_not_be_null(column="id")
+    ge.from_pandas({"id": [1]}).expect_column_values_to_not_be_null(column="id")
+
+    assert memo.misses == 1
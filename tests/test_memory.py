@@ -0,0 +1,102 @@
+import threading
+import tracemalloc
+
+import pandas as pd
+
+from kedro_great import memory
+from kedro_great.memory import MemoryTracker, fit_rows_to_memory_ceiling
+
+
+def test_overlapping_trackers_keep_tracing_until_the_last_one_ends():
+    outer = MemoryTracker(trace_allocations=True)
+    inner = MemoryTracker(trace_allocations=True)
+
+    with outer.track():
+        with inner.track():
+            assert tracemalloc.is_tracing()
+        assert tracemalloc.is_tracing()
+        data = [0] * 100_000
+    assert not tracemalloc.is_tracing()
+    assert outer.allocation_peak >= 100_000
+    del data
+
+
+def test_concurrent_trackers_stop_tracing_once():
+    started = threading.Barrier(8)
+    errors = []
+
+    def track():
+        try:
+            with MemoryTracker(trace_allocations=True).track():
+                started.wait()
+                assert tracemalloc.is_tracing()
+        except Exception as e:  # pylint: disable=broad-except
+            errors.append(e)
+
+    threads = [threading.Thread(target=track) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    assert not tracemalloc.is_tracing()
+
+
+def test_tracing_started_elsewhere_is_left_on():
+    tracemalloc.start()
+    try:
+        with MemoryTracker(trace_allocations=True).track():
+            pass
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+
+
+def test_fit_rows_to_memory_ceiling(monkeypatch):
+    df = pd.DataFrame({"id": range(100_000)})
+    frame_memory = 1_000_000
+    monkeypatch.setattr(memory, "current_rss", lambda: 1_000_000)
+
+    assert fit_rows_to_memory_ceiling(df, 10_000_000, frame_memory) is None
+    assert fit_rows_to_memory_ceiling(df, 2_000_000, frame_memory) == (50_000, 100_000)
+    # Fewer than MIN_SAMPLE_ROWS would fit
+    assert fit_rows_to_memory_ceiling(df, 1_010_000, frame_memory) == (0, 100_000)
+    assert fit_rows_to_memory_ceiling(df, 500_000, frame_memory) == (0, 100_000)
+
+
+def test_reached_memory_ceiling_skips_all_but_critical_suites(orders_hook, monkeypatch):
+    kedro_great = orders_hook(memory_ceiling=1_000)
+    monkeypatch.setattr(memory, "current_rss", lambda: 2_000)
+
+    results = kedro_great.run_suites(
+        "orders",
+        None,
+        pd.DataFrame({"id": [1, 2, None] * 1_000}),
+        ["orders.basic", "orders.warning"],
+        "ceiling",
+    )
+
+    # The critical suite ran on every row, and caught the nulls
+    assert results == {"orders.basic": False}
+    report = kedro_great.run_report()
+    assert report["sampled"] == []
+    assert [(s.suite, s.reason) for s in report["skipped"]] == [
+        ("orders.warning", "memory ceiling of 1000 bytes reached")
+    ]
+
+
+def test_memory_is_only_measured_when_tracked(orders_hook, monkeypatch):
+    measured = []
+    monkeypatch.setattr(memory, "current_rss", lambda: measured.append(1))
+    df = pd.DataFrame({"id": [1, 2, 3]})
+
+    orders_hook().run_suites("orders", None, df, ["orders.basic"], "untracked")
+    assert measured == []
+
+    kedro_great = orders_hook(track_memory=True)
+    kedro_great.run_suites("orders", None, df, ["orders.basic"], "tracked")
+    assert len(measured) == 2
+    assert [usage.suite for usage in kedro_great.run_report()["memory"]] == [
+        "orders.basic"
+    ]
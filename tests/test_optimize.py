@@ -0,0 +1,134 @@
+import pytest
+from great_expectations.core import ExpectationConfiguration, ExpectationSuite
+
+from kedro_great.optimize import (
+    find_implied_across_suites,
+    find_implied_expectations,
+    implies,
+    optimize_suite,
+)
+
+
+def _e(expectation_type, **kwargs):
+    return ExpectationConfiguration(expectation_type, kwargs)
+
+
+def _between(**kwargs):
+    return _e("expect_column_values_to_be_between", column="id", **kwargs)
+
+
+@pytest.mark.parametrize(
+    "a, b, expected",
+    [
+        (_between(min_value=1, max_value=5), _between(min_value=0, max_value=10), True),
+        (_between(min_value=0, max_value=10), _between(min_value=1, max_value=5), False),
+        (_between(min_value=1, max_value=5), _between(min_value=0), True),
+        (_between(min_value=0), _between(min_value=0, max_value=10), False),
+        (_between(min_value=0, strict_min=True), _between(min_value=0), True),
+        (_between(min_value=0), _between(min_value=0, strict_min=True), False),
+        (_between(min_value="2020-01-01"), _between(min_value=0), False),
+        (_between(min_value=0, mostly=0.9), _between(min_value=0, mostly=0.95), False),
+        (_between(min_value=0, mostly=0.95), _between(min_value=0, mostly=0.9), True),
+        (_between(min_value=0, result_format="COMPLETE"), _between(min_value=0), True),
+        (
+            _between(min_value=0),
+            _e("expect_column_values_to_be_between", column="name", min_value=0),
+            False,
+        ),
+    ],
+)
+def test_implied_ranges(a, b, expected):
+    assert implies(a, b) is expected
+
+
+@pytest.mark.parametrize(
+    "expectation_type, a_set, b_set, expected",
+    [
+        ("expect_column_values_to_be_in_set", ["a"], ["a", "b"], True),
+        ("expect_column_values_to_be_in_set", ["a", "b"], ["a"], False),
+        ("expect_column_distinct_values_to_be_in_set", ["a"], ["b", "a"], True),
+        ("expect_column_values_to_not_be_in_set", ["a", "b"], ["a"], True),
+        ("expect_column_values_to_not_be_in_set", ["a"], ["a", "b"], False),
+    ],
+)
+def test_implied_sets(expectation_type, a_set, b_set, expected):
+    a = _e(expectation_type, column="name", value_set=a_set)
+    b = _e(expectation_type, column="name", value_set=b_set)
+
+    assert implies(a, b) is expected
+
+
+def test_column_lists_imply_their_columns():
+    ordered = _e("expect_table_columns_to_match_ordered_list", column_list=["id", "name"])
+    unordered = _e("expect_table_columns_to_match_set", column_list=["id", "name"])
+
+    assert implies(ordered, _e("expect_column_to_exist", column="name"))
+    assert implies(ordered, _e("expect_column_to_exist", column="name", column_index=1))
+    assert not implies(ordered, _e("expect_column_to_exist", column="name", column_index=0))
+    assert implies(unordered, _e("expect_column_to_exist", column="id"))
+    assert not implies(unordered, _e("expect_column_to_exist", column="id", column_index=0))
+    assert not implies(unordered, _e("expect_column_to_exist", column="price"))
+
+
+def test_first_of_equivalent_expectations_is_kept():
+    expectations = [
+        _between(min_value=0),
+        _between(min_value=1, max_value=5),
+        _between(min_value=1, max_value=5),
+    ]
+
+    implied = find_implied_expectations(expectations)
+
+    assert sorted(implied) == [0, 2]
+    assert implied[0].reason == "implied by expect_column_values_to_be_between(id)"
+
+
+def test_optimize_suite_prunes_and_orders_cheapest_first():
+    suite = ExpectationSuite(
+        "orders.basic",
+        expectations=[
+            _e("expect_column_values_to_match_regex", column="name", regex="^[a-z]+$"),
+            _between(min_value=0),
+            _between(min_value=1),
+            _e("expect_column_to_exist", column="id"),
+            _e("expect_table_columns_to_match_set", column_list=["id", "name"]),
+        ],
+    )
+
+    optimized = optimize_suite(suite)
+
+    assert [r.expectation_type for r in optimized.removed] == [
+        "expect_column_values_to_be_between",
+        "expect_column_to_exist",
+    ]
+    assert optimized.removed[0].kwargs == {"column": "id", "min_value": 0}
+    assert optimized.reordered
+    assert [e.expectation_type for e in suite.expectations] == [
+        "expect_table_columns_to_match_set",
+        "expect_column_values_to_be_between",
+        "expect_column_values_to_match_regex",
+    ]
+    assert optimized.cost_before == pytest.approx(16.02)
+    assert optimized.cost_after == pytest.approx(13.01)
+    assert optimized.savings == pytest.approx(1 - 13.01 / 16.02)
+
+
+def test_optimize_suite_without_changes():
+    suite = ExpectationSuite("orders.basic", expectations=[])
+
+    optimized = optimize_suite(suite)
+
+    assert optimized.removed == []
+    assert not optimized.reordered
+    assert optimized.savings == 0.0
+
+
+def test_implied_across_suites_are_only_reported():
+    basic = ExpectationSuite("orders.basic", expectations=[_between(min_value=1)])
+    warning = ExpectationSuite("orders.warning", expectations=[_between(min_value=0)])
+
+    assert find_implied_across_suites([basic, warning]) == [
+        "expect_column_values_to_be_between(id) of orders.warning is implied "
+        "by expect_column_values_to_be_between(id) of orders.basic"
+    ]
+    assert len(warning.expectations) == 1
@@ -0,0 +1,107 @@
+import os
+import threading
+
+import pandas as pd
+
+from kedro_great.plans import (
+    PlanCache,
+    compile_suite,
+    get_plans_columns,
+    get_suite_path,
+    project_frame,
+)
+
+
+def test_plan_columns_are_the_union_of_step_columns(make_suite):
+    plan = compile_suite(
+        make_suite(
+            "suite",
+            ("expect_column_values_to_not_be_null", {"column": "a"}),
+            ("expect_column_pair_values_to_be_equal", {"column_A": "b", "column_B": "a"}),
+        ),
+        None,
+    )
+
+    assert plan.columns == ["a", "b"]
+    assert plan.expectation_types == [
+        "expect_column_pair_values_to_be_equal",
+        "expect_column_values_to_not_be_null",
+    ]
+
+
+def test_table_expectations_need_every_column(make_suite):
+    plans = [
+        compile_suite(
+            make_suite("a", ("expect_column_values_to_not_be_null", {"column": "a"})), None
+        ),
+        compile_suite(
+            make_suite("b", ("expect_table_row_count_to_be_between", {"min_value": 1})), None
+        ),
+    ]
+
+    assert get_plans_columns(plans[:1]) == ["a"]
+    assert get_plans_columns(plans) is None
+
+
+def test_frames_are_only_copied_when_columns_are_dropped():
+    df = pd.DataFrame({"a": [1], "b": [2], "c": [3]})
+
+    assert project_frame(df, None) is df
+    assert project_frame(df, ["c", "a", "b"]) is df
+    assert project_frame(df, ["a", "missing"]) is df
+    assert list(project_frame(df, ["b", "a"]).columns) == ["b", "a"]
+
+
+class FakeContext:
+    def __init__(self, root_directory, suite):
+        self.root_directory = root_directory
+        self.suite = suite
+        self.loads = 0
+
+    def get_expectation_suite(self, suite_name):
+        self.loads += 1
+        return self.suite
+
+
+def test_plans_are_recompiled_once_their_suite_is_edited(make_suite, tmp_path):
+    suite = make_suite("dataset.basic", ("expect_column_to_exist", {"column": "a"}))
+    context = FakeContext(str(tmp_path), suite)
+    suite_path = get_suite_path(str(tmp_path), "dataset.basic")
+    os.makedirs(os.path.dirname(suite_path))
+    with open(suite_path, "w") as f:
+        f.write("{}")
+    cache = PlanCache(str(tmp_path / "plans"))
+
+    cache.get(context, "dataset.basic")
+    assert PlanCache(str(tmp_path / "plans")).get(context, "dataset.basic").columns == ["a"]
+    assert context.loads == 1
+
+    os.utime(suite_path, (0, 0))
+    cache.get(context, "dataset.basic")
+    assert context.loads == 2
+
+
+def test_concurrent_compiles_of_a_suite_do_not_collide(make_suite, tmp_path):
+    suite = make_suite("dataset.basic", ("expect_column_to_exist", {"column": "a"}))
+    context = FakeContext(str(tmp_path), suite)
+    cache = PlanCache(str(tmp_path / "plans"))
+    barrier = threading.Barrier(8)
+    errors = []
+
+    def compile_suite():
+        barrier.wait()
+        try:
+            for _ in range(20):
+                cache.compile(context, "dataset.basic")
+        except OSError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=compile_suite) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert os.listdir(tmp_path / "plans") == ["dataset.basic.json"]
+    assert PlanCache(str(tmp_path / "plans"))._read("dataset.basic").columns == ["a"]
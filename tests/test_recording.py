@@ -0,0 +1,66 @@
+import pandas as pd
+import pytest
+
+from kedro_great.budget import ValidationBudget
+from kedro_great.cli.replay import compare_timings
+from kedro_great.recording import RecordedValidation, RunRecorder, load_recording
+
+
+def _validation(seconds, rows, suite_rows=None):
+    return RecordedValidation(
+        "dataset", None, ["suite"], {"suite": seconds}, rows, ["id"], None, None, suite_rows
+    )
+
+
+def test_options_are_recorded_for_replay(tmp_path):
+    options = {"validation_budgets": {"dataset": ValidationBudget(max_rows=10)}}
+    recorder = RunRecorder(str(tmp_path), options, sample_rows=5)
+    df = pd.DataFrame({"id": range(100)})
+
+    recorder.record("run", "dataset", None, df, {"suite": 1.5}, {"suite": 10})
+
+    recorded_options, validations = load_recording(recorder.get_run_directory("run"))
+    assert recorded_options["validation_budgets"]["dataset"]["max_rows"] == 10
+    assert validations[0].rows == 100
+    assert validations[0].get_suite_rows("suite") == 10
+    assert len(pd.read_parquet(tmp_path / "run" / "samples" / validations[0].sample)) == 5
+
+
+def test_options_which_cannot_be_replayed_are_rejected(tmp_path):
+    with pytest.raises(ValueError, match="resolvers"):
+        RunRecorder(str(tmp_path), {"resolvers": object()})
+
+
+def test_timings_are_compared_on_the_rows_each_suite_validated():
+    # The suite was sampled down to 1000 of the 10000 rows when recorded
+    recorded = [_validation(2.0, 10_000, {"suite": 1000})]
+    replayed = [_validation(1.5, 1000), _validation(1.0, 1000)]
+
+    (comparison,) = compare_timings(recorded, replayed)
+
+    assert comparison["recorded_rows"] == 1000
+    assert comparison["replayed_seconds"] == 1.0
+    assert comparison["delta"] == pytest.approx(-0.5)
+
+
+def test_recordings_without_suite_rows_use_the_frame_rows():
+    recorded = [_validation(2.0, 10_000)]
+    replayed = [_validation(0.1, 1000)]
+
+    (comparison,) = compare_timings(recorded, replayed)
+
+    assert comparison["delta"] == pytest.approx(-0.5)
+
+
+def test_runs_are_recorded_without_samples_when_parquet_cannot_be_written(
+    tmp_path, monkeypatch
+):
+    from kedro_great import recording
+
+    monkeypatch.setattr(recording, "parquet_engine_available", lambda: False)
+    recorder = RunRecorder(str(tmp_path), {}, sample_rows=5)
+
+    recorder.record("run", "dataset", None, pd.DataFrame({"id": [1]}), {"suite": 1.0})
+
+    _, validations = load_recording(recorder.get_run_directory("run"))
+    assert validations[0].sample is None
@@ -0,0 +1,29 @@
+import pytest
+
+from kedro_great.results import ValidationSummary, ValidationTotals, resolve_result_format
+
+
+def test_totals_add_up_summaries():
+    totals = ValidationTotals()
+    totals.add(ValidationSummary("a", "x", "run", True, 3, 3, ()))
+    totals.add(ValidationSummary("b", "x", "run", False, 4, 2, ("e1", "e2")))
+
+    assert totals.to_dict() == {
+        "suites": 2,
+        "passed": 1,
+        "evaluated": 7,
+        "successful": 5,
+    }
+
+
+def test_suite_result_format_overrides_dataset():
+    result_formats = {"dataset": "BOOLEAN_ONLY", "dataset.suite": "COMPLETE"}
+
+    assert resolve_result_format(result_formats, "dataset", "dataset.suite") == "COMPLETE"
+    assert resolve_result_format(result_formats, "dataset", "dataset.other") == "BOOLEAN_ONLY"
+    assert resolve_result_format(result_formats, "other", "other.suite") is None
+
+
+def test_unknown_result_format_is_rejected():
+    with pytest.raises(ValueError):
+        resolve_result_format({"dataset": "VERBOSE"}, "dataset", "dataset.suite")
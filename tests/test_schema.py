@@ -0,0 +1,195 @@
+import os
+
+import pandas as pd
+import pytest
+from great_expectations.core import ExpectationConfiguration, ExpectationSuite
+from kedro.extras.datasets.pandas import CSVDataSet, ParquetDataSet
+
+from kedro_great.exceptions import SuiteValidationFailure
+from kedro_great.kedro_great import KedroGreat
+from kedro_great.schema import (
+    build_schema_suite,
+    check_column_type,
+    read_schema_frame,
+)
+
+pytest.importorskip("pyarrow")
+
+
+def _type(column, type_):
+    return ExpectationConfiguration(
+        "expect_column_values_to_be_of_type", {"column": column, "type_": type_}
+    )
+
+
+@pytest.fixture
+def parquet_dataset(tmp_path):
+    def parquet_dataset(df):
+        dataset = ParquetDataSet(str(tmp_path / "orders.parquet"))
+        dataset.save(df)
+        return dataset
+
+    return parquet_dataset
+
+
+def test_parquet_schema_frame_is_empty_and_typed(parquet_dataset):
+    dataset = parquet_dataset(pd.DataFrame({"id": [1, 2], "name": ["a", "b"]}))
+
+    schema_frame = read_schema_frame(dataset)
+
+    assert list(schema_frame.frame.columns) == ["id", "name"]
+    assert len(schema_frame.frame) == 0
+    assert schema_frame.has_types
+    assert schema_frame.value_types == {"name": str}
+
+
+def test_csv_schema_frame_is_only_typed_with_a_dtype(tmp_path):
+    path = str(tmp_path / "orders.csv")
+    pd.DataFrame({"id": [1, 2], "name": ["a", "b"]}).to_csv(path, index=False)
+
+    untyped = read_schema_frame(CSVDataSet(path))
+    typed = read_schema_frame(CSVDataSet(path, load_args={"dtype": {"name": str}}))
+
+    assert list(untyped.frame.columns) == ["id", "name"]
+    assert not untyped.has_types
+    assert typed.has_types
+    assert typed.value_types == {"name": str}
+
+
+def test_schema_suite_keeps_schema_expectations():
+    suite = ExpectationSuite(
+        "orders.basic",
+        expectations=[
+            ExpectationConfiguration("expect_column_to_exist", {"column": "id"}),
+            _type("id", "int64"),
+            ExpectationConfiguration(
+                "expect_column_values_to_not_be_null", {"column": "id"}
+            ),
+        ],
+    )
+
+    typed = build_schema_suite(suite, has_types=True)
+    untyped = build_schema_suite(suite, has_types=False)
+
+    assert [e.expectation_type for e in typed.expectations] == [
+        "expect_column_to_exist",
+        "expect_column_values_to_be_of_type",
+    ]
+    assert [e.expectation_type for e in untyped.expectations] == [
+        "expect_column_to_exist"
+    ]
+    assert len(suite.expectations) == 3
+    assert build_schema_suite(ExpectationSuite("orders.empty"), has_types=True) is None
+
+
+@pytest.mark.parametrize(
+    "type_, success",
+    [("int64", True), ("int", True), ("str", False), ("float64", False)],
+)
+def test_numeric_column_types(parquet_dataset, type_, success):
+    schema_frame = read_schema_frame(parquet_dataset(pd.DataFrame({"id": [1, 2]})))
+
+    result = check_column_type(schema_frame, _type("id", type_))
+
+    assert result.success is success
+    assert result.result["observed_value"] == "int64"
+
+
+def test_drift_to_strings_is_caught(parquet_dataset):
+    schema_frame = read_schema_frame(parquet_dataset(pd.DataFrame({"id": ["1", "2"]})))
+
+    assert not check_column_type(schema_frame, _type("id", "int64")).success
+    assert check_column_type(schema_frame, _type("id", "str")).success
+    assert check_column_type(
+        schema_frame,
+        ExpectationConfiguration(
+            "expect_column_values_to_be_in_type_list",
+            {"column": "id", "type_list": ["int", "str"]},
+        ),
+    ).success
+
+
+def test_missing_columns_fail_type_checks(parquet_dataset):
+    schema_frame = read_schema_frame(parquet_dataset(pd.DataFrame({"id": [1]})))
+
+    assert not check_column_type(schema_frame, _type("name", "str")).success
+
+
+@pytest.fixture
+def preflight_hook(ge_context):
+    suite = ge_context.create_expectation_suite("orders.basic")
+    suite.add_expectation(_type("id", "int64"))
+    suite.add_expectation(
+        ExpectationConfiguration("expect_column_values_to_not_be_null", {"column": "id"})
+    )
+    ge_context.save_expectation_suite(suite)
+
+    def preflight_hook(**options):
+        return KedroGreat(
+            suite_types=["basic"],
+            schema_preflight=True,
+            context_root_dir=ge_context.root_directory,
+            **options,
+        )
+
+    return preflight_hook
+
+
+def _validations(kedro_great):
+    return os.path.join(
+        kedro_great.expectation_context.root_directory,
+        "uncommitted",
+        "validations",
+        "orders",
+        "basic",
+    )
+
+
+def test_failed_preflight_is_recorded(preflight_hook, parquet_dataset):
+    kedro_great = preflight_hook()
+    dataset = parquet_dataset(pd.DataFrame({"id": ["1", "2"]}))
+
+    kedro_great._validate_dataset("orders", dataset, None, "preflight", True)
+
+    report = kedro_great.run_report()
+    assert [(s.suite, s.dataset) for s in report["failed"]] == [("orders.basic", "orders")]
+    assert report["totals"] == {"suites": 1, "passed": 0, "evaluated": 1, "successful": 0}
+    assert report["summaries"][0].failed_expectations == (
+        "expect_column_values_to_be_of_type",
+    )
+    assert os.listdir(_validations(kedro_great)) == ["preflight"]
+
+
+def test_failed_preflight_fails_fast(preflight_hook, parquet_dataset):
+    kedro_great = preflight_hook(fail_fast=True)
+    dataset = parquet_dataset(pd.DataFrame({"id": ["1", "2"]}))
+
+    with pytest.raises(SuiteValidationFailure, match="orders.basic"):
+        kedro_great._validate_dataset("orders", dataset, None, "preflight", True)
+
+
+def test_passed_preflight_is_recorded_without_full_validation(
+    preflight_hook, parquet_dataset
+):
+    kedro_great = preflight_hook(full_validation_after_preflight=False)
+    dataset = parquet_dataset(pd.DataFrame({"id": [1, 2]}))
+
+    kedro_great._validate_dataset("orders", dataset, None, "preflight", True)
+
+    report = kedro_great.run_report()
+    assert report["failed"] == []
+    assert report["totals"] == {"suites": 1, "passed": 1, "evaluated": 1, "successful": 1}
+
+
+def test_passed_preflight_is_fully_validated(preflight_hook, parquet_dataset):
+    kedro_great = preflight_hook()
+    dataset = parquet_dataset(pd.DataFrame({"id": [1.0, None]}))
+    suite = kedro_great.expectation_context.get_expectation_suite("orders.basic")
+    suite.expectations[0].kwargs["type_"] = "float64"
+    kedro_great.expectation_context.save_expectation_suite(suite)
+
+    kedro_great._validate_dataset("orders", dataset, None, "preflight", True)
+
+    report = kedro_great.run_report()
+    # Only the full validation is counted, and it caught the null
+    assert report["totals"] == {"suites": 1, "passed": 0, "evaluated": 2, "successful": 1}
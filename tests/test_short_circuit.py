@@ -0,0 +1,97 @@
+import os
+
+import great_expectations as ge
+import pandas as pd
+from great_expectations.data_asset.util import parse_result_format
+
+from kedro_great.kedro_great import KedroGreat
+from kedro_great.memo import ExpectationMemo
+from kedro_great.results import OPERATOR_RESULT_FORMAT
+
+
+def _dataset(memo, suite):
+    dataset = ge.from_pandas({"id": [1, 2, 3], "name": ["a", "b", "c"]})
+    memo.attach(dataset, [e.expectation_type for e in suite.expectations])
+    return dataset
+
+
+def test_passing_suite_is_evaluated_once(make_suite):
+    suite = make_suite(
+        "test_suite",
+        ("expect_column_values_to_not_be_null", {"column": "id"}),
+        ("expect_column_max_to_be_between", {"column": "id", "max_value": 5}),
+        ("expect_column_values_to_be_in_set", {"column": "name", "value_set": ["a", "b", "c"]}),
+    )
+    memo = ExpectationMemo()
+    dataset = _dataset(memo, suite)
+    result_format = parse_result_format(OPERATOR_RESULT_FORMAT)
+
+    assert KedroGreat._evaluate_until_failure(dataset, suite, result_format, None) is None
+    validation = dataset.validate(expectation_suite=suite, result_format=result_format)
+
+    assert validation.success
+    assert memo.misses == 3
+    assert memo.hits == 3
+
+
+def test_evaluation_parameters_are_substituted(make_suite):
+    suite = make_suite(
+        "test_suite",
+        (
+            "expect_column_max_to_be_between",
+            {"column": "id", "max_value": {"$PARAMETER": "max_id"}},
+        ),
+        ("expect_column_values_to_not_be_null", {"column": "id"}),
+        max_id=10,
+    )
+    memo = ExpectationMemo()
+    dataset = _dataset(memo, suite)
+    result_format = parse_result_format(OPERATOR_RESULT_FORMAT)
+
+    assert KedroGreat._evaluate_until_failure(dataset, suite, result_format, None) is None
+    dataset.validate(expectation_suite=suite, result_format=result_format)
+    assert memo.hits == 2
+
+
+def test_stops_at_first_failure(make_suite):
+    suite = make_suite(
+        "test_suite",
+        ("expect_column_values_to_not_be_null", {"column": "id"}),
+        ("expect_column_max_to_be_between", {"column": "id", "max_value": 2}),
+        ("expect_column_values_to_be_in_set", {"column": "name", "value_set": ["a"]}),
+    )
+    memo = ExpectationMemo()
+    dataset = _dataset(memo, suite)
+
+    results = KedroGreat._evaluate_until_failure(
+        dataset, suite, parse_result_format(OPERATOR_RESULT_FORMAT), None
+    )
+
+    assert results is not None
+    assert not results[-1].success
+    assert len(results) < 3
+
+
+def test_short_circuited_failures_run_the_operator_actions(orders_hook):
+    kedro_great = orders_hook()
+
+    results = kedro_great.run_suites(
+        "orders",
+        None,
+        pd.DataFrame({"id": [1, None]}),
+        ["orders.basic"],
+        "20201019T120000.000000Z",
+        stop_on_failure=True,
+    )
+
+    assert results == {"orders.basic": False}
+    root_directory = kedro_great.expectation_context.root_directory
+    for directory in (
+        ("uncommitted", "validations"),
+        ("uncommitted", "data_docs", "local_site", "validations"),
+    ):
+        run_directory = os.path.join(
+            root_directory, *directory, "orders", "basic", "20201019T120000.000000Z"
+        )
+        # Under the run time parsed from the run id, like the validation operator
+        assert os.listdir(run_directory) == ["20201019T120000.000000Z"]
@@ -0,0 +1,152 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from kedro_great.sketches import (
+    EXACT_DISTINCT_LIMIT,
+    ApproximationConfig,
+    BloomFilter,
+    HyperLogLog,
+    make_sketch_resolver,
+)
+
+
+def _resolve(df, expectation_type, **kwargs):
+    resolver = make_sketch_resolver(df, ApproximationConfig())
+    return resolver(expectation_type, dict(column="value", **kwargs))
+
+
+def test_unique_counts_every_row_of_a_repeated_value():
+    df = pd.DataFrame({"value": [1, 1, 1, 2, 3, 3, 4, None]})
+
+    result = _resolve(df, "expect_column_values_to_be_unique")
+
+    expected = df["value"].dropna().duplicated(keep=False).sum()
+    assert result.result["unexpected_count"] == expected == 5
+    assert result.result["element_count"] == 7
+    assert not result.success
+
+
+def test_unique_matches_great_expectations():
+    import great_expectations as ge
+
+    values = np.random.RandomState(0).randint(0, 50_000, 100_000)
+    df = pd.DataFrame({"value": values})
+
+    approximate = _resolve(df, "expect_column_values_to_be_unique", mostly=0.5)
+    exact = ge.from_pandas(df).expect_column_values_to_be_unique("value", mostly=0.5)
+
+    assert approximate.result["unexpected_count"] == pytest.approx(
+        exact.result["unexpected_count"], rel=0.01
+    )
+    assert approximate.success == exact.success
+
+
+def test_unique_column_passes():
+    df = pd.DataFrame({"value": np.arange(300_000)})
+
+    result = _resolve(df, "expect_column_values_to_be_unique")
+
+    assert result.result["unexpected_count"] <= 300_000 * 0.002
+    assert result.meta["kedro_great"]["method"] == "bloom_filter"
+
+
+def test_bloom_filter_finds_repeats_within_and_across_calls():
+    bloom = BloomFilter(100, 0.001)
+    hashes = np.array([1, 2, 1, 3], dtype=np.uint64) * np.uint64(0x9E3779B97F4A7C15)
+
+    assert bloom.add_and_find_seen(hashes).tolist() == [False, False, True, False]
+    assert bloom.add_and_find_seen(hashes[:2]).tolist() == [True, True]
+
+
+def test_cardinality_is_estimated():
+    df = pd.DataFrame({"value": np.arange(100_000) % 1000})
+
+    result = _resolve(
+        df, "expect_column_unique_value_count_to_be_between", min_value=990, max_value=1010
+    )
+
+    assert result.success
+
+
+@pytest.mark.parametrize("distinct", [1, 3, 50, 1000])
+def test_small_cardinalities_are_counted_exactly(distinct):
+    df = pd.DataFrame({"value": np.arange(10_000) % distinct})
+
+    result = _resolve(
+        df,
+        "expect_column_unique_value_count_to_be_between",
+        min_value=distinct,
+        max_value=distinct,
+    )
+
+    assert result.success
+    assert result.result["observed_value"] == distinct
+    assert result.meta["kedro_great"]["method"] == "exact"
+
+
+def test_large_cardinalities_are_within_their_error():
+    distinct = 2 * EXACT_DISTINCT_LIMIT
+    df = pd.DataFrame({"value": np.arange(distinct)})
+
+    count = _resolve(
+        df,
+        "expect_column_unique_value_count_to_be_between",
+        min_value=distinct,
+        max_value=distinct,
+    )
+    proportion = _resolve(
+        df,
+        "expect_column_proportion_of_unique_values_to_be_between",
+        min_value=1,
+        max_value=1,
+    )
+
+    assert count.success
+    assert proportion.success
+    assert isinstance(count.result["observed_value"], int)
+    meta = count.meta["kedro_great"]
+    assert meta["method"] == "hyperloglog"
+    assert meta["relative_error"] <= ApproximationConfig().distinct_relative_error
+    assert meta["bounds_tolerance"] == pytest.approx(3 * meta["relative_error"])
+
+
+def test_cardinality_outside_the_error_fails():
+    distinct = 2 * EXACT_DISTINCT_LIMIT
+    df = pd.DataFrame({"value": np.arange(distinct)})
+
+    result = _resolve(
+        df,
+        "expect_column_unique_value_count_to_be_between",
+        max_value=int(distinct * 0.9),
+    )
+
+    assert not result.success
+
+
+def test_hyperloglog_estimates_are_integers():
+    hll = HyperLogLog(0.01)
+    hll.update(np.arange(1, 4, dtype=np.uint64) * np.uint64(0x9E3779B97F4A7C15))
+
+    assert hll.estimate() == 3
+
+
+def test_quantiles_are_estimated():
+    df = pd.DataFrame({"value": np.arange(100_001, dtype=float)})
+
+    result = _resolve(
+        df,
+        "expect_column_quantile_values_to_be_between",
+        quantile_ranges={
+            "quantiles": [0.5],
+            "value_ranges": [[49_000, 51_000]],
+        },
+    )
+
+    assert result.success
+
+
+def test_unsupported_kwargs_are_left_to_great_expectations():
+    df = pd.DataFrame({"value": [1, 2]})
+
+    assert _resolve(df, "expect_column_values_to_be_unique", row_condition="x") is None
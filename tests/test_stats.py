@@ -0,0 +1,155 @@
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import pytest
+from kedro.extras.datasets.pandas import CSVDataSet
+from kedro.io import LambdaDataSet
+
+from kedro_great import stats
+from kedro_great.stats import (
+    StatisticsCache,
+    compute_statistics,
+    dataset_fingerprint,
+    make_statistics_resolver,
+)
+
+CSV = "id,score\n1,0.5\n2,1.5\n3,\n"
+APPENDED = "4,2.5\n5,4.0\n"
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text(CSV)
+    return path
+
+
+def test_concurrent_writes_of_a_dataset_do_not_collide(tmp_path):
+    cache = StatisticsCache(str(tmp_path))
+    entries = [{"writer": i, "columns": {"id": [i] * 1000}} for i in range(32)]
+
+    with ThreadPoolExecutor(8) as pool:
+        list(pool.map(lambda entry: cache._write("shared", entry), entries))
+
+    assert cache._read("shared") in entries
+    assert os.listdir(str(tmp_path)) == ["shared.json"]
+    with open(os.path.join(str(tmp_path), "shared.json")) as f:
+        json.load(f)
+
+
+def test_resolver_answers_aggregates_from_statistics():
+    resolve = make_statistics_resolver(
+        compute_statistics(pd.DataFrame({"id": [1, 2, 3], "score": [0.5, 1.5, None]}))
+    )
+
+    row_count = resolve("expect_table_row_count_to_equal", {"value": 3})
+    assert row_count.success
+    assert row_count.result == {"observed_value": 3}
+    assert resolve(
+        "expect_column_mean_to_be_between", {"column": "score", "min_value": 1.0}
+    ).result == {"observed_value": 1.0}
+    assert not resolve(
+        "expect_column_max_to_be_between",
+        {"column": "id", "max_value": 3, "strict_max": True},
+    ).success
+    assert resolve(
+        "expect_column_unique_value_count_to_be_between",
+        {"column": "id", "min_value": 3, "max_value": 3, "result_format": "SUMMARY"},
+    ).success
+
+
+@pytest.mark.parametrize(
+    "expectation_type,kwargs",
+    [
+        # Evaluation parameters are left to Great Expectations
+        ("expect_column_max_to_be_between", {"column": "id", "max_value": {"$PARAMETER": "m"}}),
+        ("expect_column_max_to_be_between", {"column": "id", "max_value": 3, "parse_strings_as_datetimes": True}),
+        ("expect_column_max_to_be_between", {"column": "missing", "max_value": 3}),
+        ("expect_column_values_to_not_be_null", {"column": "id"}),
+    ],
+)
+def test_resolver_leaves_what_it_cannot_answer_exactly(expectation_type, kwargs):
+    resolve = make_statistics_resolver(compute_statistics(pd.DataFrame({"id": [1, 2, 3]})))
+
+    assert resolve(expectation_type, kwargs) is None
+
+
+def test_changed_datasets_invalidate_the_cache(tmp_path, csv_path):
+    cache = StatisticsCache(str(tmp_path / "statistics"))
+    dataset = CSVDataSet(str(csv_path))
+    cache.save("data", dataset, compute_statistics(dataset.load()))
+    assert cache.load("data", dataset).row_count == 3
+
+    csv_path.write_text("id,score\n7,0.5\n")
+
+    assert cache.load("data", dataset) is None
+
+
+def test_appended_rows_are_merged_into_the_cache(tmp_path, csv_path, monkeypatch):
+    cache = StatisticsCache(str(tmp_path / "statistics"))
+    dataset = CSVDataSet(str(csv_path))
+    cache.save("data", dataset, compute_statistics(dataset.load()))
+    with open(csv_path, "a") as f:
+        f.write(APPENDED)
+
+    merged = cache.load("data", dataset)
+
+    expected = compute_statistics(dataset.load())
+    assert merged.row_count == expected.row_count == 5
+    for name in ("id", "score"):
+        column, expected_column = merged.columns[name], expected.columns[name]
+        assert column.count == expected_column.count
+        assert column.null_count == expected_column.null_count
+        assert column.min == expected_column.min
+        assert column.max == expected_column.max
+        assert column.mean == pytest.approx(expected_column.mean)
+        assert column.stdev == pytest.approx(expected_column.stdev)
+        assert column.unique_count is None
+    # The merged statistics are cached for the new version of the file
+    monkeypatch.setattr(stats, "compute_statistics", None)
+    assert cache.load("data", dataset) == merged
+    assert cache._read("data")["fingerprint"] == dataset_fingerprint(dataset)
+
+
+@pytest.mark.parametrize("load_args", [{"index_col": 0}, {"usecols": ["score"]}])
+def test_appends_are_rescanned_when_load_args_cannot_apply_to_them(
+    tmp_path, csv_path, load_args
+):
+    cache = StatisticsCache(str(tmp_path / "statistics"))
+    dataset = CSVDataSet(str(csv_path), load_args=load_args)
+    cache.save("data", dataset, compute_statistics(dataset.load()))
+    with open(csv_path, "a") as f:
+        f.write(APPENDED)
+
+    assert cache.load("data", dataset) is None
+
+
+def test_datasets_without_a_fingerprint_are_not_computed(orders_hook, monkeypatch):
+    def compute_statistics(df):
+        raise AssertionError("Statistics which cannot be cached were computed")
+
+    monkeypatch.setattr(stats, "compute_statistics", compute_statistics)
+    kedro_great = orders_hook(statistics_cache=True)
+    dataset = LambdaDataSet(load=lambda: pd.DataFrame({"id": [1, 2]}), save=None)
+
+    kedro_great._validate_dataset("orders", dataset, None, "run", True)
+
+    assert kedro_great.run_report()["totals"]["passed"] == 2
+
+
+def test_statistics_are_cached_on_first_validation(orders_hook, csv_path, monkeypatch):
+    kedro_great = orders_hook(statistics_cache=True)
+    dataset = CSVDataSet(str(csv_path))
+
+    kedro_great._validate_dataset("orders", dataset, None, "first", True)
+    computed = []
+    monkeypatch.setattr(
+        stats, "compute_statistics", lambda df: computed.append(df) or None
+    )
+    kedro_great._finished_suites.clear()
+    kedro_great._validate_dataset("orders", dataset, None, "second", True)
+
+    assert kedro_great._statistics_cache.load("orders", dataset).row_count == 3
+    assert computed == []
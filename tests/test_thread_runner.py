@@ -0,0 +1,130 @@
+import os
+import threading
+
+import great_expectations as ge
+import pandas as pd
+import pytest
+from great_expectations.core import ExpectationConfiguration
+from kedro.framework.hooks import get_hook_manager
+from kedro.io import DataCatalog, MemoryDataSet
+from kedro.pipeline import Pipeline, node
+from kedro.runner import ThreadRunner
+
+from kedro_great.exceptions import SuiteValidationFailure
+from kedro_great.kedro_great import KedroGreat
+
+DATASETS = ("orders", "customers", "products")
+NODES = 12
+
+
+@pytest.fixture
+def ge_root(ge_context):
+    for dataset_name in DATASETS:
+        suite = ge_context.create_expectation_suite(f"{dataset_name}.basic")
+        suite.add_expectation(
+            ExpectationConfiguration("expect_column_values_to_not_be_null", {"column": "id"})
+        )
+        ge_context.save_expectation_suite(suite)
+    return ge_context.root_directory
+
+
+@pytest.fixture
+def registered():
+    hook_manager = get_hook_manager()
+    hooks = []
+
+    def register(hook):
+        hook_manager.register(hook)
+        hooks.append(hook)
+        return hook
+
+    yield register
+    for hook in hooks:
+        hook_manager.unregister(hook)
+
+
+def _pipeline():
+    # Every node reads every dataset, so the runner threads race to validate them
+    return Pipeline(
+        [
+            node(
+                lambda *frames: sum(len(frame) for frame in frames),
+                list(DATASETS),
+                f"output_{i}",
+                name=f"node_{i}",
+            )
+            for i in range(NODES)
+        ]
+    )
+
+
+def _catalog():
+    return DataCatalog(
+        {
+            dataset_name: MemoryDataSet(pd.DataFrame({"id": range(100)}))
+            for dataset_name in DATASETS
+        }
+    )
+
+
+def test_thread_runner_validates_each_suite_once(ge_root, registered, monkeypatch):
+    calls = []
+    calls_lock = threading.Lock()
+    run_suite = KedroGreat._run_suite
+
+    def recording_run_suite(self, dataset_name, dataset_path, df, suite_name, *args, **kw):
+        with calls_lock:
+            calls.append(
+                (suite_name, threading.get_ident(), id(self._get_expectation_context()))
+            )
+        return run_suite(self, dataset_name, dataset_path, df, suite_name, *args, **kw)
+
+    monkeypatch.setattr(KedroGreat, "_run_suite", recording_run_suite)
+    kedro_great = registered(
+        KedroGreat(suite_types=["basic"], run_after_node=True, context_root_dir=ge_root)
+    )
+
+    ThreadRunner(max_workers=4).run(_pipeline(), _catalog(), run_id="stress")
+
+    assert sorted(suite for suite, _, _ in calls) == sorted(
+        f"{dataset_name}.basic" for dataset_name in DATASETS
+    )
+    report = kedro_great.run_report()
+    assert report["totals"]["suites"] == len(DATASETS)
+    assert report["totals"]["passed"] == len(DATASETS)
+    assert report["summaries"] == []
+
+    contexts_by_thread = {}
+    for _, thread, context in calls:
+        assert contexts_by_thread.setdefault(thread, context) == context
+        assert context != id(kedro_great.expectation_context)
+    # Threads which validated concurrently never shared a context
+    assert len(set(contexts_by_thread.values())) == len(contexts_by_thread)
+
+
+def test_thread_runner_fails_fast_once(ge_root, registered):
+    context = ge.data_context.DataContext(ge_root)
+    suite = context.get_expectation_suite("orders.basic")
+    suite.add_expectation(
+        ExpectationConfiguration(
+            "expect_column_max_to_be_between", {"column": "id", "max_value": 10}
+        )
+    )
+    context.save_expectation_suite(suite)
+    kedro_great = registered(
+        KedroGreat(
+            suite_types=["basic"],
+            fail_fast=True,
+            fail_after_pipeline_run=True,
+            context_root_dir=ge_root,
+        )
+    )
+
+    with pytest.raises(SuiteValidationFailure, match="orders.basic"):
+        ThreadRunner(max_workers=4).run(_pipeline(), _catalog(), run_id="stress")
+
+    report = kedro_great.run_report()
+    assert [summary.suite for summary in report["summaries"]] == ["orders.basic"]
+    # The short circuited result is stored like the validation operator would
+    validations = os.path.join(ge_root, "uncommitted", "validations", "orders", "basic")
+    assert os.listdir(validations) == ["stress"]
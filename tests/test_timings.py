@@ -0,0 +1,70 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from kedro_great.timings import (
+    SMOOTHING,
+    TimingHistory,
+    order_datasets_longest_first,
+    order_suites_by_cost,
+)
+
+
+def _record_and_save(path, dataset_name):
+    history = TimingHistory(path)
+    history.record(dataset_name, "suite", 1.0, 100)
+    history.save()
+
+
+def test_concurrent_processes_keep_each_others_timings(tmp_path):
+    path = str(tmp_path / "timings.json")
+    dataset_names = [f"dataset_{i}" for i in range(16)]
+
+    with ProcessPoolExecutor(4) as pool:
+        list(pool.map(_record_and_save, [path] * len(dataset_names), dataset_names))
+
+    history = TimingHistory(path)
+    assert all(history.get(name, "suite") is not None for name in dataset_names)
+
+
+def test_timings_are_smoothed_over_runs(tmp_path):
+    history = TimingHistory(str(tmp_path / "timings.json"))
+    history.record("dataset", "suite", 10.0, 100)
+    history.record("dataset", "suite", 20.0, 100)
+
+    timing = history.get("dataset", "suite")
+    assert timing.seconds == pytest.approx(SMOOTHING * 20 + (1 - SMOOTHING) * 10)
+    assert timing.runs == 2
+
+
+def test_prediction_scales_with_rows(tmp_path):
+    history = TimingHistory(str(tmp_path / "timings.json"))
+    history.record("dataset", "suite", 2.0, 100)
+
+    assert history.predict("dataset", "suite", 50) == pytest.approx(1.0)
+    assert history.predict("dataset", "other") is None
+
+
+def test_cheaper_suites_run_first_within_a_priority(tmp_path):
+    history = TimingHistory(str(tmp_path / "timings.json"))
+    history.record("dataset", "slow", 10.0, None)
+    history.record("dataset", "fast", 1.0, None)
+    history.record("dataset", "critical", 100.0, None)
+
+    ordered = order_suites_by_cost(
+        history, "dataset", ["unknown", "slow", "fast", "critical"], {"critical": 0}
+    )
+
+    assert ordered == ["critical", "fast", "slow", "unknown"]
+
+
+def test_longest_datasets_are_handed_out_first(tmp_path):
+    history = TimingHistory(str(tmp_path / "timings.json"))
+    history.record("short", "suite", 1.0, None)
+    history.record("long", "suite", 10.0, None)
+
+    ordered = order_datasets_longest_first(
+        history, {"short": ["suite"], "long": ["suite"], "new": ["suite"]}
+    )
+
+    assert ordered == ["new", "long", "short"]
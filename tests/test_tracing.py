@@ -0,0 +1,139 @@
+import json
+import os
+import threading
+
+import pandas as pd
+import pytest
+from great_expectations.core import ExpectationConfiguration
+from kedro.io import DataCatalog, MemoryDataSet
+from kedro.pipeline import Pipeline, node
+
+from kedro_great.exceptions import SuiteValidationFailure
+from kedro_great.kedro_great import get_kedro_great_directory, get_timings_path
+from kedro_great.tracing import Tracer, describe_frame
+
+
+def _read_trace(path):
+    with open(path) as f:
+        return json.load(f)["traceEvents"]
+
+
+def test_spans_are_written_as_chrome_trace_events(tmp_path):
+    tracer = Tracer()
+    with tracer.span("outer", dataset="orders"):
+        with tracer.span("inner") as span_args:
+            span_args["rows"] = 3
+
+    path = tracer.write(str(tmp_path / "traces" / "run.json"))
+
+    events = _read_trace(path)
+    assert [event["name"] for event in events] == ["inner", "outer"]
+    inner, outer = events
+    assert inner["args"] == {"rows": 3}
+    assert outer["args"] == {"dataset": "orders"}
+    assert outer["ts"] <= inner["ts"]
+    assert inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"]
+    assert {event["tid"] for event in events} == {threading.get_ident()}
+    # Written events are flushed, so the next run starts empty
+    assert tracer.write(str(tmp_path / "traces" / "next.json")) is None
+
+
+def test_spans_are_recorded_on_errors(tmp_path):
+    tracer = Tracer()
+    with pytest.raises(ValueError):
+        with tracer.span("failing"):
+            raise ValueError()
+
+    events = _read_trace(tracer.write(str(tmp_path / "run.json")))
+    assert [event["name"] for event in events] == ["failing"]
+
+
+def test_disabled_tracer_records_nothing(tmp_path):
+    tracer = Tracer(enabled=False)
+    with tracer.span("ignored") as span_args:
+        span_args["rows"] = 1
+    tracer.add_span("ignored", 0, 1)
+
+    assert tracer.write(str(tmp_path / "run.json")) is None
+    assert not os.path.exists(tmp_path / "run.json")
+
+
+def test_describe_frame():
+    df = pd.DataFrame({"id": range(10)})
+
+    assert describe_frame(df) == {
+        "rows": 10,
+        "bytes": int(df.memory_usage(index=True, deep=False).sum()),
+    }
+    assert describe_frame(None) == {}
+
+
+def test_hook_writes_the_trace_after_the_run(orders_hook):
+    kedro_great = orders_hook(trace=True, run_after_node=True)
+    catalog = DataCatalog({"orders": MemoryDataSet(pd.DataFrame({"id": [1, 2]}))})
+    pipeline = Pipeline([node(lambda: pd.DataFrame({"id": [1, 2]}), None, "orders", name="make")])
+
+    kedro_great.before_node_run(pipeline.nodes[0], catalog, {}, "run")
+    kedro_great.after_node_run(
+        pipeline.nodes[0], catalog, {"orders": catalog.load("orders")}, "run"
+    )
+    kedro_great.after_pipeline_run({"run_id": "run"}, pipeline, catalog)
+
+    trace_path = get_kedro_great_directory(
+        kedro_great.expectation_context.root_directory, "traces", "run.json"
+    )
+    names = {event["name"] for event in _read_trace(trace_path)}
+    assert {"before_node_run", "node", "after_node_run", "_run_validation"} <= names
+
+
+def test_trace_and_timings_are_flushed_when_the_pipeline_fails(orders_hook, ge_context):
+    suite = ge_context.get_expectation_suite("orders.basic")
+    suite.add_expectation(
+        ExpectationConfiguration(
+            "expect_column_max_to_be_between", {"column": "id", "max_value": 1}
+        )
+    )
+    ge_context.save_expectation_suite(suite)
+    kedro_great = orders_hook(
+        trace=True, fail_fast=True, run_after_node=True, adaptive_scheduling=True
+    )
+    pipeline = Pipeline([node(lambda: pd.DataFrame({"id": [1, 2]}), None, "orders", name="make")])
+    catalog = DataCatalog({"orders": MemoryDataSet()})
+    run_params = {"run_id": "failed"}
+
+    with pytest.raises(SuiteValidationFailure) as error:
+        kedro_great.after_node_run(
+            pipeline.nodes[0],
+            catalog,
+            {"orders": pd.DataFrame({"id": [1, 2]})},
+            run_params["run_id"],
+        )
+    kedro_great.on_pipeline_error(error.value, run_params, pipeline, catalog)
+
+    root_directory = kedro_great.expectation_context.root_directory
+    events = _read_trace(
+        get_kedro_great_directory(root_directory, "traces", "failed.json")
+    )
+    assert "_run_validation" in {event["name"] for event in events}
+    assert os.path.exists(get_timings_path(kedro_great.expectation_context))
+
+
+def test_failed_nodes_are_traced(orders_hook):
+    kedro_great = orders_hook(trace=True)
+    pipeline = Pipeline([node(lambda: 1 / 0, None, "result", name="divide")])
+
+    kedro_great.before_node_run(pipeline.nodes[0], DataCatalog(), {}, "run")
+    kedro_great.on_node_error(
+        ZeroDivisionError(), pipeline.nodes[0], DataCatalog(), {}, False, "run"
+    )
+    kedro_great.on_pipeline_error(ZeroDivisionError(), {"run_id": "run"}, pipeline, None)
+
+    events = _read_trace(
+        get_kedro_great_directory(
+            kedro_great.expectation_context.root_directory, "traces", "run.json"
+        )
+    )
+    node_events = [event for event in events if event["name"] == "node"]
+    assert [event["args"] for event in node_events] == [
+        {"node": "divide", "error": "ZeroDivisionError"}
+    ]
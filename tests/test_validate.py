@@ -0,0 +1,158 @@
+import json
+from xml.etree import ElementTree
+
+import pytest
+from click.testing import CliRunner
+from great_expectations.core import ExpectationConfiguration
+from kedro.extras.datasets.pandas import CSVDataSet
+from kedro.io import DataCatalog
+
+from kedro_great.cli import validate as validate_cli
+from kedro_great.cli.validate import select_datasets, validate, write_junit_report
+
+
+class FakeKedroContext:
+    def __init__(self, catalog, hooks):
+        self.catalog = catalog
+        self.hooks = hooks
+
+
+@pytest.fixture
+def orders_csv(tmp_path):
+    path = tmp_path / "orders.csv"
+    path.write_text("id,name\n1,a\n2,b\n")
+    return str(path)
+
+
+@pytest.fixture
+def worker(orders_csv):
+    def worker(kedro_great, dataset_path=orders_csv):
+        validate_cli._worker_state.update(
+            catalog=DataCatalog({"orders": CSVDataSet(dataset_path)}),
+            kedro_great=kedro_great,
+        )
+        return validate_cli._validate_dataset
+
+    yield worker
+    validate_cli._worker_state.clear()
+
+
+def test_datasets_are_selected_by_pattern(orders_csv):
+    catalog = DataCatalog(
+        {
+            name: CSVDataSet(orders_csv)
+            for name in ("raw_orders", "raw_customers", "model_input")
+        }
+    )
+    catalog.add_feed_dict({"params:alpha": 1})
+
+    kedro_context = FakeKedroContext(catalog, [])
+
+    assert select_datasets(kedro_context, [], []) == [
+        "model_input",
+        "raw_customers",
+        "raw_orders",
+    ]
+    assert select_datasets(kedro_context, ["raw_*"], []) == ["raw_customers", "raw_orders"]
+
+
+def test_suites_are_validated(worker, orders_hook):
+    report = worker(orders_hook())("orders", "run", False)
+
+    assert report["error"] is None
+    assert report["suites"] == {"orders.basic": True, "orders.warning": True}
+    assert report["skipped"] == {}
+
+
+def test_budget_skipped_suites_are_reported(worker, orders_hook):
+    kedro_great = orders_hook(validation_budgets={"orders.warning": {"max_seconds": 0}})
+
+    report = worker(kedro_great)("orders", "run", False)
+
+    assert report["suites"] == {"orders.basic": True}
+    assert report["skipped"] == {"orders.warning": "time budget of 0s exhausted"}
+    # Captured per dataset, so nothing accumulates in the worker's hook
+    assert kedro_great.run_report()["skipped"] == []
+
+
+def test_schema_preflight_applies(worker, orders_hook, ge_context, tmp_path, monkeypatch):
+    for suite_name in ("orders.basic", "orders.warning"):
+        suite = ge_context.get_expectation_suite(suite_name)
+        suite.add_expectation(
+            ExpectationConfiguration("expect_column_to_exist", {"column": "id"})
+        )
+        ge_context.save_expectation_suite(suite)
+    path = tmp_path / "renamed.csv"
+    path.write_text("order_id,name\n1,a\n")
+    kedro_great = orders_hook(schema_preflight=True)
+
+    def load_dataset(dataset):
+        raise AssertionError("The pre-flight did not stop the validation")
+
+    monkeypatch.setattr(kedro_great, "load_dataset", load_dataset)
+
+    report = worker(kedro_great, str(path))("orders", "run", False)
+
+    assert report["error"] is None
+    assert report["suites"] == {"orders.basic": False, "orders.warning": False}
+
+
+def test_junit_report(tmp_path):
+    path = str(tmp_path / "validation.xml")
+    write_junit_report(
+        [
+            {
+                "dataset": "orders",
+                "suites": {"orders.basic": True, "orders.warning": False},
+                "skipped": {"orders.slow": "time budget of 1s exhausted"},
+                "error": None,
+                "seconds": 1.5,
+            },
+            {
+                "dataset": "customers",
+                "suites": {},
+                "skipped": {},
+                "error": "FileNotFoundError: customers.csv",
+                "seconds": 0.0,
+            },
+        ],
+        path,
+    )
+
+    orders, customers = ElementTree.parse(path).getroot()
+    assert orders.attrib["tests"] == "3"
+    assert orders.attrib["failures"] == "1"
+    assert orders.attrib["skipped"] == "1"
+    testcases = {testcase.attrib["name"]: testcase for testcase in orders}
+    assert list(testcases["orders.basic"]) == []
+    assert testcases["orders.warning"][0].tag == "failure"
+    skipped = testcases["orders.slow"][0]
+    assert skipped.tag == "skipped"
+    assert skipped.attrib["message"] == "time budget of 1s exhausted"
+    assert customers.attrib["errors"] == "1"
+    assert customers[0][0].tag == "error"
+
+
+def test_validate_command(orders_csv, orders_hook, tmp_path, monkeypatch):
+    kedro_great = orders_hook(validation_budgets={"orders.warning": {"max_seconds": 0}})
+    kedro_context = FakeKedroContext(
+        DataCatalog({"orders": CSVDataSet(orders_csv)}), [kedro_great]
+    )
+    # Forked workers inherit the patched loader
+    monkeypatch.setattr(validate_cli, "load_context", lambda *args, **kw: kedro_context)
+    json_path = str(tmp_path / "validation.json")
+    junit_path = str(tmp_path / "validation.xml")
+
+    result = CliRunner().invoke(
+        validate, ["--workers", "1", "--json", json_path, "--junit", junit_path]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "orders: orders.basic passed" in result.output
+    assert "orders: orders.warning skipped, time budget of 0s exhausted" in result.output
+    with open(json_path) as f:
+        [report] = json.load(f)["datasets"]
+    assert report["suites"] == {"orders.basic": True}
+    assert report["skipped"] == {"orders.warning": "time budget of 0s exhausted"}
+    [testsuite] = ElementTree.parse(junit_path).getroot()
+    assert testsuite.attrib["skipped"] == "1"